@@ -0,0 +1,206 @@
+"""
+Simulation Microbenchmarks
+Times the driving hot paths in isolation and compares runs against stored baselines
+
+Usage (from the game directory):
+    python -m benchmarks.micro run [--save FILE] [--only NAME]
+    python -m benchmarks.micro compare benchmarks/baselines/micro.json [CURRENT.json] [--threshold 0.10]
+
+benchmarks/baselines/micro.json is the reference run, with the machine it was
+taken on under "meta". Baselines are only comparable on the same
+machine, so save a local one first when comparing elsewhere. compare exits
+with status 1 when any benchmark is slower than the baseline by more than the
+threshold.
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+import pygame
+
+TARGET_SECONDS = 0.2  # Minimum time per repeat when auto-ranging the loop count
+REPEATS = 5
+
+def bench_truck_update():
+    """Truck.update with throttle and steering held"""
+    from entities.truck import Truck
+    from sim.controls import Controls, encode_inputs
+    truck = Truck(100, 300)
+    controls = Controls(encode_inputs(('up', 'right')))
+    def run():
+        truck.x, truck.y = 400, 300
+        truck.update(controls, 1 / 60)
+    return run
+
+def bench_truck_rotated_rect():
+    """Truck._get_rotated_rect for one trailer-sized box"""
+    from entities.truck import Truck
+    truck = Truck(100, 300)
+    return lambda: truck._get_rotated_rect(truck.x, truck.y, 50, 15, 33.0)
+
+def bench_environment_is_on_road():
+    """Environment.is_on_road over 64 random points"""
+    from systems.driving import Environment
+    environment = Environment(800, 600)
+    points = [(random.uniform(0, 800), random.uniform(0, 600)) for _ in range(64)]
+    def run():
+        for x, y in points:
+            environment.is_on_road(x, y)
+    return run
+
+def bench_collision_check():
+    """CollisionSystem.check_truck_collisions on the main road"""
+    from systems.driving import Environment, CollisionSystem
+    from entities.truck import Truck
+    collision_system = CollisionSystem(Environment(800, 600))
+    truck = Truck(300, 300)
+    player_data = {'cash': 10000, 'fuel': 100.0}
+    return lambda: collision_system.check_truck_collisions(truck, player_data)
+
+def bench_fuel_consumption():
+    """FuelSystem.update_fuel_consumption while moving"""
+    from core.game_state import GameState
+    from entities.truck import Truck
+    from systems.fuel import FuelSystem
+    fuel_system = FuelSystem()
+    game_state = GameState()
+    truck = Truck(100, 300)
+    truck.speed = 3.0
+    def run():
+        game_state.fuel = 100.0
+        fuel_system.update_fuel_consumption(game_state, truck)
+    return run
+
+def bench_contract_init():
+    """Contract.__init__ for one lane"""
+    from data.loader import load_cities
+    from entities.contract import Contract
+    cities = load_cities()
+    return lambda: Contract(cities[0], cities[1], 'Oversize', 6)
+
+def bench_generate_contracts():
+    """generate_contracts for a three-card board"""
+    from data.loader import load_cities, generate_contracts
+    cities = load_cities()
+    return lambda: generate_contracts(cities)
+
+BENCHMARKS = {
+    'truck_update': bench_truck_update,
+    'truck_rotated_rect': bench_truck_rotated_rect,
+    'environment_is_on_road_x64': bench_environment_is_on_road,
+    'collision_check': bench_collision_check,
+    'fuel_consumption': bench_fuel_consumption,
+    'contract_init': bench_contract_init,
+    'generate_contracts': bench_generate_contracts
+}
+
+def time_callable(func, target_seconds=TARGET_SECONDS, repeats=REPEATS):
+    """Time a callable; returns per-call nanoseconds for each repeat"""
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    elapsed = timer.timeit(loops)
+    if elapsed < target_seconds:
+        loops = max(loops, int(loops * target_seconds / max(elapsed, 1e-9)))
+    return [t / loops * 1e9 for t in timer.repeat(repeat=repeats, number=loops)], loops
+
+def run_benchmarks(names=None):
+    """Run benchmarks and return a results document"""
+    random.seed(0)
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        per_call, loops = time_callable(factory())
+        results[name] = {
+            'min_ns': min(per_call),
+            'median_ns': statistics.median(per_call),
+            'loops': loops
+        }
+        print(f"{name:32s} {min(per_call):12.1f} ns  (median {statistics.median(per_call):.1f} ns)")
+    return {
+        'meta': environment_info(),
+        'results': results
+    }
+
+def environment_info():
+    """Describe the machine a run was taken on"""
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count()
+    }
+
+def save_results(results, path):
+    """Write a results document as JSON"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+def compare_results(baseline, current, threshold, metric='min_ns'):
+    """Print a comparison table; returns the names that regressed past the threshold"""
+    regressions = []
+    for name, entry in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            print(f"{name:32s} {entry[metric]:12.1f}  (new)")
+            continue
+        ratio = entry[metric] / base[metric]
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        print(f"{name:32s} {base[metric]:12.1f} -> {entry[metric]:12.1f}  {ratio:6.2f}x  {status}")
+    return regressions
+
+def load_results(path):
+    """Read a results document"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Simulation microbenchmarks")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="run the benchmarks")
+    run_parser.add_argument('--save', help="write results to this JSON file")
+    run_parser.add_argument('--only', action='append', help="run only this benchmark (repeatable)")
+
+    compare_parser = commands.add_parser('compare', help="compare two result files")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current', nargs='?', help="results file (default: run now)")
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="allowed slowdown as a fraction (default 0.10)")
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        results = run_benchmarks(args.only)
+        if args.save:
+            save_results(results, args.save)
+        return 0
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current) if args.current else run_benchmarks()
+    regressions = compare_results(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
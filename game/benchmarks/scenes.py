@@ -0,0 +1,275 @@
+"""
+Scene Frame-Time Benchmarks
+Renders each real scene offscreen for a scripted run and records frame times and pixel checksums
+
+Usage (from the game directory):
+    python -m benchmarks.scenes run [--frames 300] [--save FILE] [--only NAME]
+    python -m benchmarks.scenes compare BASELINE.json [CURRENT.json] [--threshold 0.10]
+
+Every scene is driven by a fixed script with a frame-counting clock, so the
+checksum only changes when the rendered pixels do. A caching optimization can
+prove it is pixel-identical by matching the checksums of the slow path.
+"""
+import os
+import tempfile
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ['HH_SAVE_DIR'] = tempfile.mkdtemp(prefix='hh-bench-')  # Never load the player's save
+
+import argparse
+import hashlib
+import random
+import statistics
+import sys
+import time
+import pygame
+from benchmarks.micro import environment_info, save_results, load_results
+
+WARMUP_FRAMES = 30
+
+def scripted_keys(frame):
+    """Throttle held, weaving left and right every 40 frames"""
+    from systems.replay import KeyState, INPUT_BITS
+    mask = INPUT_BITS['up']
+    phase = (frame // 40) % 3
+    if phase == 0:
+        mask |= INPUT_BITS['right']
+    elif phase == 2:
+        mask |= INPUT_BITS['left']
+    return KeyState(mask)
+
+class FrameClock:
+    """Replaces pygame.time.get_ticks with a clock that advances one frame per tick()"""
+
+    def __init__(self, fps=60):
+        self.frame_ms = 1000.0 / fps
+        self.now_ms = 0.0
+        self._original = None
+
+    def __enter__(self):
+        self._original = pygame.time.get_ticks
+        pygame.time.get_ticks = lambda: int(self.now_ms)
+        return self
+
+    def __exit__(self, *exc):
+        pygame.time.get_ticks = self._original
+
+    def tick(self):
+        self.now_ms += self.frame_ms
+
+def _modular_game():
+    """Build main_modular.Game with a fixed contract board"""
+    import main_modular
+    random.seed(0)
+    game = main_modular.Game()
+    # Quote every card up front so the board renders the same on every run
+    for contract in game.game_state.available_contracts:
+        game.contract_scene.quote_engine.quote(contract)
+    return game
+
+def scene_contracts():
+    """main_modular contract board"""
+    game = _modular_game()
+    def frame(i):
+        game.update(1 / 60)
+        game.render()
+    return game.screen, frame
+
+def scene_modular_driving():
+    """main_modular driving view"""
+    game = _modular_game()
+    game._start_mission(game.contract_scene._select_contract(game.game_state, 0))
+    def frame(i):
+        if game.mission.step(scripted_keys(i)):
+            # Keep driving the same view once a short mission ends
+            game._start_mission(game.contract_scene._select_contract(game.game_state, 0))
+        game.render()
+    return game.screen, frame
+
+def scene_results():
+    """main_modular results screen after a scripted delivery"""
+    game = _modular_game()
+    game._start_mission(game.contract_scene._select_contract(game.game_state, 0))
+    step = 0
+    while not game.mission.step(scripted_keys(step)) and step < 20000:
+        step += 1
+    def frame(i):
+        game.update(1 / 60)
+        game.render()
+    return game.screen, frame
+
+def _million_entry_ledger():
+    """Build a deterministic ledger of a million transactions over a year"""
+    import numpy as np
+    from systems.economy import CATEGORY_CODES, CARGO_CODES, Ledger
+    rng = np.random.default_rng(0)
+    count = 1_000_000
+    category = rng.choice([CATEGORY_CODES['payout'], CATEGORY_CODES['time_bonus'], CATEGORY_CODES['penalty'],
+                           CATEGORY_CODES['fuel']], size=count, p=[0.3, 0.2, 0.1, 0.4]).astype(np.uint8)
+    amount = np.where(category == CATEGORY_CODES['payout'], rng.integers(500, 5000, count),
+                      np.where(category == CATEGORY_CODES['time_bonus'], rng.integers(0, 800, count),
+                               np.where(category == CATEGORY_CODES['penalty'], -rng.integers(100, 2000, count),
+                                        -50)))
+    lanes = ['Dallas → Phoenix', 'Atlanta → Tampa', 'Phoenix → Dallas', 'Tampa → Atlanta']
+    return Ledger.from_columns({
+        'ledger.time': 1.7e9 + np.arange(count) * 31.5,
+        'ledger.category': category,
+        'ledger.amount': amount,
+        'ledger.cargo': rng.integers(1, len(CARGO_CODES) + 1, count).astype(np.uint8),
+        'ledger.lane': rng.integers(0, len(lanes), count).astype(np.int32),
+        'ledger.truck': np.zeros(count, dtype=np.int16),
+        'ledger.lanes': np.array([lane.encode('utf-8') for lane in lanes])
+    })
+
+def scene_analytics():
+    """main_modular finance charts over a million ledger entries"""
+    game = _modular_game()
+    game.game_state.ledger = _million_entry_ledger()
+    game.game_state.cash += game.game_state.ledger.total.profit
+    game.game_state.switch_scene("analytics")
+    def frame(i):
+        game.update(1 / 60)
+        game.render()
+    return game.screen, frame
+
+def _prototype_engine():
+    """Build the prototype GameEngine"""
+    from core.engine import GameEngine
+    random.seed(0)
+    return GameEngine()
+
+def scene_prototype_driving():
+    """prototype_main.DrivingScene"""
+    import prototype_main
+    engine = _prototype_engine()
+    scene = prototype_main.DrivingScene(engine)
+    def frame(i):
+        scene.update(1 / 60, scripted_keys(i))
+        scene.render()
+    return engine.screen, frame
+
+def scene_prototype_menu():
+    """prototype_main.MenuScene"""
+    import prototype_main
+    engine = _prototype_engine()
+    scene = prototype_main.MenuScene(engine)
+    def frame(i):
+        scene.update(1 / 60, scripted_keys(i))
+        scene.render()
+    return engine.screen, frame
+
+SCENES = {
+    'contracts': scene_contracts,
+    'modular_driving': scene_modular_driving,
+    'results': scene_results,
+    'analytics': scene_analytics,
+    'prototype_driving': scene_prototype_driving,
+    'prototype_menu': scene_prototype_menu
+}
+
+def surface_bytes(surface):
+    """Get the raw RGB pixels of a surface"""
+    if hasattr(pygame.image, 'tobytes'):
+        return pygame.image.tobytes(surface, 'RGB')
+    return pygame.image.tostring(surface, 'RGB')
+
+def run_scene(factory, frames):
+    """Run one scene; returns per-frame milliseconds and a checksum over every frame"""
+    digest = hashlib.blake2b(digest_size=16)
+    times = []
+    with FrameClock() as clock:
+        screen, frame = factory()
+        for i in range(WARMUP_FRAMES + frames):
+            start = time.perf_counter()
+            frame(i)
+            pygame.display.flip()
+            elapsed = time.perf_counter() - start
+            clock.tick()
+            if i >= WARMUP_FRAMES:
+                times.append(elapsed * 1000)
+            digest.update(surface_bytes(screen))
+    return times, digest.hexdigest()
+
+def summarize_times(times):
+    """Get frame-time percentiles in milliseconds"""
+    cuts = statistics.quantiles(times, n=100)
+    return {
+        'frames': len(times),
+        'mean_ms': statistics.fmean(times),
+        'p50_ms': cuts[49],
+        'p95_ms': cuts[94],
+        'p99_ms': cuts[98]
+    }
+
+def run_scenes(frames, names=None):
+    """Run scene benchmarks and return a results document"""
+    results = {}
+    for name, factory in SCENES.items():
+        if names and name not in names:
+            continue
+        times, checksum = run_scene(factory, frames)
+        entry = summarize_times(times)
+        entry['checksum'] = checksum
+        results[name] = entry
+        print(f"{name:20s} p50 {entry['p50_ms']:7.3f} ms  p95 {entry['p95_ms']:7.3f} ms  "
+              f"p99 {entry['p99_ms']:7.3f} ms  {checksum}")
+    return {
+        'meta': dict(environment_info(), frames=frames),
+        'results': results
+    }
+
+def compare_scenes(baseline, current, threshold):
+    """Print a comparison; returns (slower scenes, scenes whose pixels changed)"""
+    regressions = []
+    changed = []
+    for name, entry in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            print(f"{name:20s} (new)")
+            continue
+        ratio = entry['p95_ms'] / base['p95_ms']
+        status = "ok"
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = "faster"
+        pixels = "identical" if entry['checksum'] == base['checksum'] else "PIXELS CHANGED"
+        if entry['checksum'] != base['checksum']:
+            changed.append(name)
+        print(f"{name:20s} p95 {base['p95_ms']:7.3f} -> {entry['p95_ms']:7.3f} ms  {ratio:5.2f}x  {status:10s} {pixels}")
+    return regressions, changed
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Scene frame-time benchmarks")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="run the scene benchmarks")
+    run_parser.add_argument('--frames', type=int, default=300)
+    run_parser.add_argument('--save', help="write results to this JSON file")
+    run_parser.add_argument('--only', action='append', help="run only this scene (repeatable)")
+
+    compare_parser = commands.add_parser('compare', help="compare against a baseline")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current', nargs='?', help="results file (default: run now)")
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="allowed p95 slowdown as a fraction (default 0.10)")
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        results = run_scenes(args.frames, args.only)
+        if args.save:
+            save_results(results, args.save)
+        return 0
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current) if args.current else run_scenes(baseline['meta']['frames'])
+    regressions, changed = compare_scenes(baseline, current, args.threshold)
+    if changed:
+        print(f"Rendered pixels changed in: {', '.join(changed)}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+    return 1 if regressions or changed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
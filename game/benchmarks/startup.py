@@ -0,0 +1,116 @@
+"""
+Startup Benchmarks
+Measures cold import times and time to first frame in fresh interpreters
+
+Usage (from the game directory):
+    python -m benchmarks.startup [--runs 5] [--save FILE]
+
+Every measurement runs in a new Python process so module caches and pygame
+state never carry over. Importing a module must not open a window or create
+fonts; the check column reports any module that does.
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import json
+import subprocess
+import sys
+from benchmarks.micro import environment_info, save_results
+
+IMPORT_TARGETS = [
+    'core.engine',
+    'main_modular',
+    'prototype_main',
+    'contract_system',
+    'upgrade_system',
+    'game_prototype',
+    'systems.replay'
+]
+
+IMPORT_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import pygame
+pygame_done = time.perf_counter()
+import {module}
+end = time.perf_counter()
+print(json.dumps({{
+    'import_ms': (end - start) * 1000,
+    'pygame_ms': (pygame_done - start) * 1000,
+    'display_init': pygame.display.get_init(),
+    'font_init': pygame.font.get_init()
+}}))
+"""
+
+FIRST_FRAME_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import main_modular
+imported = time.perf_counter()
+game = main_modular.Game()
+built = time.perf_counter()
+game.update(1 / 60)
+game.render()
+main_modular.pygame.display.flip()
+end = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'init_ms': (built - imported) * 1000,
+    'first_frame_ms': (end - built) * 1000,
+    'total_ms': (end - start) * 1000
+}))
+"""
+
+def run_script(script):
+    """Run a measurement script in a fresh interpreter and return its JSON output"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.getcwd(), env.get('PYTHONPATH')]))
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def best_of(script, runs):
+    """Run a script several times and keep the fastest value of each field"""
+    samples = [run_script(script) for _ in range(runs)]
+    best = {}
+    for key, value in samples[0].items():
+        if isinstance(value, bool):
+            best[key] = any(sample[key] for sample in samples)
+        else:
+            best[key] = min(sample[key] for sample in samples)
+    return best
+
+def run_startup(runs):
+    """Measure every target and return a results document"""
+    results = {}
+    for module in IMPORT_TARGETS:
+        entry = best_of(IMPORT_SCRIPT.format(module=module), runs)
+        side_effects = entry['display_init'] or entry['font_init']
+        entry['check'] = "WINDOW/FONT WORK ON IMPORT" if side_effects else "ok"
+        results[f"import {module}"] = entry
+        print(f"import {module:20s} {entry['import_ms']:8.1f} ms  (pygame {entry['pygame_ms']:.1f} ms)  {entry['check']}")
+
+    entry = best_of(FIRST_FRAME_SCRIPT, runs)
+    results['first_frame'] = entry
+    print(f"first frame {'':15s} {entry['total_ms']:8.1f} ms  (import {entry['import_ms']:.1f}, "
+          f"init {entry['init_ms']:.1f}, frame {entry['first_frame_ms']:.1f})")
+    return {
+        'meta': dict(environment_info(), runs=runs),
+        'results': results
+    }
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Startup benchmarks")
+    parser.add_argument('--runs', type=int, default=5, help="fresh processes per measurement")
+    parser.add_argument('--save', help="write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_startup(args.runs)
+    if args.save:
+        save_results(results, args.save)
+    failures = [name for name, entry in results['results'].items() if entry.get('check', 'ok') != 'ok']
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,17 +5,25 @@ All systems integrated in one file for easy testing
 import pygame
 import sys
 import math
+from core.fonts import LazyFont
+from data.config import get_config
 
-pygame.init()
-screen = pygame.display.set_mode((800, 600))
-pygame.display.set_caption("Heavy Haul Tycoon - Prototype v0.1")
-clock = pygame.time.Clock()
+screen = None
+clock = None
+
+def init_display():
+    """Open the game window; called by the entry point rather than on import"""
+    global screen, clock
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    pygame.display.set_caption("Heavy Haul Tycoon - Prototype v0.1")
+    clock = pygame.time.Clock()
 
 # Fonts
-SMALL_FONT = pygame.font.SysFont(None, 20)
-FONT = pygame.font.SysFont(None, 24)
-LARGE_FONT = pygame.font.SysFont(None, 32)
-TITLE_FONT = pygame.font.SysFont(None, 48)
+SMALL_FONT = LazyFont(None, 20)
+FONT = LazyFont(None, 24)
+LARGE_FONT = LazyFont(None, 32)
+TITLE_FONT = LazyFont(None, 48)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -32,10 +40,7 @@ ROAD_GRAY = (80, 80, 80)
 GRASS_GREEN = (40, 60, 40)
 
 # Game constants
-TRUCK_MAX_SPEED = 4.0
 FUEL_DRAIN_RATE = 0.03
-FUEL_PRICE = 4.50
-BRIDGE_PENALTY = 5000
 
 class Truck:
     def __init__(self, x, y):
@@ -43,7 +48,7 @@ class Truck:
         self.y = y
         self.angle = 0
         self.speed = 0
-        self.max_speed = TRUCK_MAX_SPEED
+        self.max_speed = get_config().vehicle.max_speed
         self.acceleration = 0.15
         self.deceleration = 0.1
         self.turn_speed = 2.5
@@ -185,7 +190,7 @@ class Environment:
         pygame.draw.rect(screen, DARK_GRAY, self.fuel_station2, 2)
         
         # Fuel station signs
-        fuel_text = SMALL_FONT.render(f"${FUEL_PRICE:.2f}/gal", True, WHITE)
+        fuel_text = SMALL_FONT.render(f"${get_config().vehicle.fuel_price_per_gallon:.2f}/gal", True, WHITE)
         screen.blit(fuel_text, (self.fuel_station1.x, self.fuel_station1.y - 20))
         screen.blit(fuel_text, (self.fuel_station2.x, self.fuel_station2.y - 20))
         
@@ -275,6 +280,7 @@ def render_hud(speed, cash, fuel, time_remaining=None, distance_to_target=0):
         screen.blit(dist_text, (20, 145))
 
 def main_game():
+    init_display()
     # Game state
     truck = Truck(150, 300)
     environment = Environment()
@@ -312,7 +318,7 @@ def main_game():
                     station = environment.get_fuel_station_nearby(truck.get_rect())
                     if station and fuel < 100:
                         fuel_needed = 100 - fuel
-                        cost = fuel_needed * FUEL_PRICE
+                        cost = fuel_needed * get_config().vehicle.fuel_price_per_gallon
                         if cash >= cost:
                             cash -= int(cost)
                             fuel = 100.0
@@ -333,9 +339,9 @@ def main_game():
         # Bridge collision
         if environment.check_bridge_collision(truck.get_rect()):
             mission_active = False
-            cash -= BRIDGE_PENALTY
+            cash -= get_config().penalties.bridge_strike
             add_message("MISSION FAILED! Bridge Strike!", RED, 5.0)
-            add_message(f"Penalty: ${BRIDGE_PENALTY:,}", RED, 5.0)
+            add_message(f"Penalty: ${get_config().penalties.bridge_strike:,}", RED, 5.0)
             continue
         
         # Update truck
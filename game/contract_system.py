@@ -8,6 +8,8 @@ import math
 import json
 import random
 import os
+from core.fonts import LazyFont
+from data.config import get_config
 
 # Load cities data
 def load_cities():
@@ -23,16 +25,22 @@ def load_cities():
             {"name": "Phoenix", "x": 60, "y": 380}
         ]
 
-pygame.init()
-screen = pygame.display.set_mode((800, 600))
-pygame.display.set_caption("Heavy Haul Tycoon - Contract System")
-clock = pygame.time.Clock()
+screen = None
+clock = None
+
+def init_display():
+    """Open the game window; called by the entry point rather than on import"""
+    global screen, clock
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    pygame.display.set_caption("Heavy Haul Tycoon - Contract System")
+    clock = pygame.time.Clock()
 
 # Fonts
-SMALL_FONT = pygame.font.SysFont(None, 18)
-FONT = pygame.font.SysFont(None, 24)
-LARGE_FONT = pygame.font.SysFont(None, 32)
-TITLE_FONT = pygame.font.SysFont(None, 48)
+SMALL_FONT = LazyFont(None, 18)
+FONT = LazyFont(None, 24)
+LARGE_FONT = LazyFont(None, 32)
+TITLE_FONT = LazyFont(None, 48)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -46,19 +54,6 @@ GRAY = (128, 128, 128)
 DARK_GRAY = (60, 60, 60)
 LIGHT_GRAY = (200, 200, 200)
 
-# Game balance from your plan
-BASE_RATE_PER_MILE = 6.00
-WEIGHT_MULTIPLIERS = {
-    'Standard': 1.1,
-    'Oversize': 1.25,
-    'Superload': 1.5
-}
-OVERSIZE_BONUSES = {
-    'Standard': 0.0,
-    'Oversize': 0.20,
-    'Superload': 0.40
-}
-
 class Contract:
     def __init__(self, origin_city, dest_city, cargo_type, deadline_hours):
         self.origin = origin_city
@@ -72,9 +67,10 @@ class Contract:
         self.distance_miles = (dx + dy) / 10
         
         # Calculate payment using your revenue formula
-        self.base_payment = BASE_RATE_PER_MILE * self.distance_miles
-        self.weight_factor = WEIGHT_MULTIPLIERS[cargo_type] - 1  # Convert to bonus
-        self.oversize_factor = OVERSIZE_BONUSES[cargo_type]
+        economy = get_config().economy
+        self.base_payment = economy.base_rate_per_mile * self.distance_miles
+        self.weight_factor = economy.weight_multipliers.by_cargo_type()[cargo_type] - 1  # Convert to bonus
+        self.oversize_factor = economy.oversize_bonuses.by_cargo_type()[cargo_type]
         
         # Deadline multiplier (tighter deadlines = more money)
         if deadline_hours <= 4:
@@ -206,6 +202,7 @@ class ContractGenerator:
 
 def main_contract_screen():
     """Contract selection screen"""
+    init_display()
     cities = load_cities()
     generator = ContractGenerator(cities)
     cash = 10000
@@ -292,7 +289,7 @@ def main_contract_screen():
         info_y = 500
         info_texts = [
             f"Cities loaded: {len(cities)}",
-            f"Revenue formula: Base Rate (${BASE_RATE_PER_MILE}/mi) × Distance × Weight × Oversize × Deadline",
+            f"Revenue formula: Base Rate (${get_config().economy.base_rate_per_mile}/mi) × Distance × Weight × Oversize × Deadline",
             "Contract types: Standard (50%), Oversize (30%), Superload (20%)"
         ]
         
@@ -0,0 +1,163 @@
+"""
+Profile Capture
+Wraps the next N main-loop frames in cProfile and dumps .prof and collapsed-stack files
+
+Press F4 in game, or set HH_CPROFILE=<frames> to capture from the first frame
+of a headless run. Files go to HH_PROFILE_DIR (default "profiles") and are
+named <timestamp>_<scene>_<build>. The .collapsed file is "a;b;c <us>" per
+line, ready for flamegraph.pl, speedscope or inferno. A capture still running
+when the game quits is written with the frames it has. Progress and the last
+written file are shown by the profiler overlay (see status).
+"""
+import cProfile
+import os
+import pstats
+import subprocess
+import time
+import pygame
+
+CAPTURE_KEY = pygame.K_F4
+DEFAULT_FRAMES = 300
+MAX_STACK_DEPTH = 64
+
+def build_tag():
+    """Identify the running build: HH_BUILD, else the git revision, else 'dev'"""
+    tag = os.environ.get('HH_BUILD')
+    if tag:
+        return tag
+    try:
+        result = subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True,
+                                text=True, timeout=2, cwd=os.path.dirname(os.path.abspath(__file__)))
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return 'dev'
+
+def _frame_label(func):
+    """Format a pstats function key as a flamegraph frame name"""
+    filename, line, name = func
+    if filename == '~':
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    return label.replace(';', ',')
+
+def collapse_stats(stats):
+    """Rebuild approximate call stacks from a pstats.Stats call graph
+
+    cProfile only records caller -> callee edges, so each function's time is
+    split across its callers in proportion to the time spent under each edge.
+    Returns {stack string: microseconds}.
+    """
+    raw = stats.stats
+    children = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((func, edge[3]))
+    roots = [func for func, entry in raw.items() if not entry[4]]
+
+    collapsed = {}
+    def walk(func, share, path, labels):
+        _, _, self_time, total_time, _ = raw[func]
+        labels = labels + [_frame_label(func)]
+        micros = int(self_time * share * 1e6)
+        if micros:
+            key = ';'.join(labels)
+            collapsed[key] = collapsed.get(key, 0) + micros
+        if len(labels) >= MAX_STACK_DEPTH:
+            return
+        for child, edge_time in children.get(func, ()):
+            child_total = raw[child][3]
+            if child in path or not child_total:
+                continue
+            walk(child, share * edge_time / child_total, path | {child}, labels)
+
+    for root in roots:
+        walk(root, 1.0, {root}, [])
+    return collapsed
+
+class ProfileCapture:
+    """Runs cProfile over a fixed number of main-loop frames on request"""
+
+    def __init__(self, output_dir=None, frames=DEFAULT_FRAMES):
+        self.output_dir = output_dir or os.environ.get('HH_PROFILE_DIR', 'profiles')
+        self.frames = frames
+        self.profile = None
+        self.pending = 0
+        self.captured = 0
+        self.last_paths = None
+        self.status = None  # Capture progress or result, shown by ProfilerOverlay
+        env_frames = os.environ.get('HH_CPROFILE')
+        if env_frames:
+            self.request(int(env_frames))
+
+    @property
+    def active(self):
+        """Check whether frames are being captured"""
+        return self.profile is not None
+
+    def request(self, frames=None):
+        """Capture the next N frames, starting with the next begin_frame()"""
+        if not self.active:
+            self.pending = frames or self.frames
+
+    def handle_event(self, event):
+        """Start a capture on the F4 key; returns True if handled"""
+        if event.type == pygame.KEYDOWN and event.key == CAPTURE_KEY:
+            self.request()
+            return True
+        return False
+
+    def begin_frame(self):
+        """Start profiling if a capture was requested"""
+        if self.pending and not self.active:
+            self.profile = cProfile.Profile()
+            self.captured = 0
+            self.status = f"cProfile: capturing {self.pending} frames"
+            self.profile.enable()
+
+    def end_frame(self, scene):
+        """Count a profiled frame and write the files once enough are captured"""
+        if not self.active:
+            return None
+        self.captured += 1
+        if self.captured < self.pending:
+            return None
+        return self._finish(scene)
+
+    def close(self, scene):
+        """Write a capture cut short by shutdown with the frames it has"""
+        if not self.active:
+            return None
+        return self._finish(scene)
+
+    def _finish(self, scene):
+        """Stop profiling and write the files"""
+        self.profile.disable()
+        profile = self.profile
+        self.profile = None
+        partial = self.captured < self.pending
+        self.pending = 0
+        try:
+            self.last_paths = self.dump(profile, scene)
+        except OSError as e:
+            self.status = f"cProfile: could not write capture ({e})"
+            return None
+        self.status = (f"cProfile: {self.captured} frames{' (partial)' if partial else ''} -> "
+                       f"{os.path.basename(self.last_paths[0])}")
+        return self.last_paths
+
+    def dump(self, profile, scene):
+        """Write a .prof file and its collapsed stacks; returns both paths"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d_%H%M%S')}_{scene}_{build_tag()}".replace(os.sep, '-')
+        prof_path = os.path.join(self.output_dir, name + '.prof')
+        collapsed_path = os.path.join(self.output_dir, name + '.collapsed')
+
+        profile.dump_stats(prof_path)
+        collapsed = collapse_stats(pstats.Stats(profile))
+        with open(collapsed_path, 'w') as f:
+            for stack, micros in sorted(collapsed.items()):
+                f.write(f"{stack} {micros}\n")
+        return prof_path, collapsed_path
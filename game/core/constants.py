@@ -1,12 +1,13 @@
 """
 Game Constants and Configuration
-"""
-import pygame
 
-# Screen dimensions
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-FPS = 60
+Settings from data/config.yml are read on first access (see sim.rules), so
+they are not part of `from core.constants import *`; use constants.NAME.
+"""
+from core.fonts import LazyFont
+from data.config import lazy_settings
+from sim import rules
+from sim.rules import FUEL_DRAIN_RATE, REFUEL_COST
 
 # Colors
 BLACK = (0, 0, 0)
@@ -23,26 +24,26 @@ ROAD_GRAY = (80, 80, 80)
 GRASS_GREEN = (40, 60, 40)
 
 # Game balance constants
-BASE_RATE_PER_MILE = 6.00
-FUEL_DRAIN_RATE = 0.008
-BRIDGE_PENALTY = 5000
-REFUEL_COST = 50
-STARTING_CASH = 10000
-STARTING_FUEL = 100.0
+DEADHEAD_COST_PER_MILE = 1.50  # Running an empty truck to a pickup
+HAUL_SPEED_MPH = 15  # Average road speed used for route and deadline planning
 
-# Truck physics constants
-class TruckConfig:
-    MAX_SPEED = 4.0
-    ACCELERATION = 0.15
-    DECELERATION = 0.1
-    TURN_SPEED = 2.5
-    REVERSE_SPEED_MULTIPLIER = 0.5
+__getattr__ = lazy_settings(__name__, {
+    'CONFIG': lambda config: config,
+    'SCREEN_WIDTH': lambda config: config.ui.screen_width,
+    'SCREEN_HEIGHT': lambda config: config.ui.screen_height,
+    'BASE_RATE_PER_MILE': lambda config: config.economy.base_rate_per_mile,
+    'FPS': lambda config: rules.FPS,
+    'BRIDGE_PENALTY': lambda config: rules.BRIDGE_PENALTY,
+    'STARTING_CASH': lambda config: rules.STARTING_CASH,
+    'STARTING_FUEL': lambda config: rules.STARTING_FUEL,
+    'TruckConfig': lambda config: rules.TruckConfig
+})
 
-# Font initialization (call after pygame.init())
+# Fonts (created on first render, so this needs no pygame.init())
 def init_fonts():
     return {
-        'small': pygame.font.SysFont(None, 18),
-        'normal': pygame.font.SysFont(None, 24),
-        'large': pygame.font.SysFont(None, 32),
-        'title': pygame.font.SysFont(None, 48)
+        'small': LazyFont(None, 18),
+        'normal': LazyFont(None, 24),
+        'large': LazyFont(None, 32),
+        'title': LazyFont(None, 48)
     }
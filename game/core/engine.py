@@ -5,6 +5,12 @@ Handles scene management, game states, and main loop
 import pygame
 import sys
 from enum import Enum
+from core.profiler import FrameProfiler, ProfilerOverlay
+from core.capture import ProfileCapture
+from core.gc_control import GCController
+from core.fonts import LazyFont
+from data.config import lazy_settings
+from systems.economy import Ledger
 
 class GameState(Enum):
     MENU = "menu"
@@ -36,7 +42,7 @@ class GameEngine:
     """Main game engine with scene management"""
     
     def __init__(self, width=800, height=600, title="Heavy Haul Tycoon"):
-        pygame.init()
+        pygame.display.init()  # Other subsystems start on first use
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption(title)
         self.clock = pygame.time.Clock()
@@ -58,13 +64,14 @@ class GameEngine:
             },
             'current_contract': None
         }
+        self.ledger = Ledger()  # Every change to player_data['cash'], with running profit totals
         
-        # Fonts
+        # Fonts (created on first render)
         self.fonts = {
-            'small': pygame.font.SysFont(None, 20),
-            'medium': pygame.font.SysFont(None, 24),
-            'large': pygame.font.SysFont(None, 32),
-            'title': pygame.font.SysFont(None, 48)
+            'small': LazyFont(None, 20),
+            'medium': LazyFont(None, 24),
+            'large': LazyFont(None, 32),
+            'title': LazyFont(None, 48)
         }
         
         # Colors
@@ -82,6 +89,12 @@ class GameEngine:
             'road_gray': (80, 80, 80),
             'grass_green': (40, 60, 40)
         }
+        
+        # Frame profiler (F3 or HH_PROFILE=1) and cProfile capture (F4 or HH_CPROFILE=<frames>)
+        self.profiler = FrameProfiler()
+        self.capture = ProfileCapture()
+        self.gc_control = GCController()  # HH_GC=default leaves the collector alone
+        self.profiler_overlay = ProfilerOverlay(self.profiler, self.fonts['small'], capture=self.capture)
     
     def add_scene(self, name, scene):
         """Add a scene to the engine"""
@@ -108,6 +121,8 @@ class GameEngine:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif self.profiler_overlay.handle_event(event) or self.capture.handle_event(event):
+                continue
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     # ESC key behavior depends on current state
@@ -131,51 +146,69 @@ class GameEngine:
         """Render current scene"""
         if self.current_scene:
             self.current_scene.render()
+        self.profiler_overlay.render(self.screen)
         
-        pygame.display.flip()
+        with self.profiler.scope('present'):
+            pygame.display.flip()
     
     def run(self):
         """Main game loop"""
+        self.gc_control.after_load()
         while self.running:
             dt = self.clock.tick(60) / 1000.0  # 60 FPS, delta time in seconds
             
-            self.handle_events()
-            self.update(dt)
-            self.render()
+            self.gc_control.begin_frame(self.game_state.value)
+            self.capture.begin_frame()
+            with self.profiler.scope('events'):
+                self.handle_events()
+            with self.profiler.scope('update'):
+                self.update(dt)
+            with self.profiler.scope('render'):
+                self.render()
+            self.profiler.end_frame()
+            self.capture.end_frame(self.game_state.value)
+            self.gc_control.end_frame()
         
+        self.capture.close(self.game_state.value)
+        self.gc_control.shutdown()
         pygame.quit()
         sys.exit()
 
-# Game configuration constants
-class Config:
-    # Screen dimensions
-    SCREEN_WIDTH = 800
-    SCREEN_HEIGHT = 600
-    
-    # Truck physics
-    TRUCK_MAX_SPEED = 4.0
-    TRUCK_ACCELERATION = 0.15
-    TRUCK_DECELERATION = 0.1
-    TRUCK_TURN_SPEED = 2.5
-    
-    # Fuel system
-    FUEL_CAPACITY = 100.0
-    FUEL_DRAIN_RATE = 0.03
-    FUEL_PRICE_PER_GALLON = 4.50
-    
-    # Economy
-    BASE_RATE_PER_MILE = 6.00
-    COLLISION_PENALTY = 250
-    BRIDGE_STRIKE_PENALTY = 5000
-    TOWING_FEE = 750
-    
-    # Contract multipliers
-    WEIGHT_MULTIPLIERS = {
-        'standard': 1.1,
-        'oversize': 1.25,
-        'superload': 1.5
-    }
-    
-    DEADLINE_BONUS_RANGE = (1.0, 1.3)
-    EARLY_DELIVERY_BONUS = 0.20
-    LATE_DELIVERY_PENALTY_RANGE = (0.10, 0.50)
+def _engine_config(config):
+    """Build the game configuration constants from data/config.yml"""
+    class Config:
+        # Screen dimensions
+        SCREEN_WIDTH = config.ui.screen_width
+        SCREEN_HEIGHT = config.ui.screen_height
+    
+        # Truck physics
+        TRUCK_MAX_SPEED = config.vehicle.max_speed
+        TRUCK_ACCELERATION = config.vehicle.acceleration
+        TRUCK_DECELERATION = config.vehicle.deceleration
+        TRUCK_TURN_SPEED = config.vehicle.turn_speed
+    
+        # Fuel system
+        FUEL_CAPACITY = config.vehicle.fuel_capacity_base
+        FUEL_DRAIN_RATE = 0.03
+        FUEL_PRICE_PER_GALLON = config.vehicle.fuel_price_per_gallon
+    
+        # Economy
+        BASE_RATE_PER_MILE = config.economy.base_rate_per_mile
+        COLLISION_PENALTY = config.penalties.collision_damage
+        BRIDGE_STRIKE_PENALTY = config.penalties.bridge_strike
+        TOWING_FEE = config.penalties.towing_fee
+    
+        # Contract multipliers
+        WEIGHT_MULTIPLIERS = {
+            'standard': config.economy.weight_multipliers.standard,
+            'oversize': config.economy.weight_multipliers.oversize,
+            'superload': config.economy.weight_multipliers.superload
+        }
+    
+        DEADLINE_BONUS_RANGE = (config.economy.deadline_multipliers.relaxed, config.economy.deadline_multipliers.urgent)
+        EARLY_DELIVERY_BONUS = config.economy.early_delivery_bonus
+        LATE_DELIVERY_PENALTY_RANGE = (config.economy.late_delivery_penalty_min, config.economy.late_delivery_penalty_max)
+    return Config
+
+# Config is built on first access, so importing the engine reads no config
+__getattr__ = lazy_settings(__name__, {'Config': _engine_config})
@@ -0,0 +1,162 @@
+"""
+Fonts
+Process-wide font registry with cached font resolution, and deferred font creation
+
+pygame.font.SysFont scans the system font list the first time it is called,
+which is slow on phones. The registry creates each (name, size, bold, italic)
+font once. It remembers which font file a name resolved to in a small JSON
+cache, so later launches skip the scan. Fonts bundled in assets/fonts are
+preferred on Android, and there no system scan happens at all.
+"""
+import json
+import os
+import sys
+import pygame
+from core.paths import default_cache_dir, is_android, write_atomic
+
+BUNDLED_FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'fonts')
+FONT_EXTENSIONS = ('.ttf', '.otf')
+CACHE_FILENAME = 'fonts.json'
+CACHE_VERSION = 1
+
+def _simplename(name):
+    """Normalize a font name the way pygame.sysfont does"""
+    return ''.join(c.lower() for c in name if c.isalnum())
+
+def _capture_constructor(fontpath, size, bold, italic):
+    """SysFont constructor that reports what it resolved instead of loading it"""
+    return fontpath, bold, italic
+
+class FontRegistry:
+    """Creates each font once and remembers where named fonts live"""
+
+    def __init__(self, cache_dir=None, bundled_dir=BUNDLED_FONT_DIR, prefer_bundled=None):
+        self.cache_path = os.path.join(cache_dir or default_cache_dir(), CACHE_FILENAME)
+        self.bundled_dir = bundled_dir
+        self.prefer_bundled = is_android() if prefer_bundled is None else prefer_bundled
+        self.fonts = {}
+        self.resolved = None  # (name, bold, italic) key -> (path, fake bold, fake italic)
+        self._bundled = None
+
+    def get(self, name, size, bold=False, italic=False):
+        """Get a shared pygame Font"""
+        key = (name, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            path, fake_bold, fake_italic = self.resolve(name, bold, italic)
+            font = pygame.font.Font(path, size)
+            if fake_bold:
+                font.set_bold(True)
+            if fake_italic:
+                font.set_italic(True)
+            self.fonts[key] = font
+        return font
+
+    def resolve(self, name, bold=False, italic=False):
+        """Find the font file for a name; returns (path, fake bold, fake italic)"""
+        if not name:
+            # pygame's built-in font never needs a system scan
+            return None, bold, italic
+        if self.resolved is None:
+            self.resolved = self._load_cache()
+        key = f"{name}|{int(bold)}|{int(italic)}"
+        entry = self.resolved.get(key)
+        if entry is not None and (entry[0] is None or os.path.exists(entry[0])):
+            return tuple(entry)
+
+        entry = None
+        if self.prefer_bundled:
+            entry = self._find_bundled(name, bold, italic)
+            if entry is None:
+                entry = (None, bold, italic)  # Built-in font rather than a slow system scan
+        else:
+            entry = pygame.font.SysFont(name, 0, bold, italic, constructor=_capture_constructor)
+            if entry[0] is None:
+                entry = self._find_bundled(name, bold, italic) or entry
+        self.resolved[key] = list(entry)
+        self._save_cache()
+        return tuple(entry)
+
+    def _find_bundled(self, name, bold, italic):
+        """Look for a matching font in the bundled font directory"""
+        if self._bundled is None:
+            self._bundled = {}
+            if os.path.isdir(self.bundled_dir):
+                for filename in os.listdir(self.bundled_dir):
+                    stem, extension = os.path.splitext(filename)
+                    if extension.lower() in FONT_EXTENSIONS:
+                        self._bundled[_simplename(stem)] = os.path.join(self.bundled_dir, filename)
+        base = _simplename(name)
+        style = ('bold' if bold else '') + ('italic' if italic else '')
+        if style and base + style in self._bundled:
+            return self._bundled[base + style], False, False
+        if base in self._bundled:
+            return self._bundled[base], bold, italic
+        return None
+
+    def _signature(self):
+        """Identify the font environment a cache was built in"""
+        return f"{CACHE_VERSION}|{sys.platform}|{pygame.version.ver}|{self.prefer_bundled}"
+
+    def _load_cache(self):
+        """Read resolved font paths from disk"""
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('signature') != self._signature():
+            return {}
+        return data.get('fonts', {})
+
+    def _save_cache(self):
+        """Write resolved font paths to disk atomically"""
+        try:
+            data = json.dumps({'signature': self._signature(), 'fonts': self.resolved})
+            write_atomic(self.cache_path, data.encode())
+        except OSError:
+            pass  # The cache only saves time; running without it is fine
+
+_registry = None
+
+def get_registry():
+    """Get the process-wide font registry"""
+    global _registry
+    if _registry is None:
+        _registry = FontRegistry()
+    return _registry
+
+def get_font(name, size, bold=False, italic=False):
+    """Get a shared font from the process-wide registry"""
+    return get_registry().get(name, size, bold, italic)
+
+class LazyFont:
+    """Stands in for a pygame Font, fetching the real font from the registry on first use
+
+    Attributes looked up on the real font are cached on this object, so after
+    the first render() call there is no extra indirection.
+    """
+
+    def __init__(self, name, size, bold=False, italic=False):
+        self.name = name
+        self.size = size
+        self.bold = bold
+        self.italic = italic
+        self._font = None
+
+    @property
+    def font(self):
+        """Get the real pygame Font"""
+        if self._font is None:
+            self._font = get_font(self.name, self.size, self.bold, self.italic)
+        return self._font
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        value = getattr(self.font, attr)
+        if callable(value):
+            setattr(self, attr, value)
+        return value
@@ -1,15 +1,17 @@
 """
 Game State Management
 """
-from core.constants import STARTING_CASH, STARTING_FUEL
+from sim import rules
+from systems.economy import Ledger
 
 class GameState:
     """Manages the overall game state across scenes"""
     
     def __init__(self):
-        self.cash = STARTING_CASH
-        self.fuel = STARTING_FUEL
+        self.cash = rules.STARTING_CASH
+        self.fuel = rules.STARTING_FUEL
         self.current_contract = None
+        self.upgrade_levels = (1, 1, 1)  # engine, fuel tank, frame
         self.scene = "contracts"  # contracts, driving, results
         self.mission_start_time = 0
         self.mission_penalties = []
@@ -27,6 +29,9 @@ class GameState:
         
         # Generated content
         self.available_contracts = []
+        self.market_revision = 0  # Bumped when contracts on the board change in place (repricing)
+        self.completed_contracts = []  # Contract and mission result per finished mission
+        self.ledger = Ledger()  # Every change to cash, with running profit totals
     
     def reset_mission_state(self):
         """Reset mission-specific state variables"""
@@ -45,6 +50,7 @@ class GameState:
         if self.mission_completed:
             actual_payment = self.current_contract.payout + time_bonus - sum(penalties)
             self.cash += actual_payment
+            self.ledger.record_mission(self.current_contract, time_bonus, penalties)
             return actual_payment
         return 0
     
@@ -53,9 +59,20 @@ class GameState:
         if self.cash >= cost and self.fuel < 100:
             self.fuel = 100.0
             self.cash -= cost
+            contract = self.current_contract
+            if contract is not None:
+                self.ledger.record('fuel', -cost, contract.cargo_type, contract.route_text)
+            else:
+                self.ledger.record('fuel', -cost)
             return True
         return False
     
+    def buy_upgrade(self, upgrade_levels, cost):
+        """Pay for an upgrade and take on its (engine, fuel tank, frame) levels"""
+        self.cash -= cost
+        self.upgrade_levels = tuple(upgrade_levels)
+        self.ledger.record('upgrade', -cost)
+    
     def switch_scene(self, new_scene):
         """Switch to a new game scene"""
         self.scene = new_scene
@@ -0,0 +1,71 @@
+"""
+Garbage Collection Control
+Keeps CPython's cyclic collector from pausing in the middle of driving frames
+
+Long-lived objects are frozen after a scene loads so collections never walk
+them. During driving scenes automatic collection is off; young generations are
+collected between frames instead, and full collections only run at scene
+transitions. Set HH_GC=default to leave the collector alone.
+"""
+import gc
+import os
+
+SUSPEND_SCENES = ('driving',)
+
+class GCController:
+    """Schedules garbage collection around the main loop"""
+
+    def __init__(self, suspend_scenes=SUSPEND_SCENES, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get('HH_GC', 'managed') != 'default'
+        self.enabled = enabled
+        self.suspend_scenes = suspend_scenes
+        self.scene = None
+        self.suspended = False
+        self.collections = [0, 0, 0]  # Collections run by this controller, per generation
+
+    def after_load(self):
+        """Collect once and freeze everything alive so later collections skip it"""
+        if not self.enabled:
+            return
+        gc.collect()
+        gc.freeze()
+        self.collections[2] += 1
+
+    def begin_frame(self, scene):
+        """Handle scene transitions before a frame runs"""
+        if scene == self.scene:
+            return
+        previous, self.scene = self.scene, scene
+        if not self.enabled:
+            return
+        if previous is not None:
+            # The old scene's objects are garbage now; take the full pass while the screen changes
+            gc.unfreeze()
+            self.after_load()
+
+        self.suspended = scene in self.suspend_scenes
+        if self.suspended:
+            gc.disable()
+        else:
+            gc.enable()
+
+    def end_frame(self):
+        """Collect young generations between frames while automatic collection is off"""
+        if not self.suspended:
+            return
+        count0, count1, _ = gc.get_count()
+        threshold0, threshold1, _ = gc.get_threshold()
+        if count0 < threshold0:
+            return
+        # Never escalate to generation 2 here; that waits for the next transition
+        generation = 1 if count1 >= threshold1 else 0
+        gc.collect(generation)
+        self.collections[generation] += 1
+
+    def shutdown(self):
+        """Hand the collector back to CPython"""
+        if self.enabled:
+            gc.unfreeze()
+            gc.enable()
+        self.suspended = False
@@ -0,0 +1,36 @@
+"""
+Paths
+Platform checks and where the game keeps its caches and save games
+"""
+import os
+import sys
+
+def is_android():
+    """Check whether we are running under python-for-android"""
+    return 'ANDROID_ARGUMENT' in os.environ or hasattr(sys, 'getandroidapilevel')
+
+def default_cache_dir():
+    """Get the directory for on-disk caches (HH_CACHE_DIR overrides)"""
+    if os.environ.get('HH_CACHE_DIR'):
+        return os.environ['HH_CACHE_DIR']
+    if is_android() and os.environ.get('ANDROID_PRIVATE'):
+        return os.path.join(os.environ['ANDROID_PRIVATE'], 'cache')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'heavy-haul-tycoon')
+
+def default_save_dir():
+    """Get the directory for save games (HH_SAVE_DIR overrides)"""
+    if os.environ.get('HH_SAVE_DIR'):
+        return os.environ['HH_SAVE_DIR']
+    if is_android() and os.environ.get('ANDROID_PRIVATE'):
+        return os.path.join(os.environ['ANDROID_PRIVATE'], 'saves')
+    return os.path.join(os.path.expanduser('~'), '.local', 'share', 'heavy-haul-tycoon')
+
+def write_atomic(path, data):
+    """Write bytes to a file so readers (and crashes) never see it half written"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
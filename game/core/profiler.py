@@ -0,0 +1,242 @@
+"""
+Frame Profiler
+Per-phase frame timings kept in fixed-size ring buffers, with a toggleable overlay
+
+Wrap each phase of a frame in `with profiler.scope('name'):` and call
+end_frame() once per frame. While disabled, scope() hands back a shared no-op
+context manager, so instrumented code costs one method call per scope.
+
+Scopes also count net new GC-tracked objects (the generation 0 count that
+triggers collections), so the overlay shows which systems feed the collector.
+"""
+import gc
+import os
+import time
+from array import array
+import pygame
+from core.fonts import get_font
+
+RING_SIZE = 240  # Four seconds of frames at 60 FPS
+TARGET_FRAME_MS = 1000.0 / 60
+TOGGLE_KEY = pygame.K_F3
+
+class _NullScope:
+    """Context manager that does nothing, used while profiling is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SCOPE = _NullScope()
+
+class TimingRing:
+    """Fixed-size ring of per-frame samples with a running sum"""
+    __slots__ = ('samples', 'index', 'count', 'total')
+
+    def __init__(self, size=RING_SIZE):
+        self.samples = array('d', bytes(8 * size))
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+
+    def push(self, value):
+        """Add a sample, replacing the oldest one when full"""
+        samples = self.samples
+        self.total += value - samples[self.index]
+        samples[self.index] = value
+        self.index = (self.index + 1) % len(samples)
+        if self.count < len(samples):
+            self.count += 1
+
+    @property
+    def average(self):
+        """Get the rolling average"""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def peak(self):
+        """Get the largest sample in the window"""
+        return max(self.samples) if self.count else 0.0
+
+    def ordered(self):
+        """Get samples from oldest to newest"""
+        if self.count < len(self.samples):
+            return self.samples[:self.count]
+        return self.samples[self.index:] + self.samples[:self.index]
+
+class _Scope:
+    """Times one named phase and adds it to the current frame"""
+    __slots__ = ('profiler', 'name', 'start', 'objects')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+        self.objects = 0
+
+    def __enter__(self):
+        self.profiler._depth += 1
+        self.objects = gc.get_count()[0]
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        profiler = self.profiler
+        profiler._depth -= 1
+        profiler._pending[self.name] += elapsed * 1000
+        # A collection inside the scope resets the count; never report it as negative
+        profiler._pending_objects[self.name] += max(0, gc.get_count()[0] - self.objects)
+        return False
+
+class FrameProfiler:
+    """Collects per-phase timings for the last RING_SIZE frames"""
+
+    def __init__(self, enabled=None, ring_size=RING_SIZE):
+        if enabled is None:
+            enabled = bool(os.environ.get('HH_PROFILE'))
+        self.enabled = enabled
+        self.ring_size = ring_size
+        self.phases = {}  # name -> TimingRing, in first-seen order
+        self.depths = {}  # name -> nesting depth, for indenting the overlay
+        self.allocations = {}  # name -> TimingRing of net new GC-tracked objects per frame
+        self.frame_times = TimingRing(ring_size)
+        self._scopes = {}
+        self._pending = {}
+        self._pending_objects = {}
+        self._depth = 0
+        self._last_frame = None
+
+    def toggle(self):
+        """Turn profiling on or off"""
+        self.enabled = not self.enabled
+        self._last_frame = None
+        for name in self._pending:
+            self._pending[name] = 0.0
+            self._pending_objects[name] = 0
+
+    def scope(self, name):
+        """Get a context manager timing one phase of the frame"""
+        if not self.enabled:
+            return NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(self, name)
+            self.phases[name] = TimingRing(self.ring_size)
+            self.allocations[name] = TimingRing(self.ring_size)
+            self.depths[name] = self._depth
+            self._pending[name] = 0.0
+            self._pending_objects[name] = 0
+        return scope
+
+    def end_frame(self):
+        """Move this frame's phase timings into the rings"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self.frame_times.push((now - self._last_frame) * 1000)
+        self._last_frame = now
+        pending = self._pending
+        pending_objects = self._pending_objects
+        allocations = self.allocations
+        for name, ring in self.phases.items():
+            ring.push(pending[name])
+            allocations[name].push(pending_objects[name])
+            pending[name] = 0.0
+            pending_objects[name] = 0
+
+    def summary(self):
+        """Get rolling averages and peaks per phase, in milliseconds and objects per frame"""
+        return {name: {'avg_ms': ring.average, 'max_ms': ring.peak,
+                       'avg_objects': self.allocations[name].average}
+                for name, ring in self.phases.items()}
+
+class ProfilerOverlay:
+    """Draws a profiler's rolling averages and a frame-time graph"""
+    COLUMNS = (110, 60, 10)  # Right edges of the value columns, from the panel's right side
+
+    def __init__(self, profiler, font=None, width=300, graph_height=60, capture=None):
+        self.profiler = profiler
+        self.capture = capture  # Optional ProfileCapture whose status is shown under the panel
+        self.font = font
+        self.width = width
+        self.graph_height = graph_height
+
+    def handle_event(self, event):
+        """Toggle the profiler on the F3 key; returns True if handled"""
+        if event.type == pygame.KEYDOWN and event.key == TOGGLE_KEY:
+            self.profiler.toggle()
+            return True
+        return False
+
+    def render(self, screen):
+        """Draw the overlay in the top-right corner"""
+        profiler = self.profiler
+        status = self.capture.status if self.capture is not None else None
+        if not profiler.enabled and not status:
+            return
+        if self.font is None:
+            self.font = get_font(None, 18)
+
+        line_height = self.font.get_linesize()
+        x = screen.get_width() - self.width - 8
+        y = 8
+        if not profiler.enabled:
+            self._render_status(screen, status, x, y)
+            return
+        height = (len(profiler.phases) + 2) * line_height + self.graph_height + 16
+
+        panel = pygame.Surface((self.width, height))
+        panel.set_alpha(190)
+        panel.fill((0, 0, 0))
+        screen.blit(panel, (x, y))
+
+        # Phase table
+        frame = profiler.frame_times
+        fps = 1000.0 / frame.average if frame.average else 0.0
+        header = f"frame {frame.average:5.2f} ms  max {frame.peak:5.2f}  {fps:4.0f} fps"
+        screen.blit(self.font.render(header, True, (255, 255, 255)), (x + 6, y + 4))
+        row_y = y + 4 + line_height
+        for column, label in zip(self.COLUMNS, ("avg ms", "max ms", "objs")):
+            text = self.font.render(label, True, (150, 150, 150))
+            screen.blit(text, text.get_rect(topright=(x + self.width - column, row_y)))
+        row_y += line_height
+        for name, ring in profiler.phases.items():
+            color = (255, 120, 120) if ring.average > TARGET_FRAME_MS / 2 else (200, 200, 200)
+            indent = 12 * profiler.depths[name]
+            screen.blit(self.font.render(name, True, color), (x + 6 + indent, row_y))
+            values = (f"{ring.average:.2f}", f"{ring.peak:.2f}", f"{profiler.allocations[name].average:.0f}")
+            for column, value in zip(self.COLUMNS, values):
+                text = self.font.render(value, True, color)
+                screen.blit(text, text.get_rect(topright=(x + self.width - column, row_y)))
+            row_y += line_height
+
+        # Frame-time graph, scaled so the 60 FPS budget sits at half height
+        graph_top = row_y + 4
+        graph_bottom = graph_top + self.graph_height
+        scale = self.graph_height / (TARGET_FRAME_MS * 2)
+        budget_y = graph_bottom - int(TARGET_FRAME_MS * scale)
+        pygame.draw.line(screen, (0, 120, 0), (x + 6, budget_y), (x + self.width - 6, budget_y))
+        samples = frame.ordered()
+        if len(samples) > 1:
+            step = (self.width - 12) / (profiler.ring_size - 1)
+            points = [(x + 6 + i * step, max(graph_top, graph_bottom - value * scale))
+                      for i, value in enumerate(samples)]
+            pygame.draw.lines(screen, (255, 220, 0), False, points)
+        if status:
+            self._render_status(screen, status, x, y + height + 4)
+
+    def _render_status(self, screen, status, x, y):
+        """Draw one line of capture status on its own panel, right-aligned with the overlay"""
+        text = self.font.render(status, True, (255, 220, 0))
+        width = max(self.width, text.get_width() + 12)
+        x += self.width - width
+        panel = pygame.Surface((width, self.font.get_linesize() + 8))
+        panel.set_alpha(190)
+        panel.fill((0, 0, 0))
+        screen.blit(panel, (x, y))
+        screen.blit(text, (x + 6, y + 4))
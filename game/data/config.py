@@ -0,0 +1,292 @@
+"""
+Game Configuration
+Compiles data/config.yml into typed, slotted config objects with a binary cache
+
+Parsing YAML is slow and PyYAML is not in the Android build, so the validated
+config is stored as a marshal file keyed on a hash of config.yml. Later
+launches load that file and never parse or import YAML. Sections use
+__slots__, so reading a setting is a plain attribute lookup:
+
+    config = get_config()
+    config.upgrades.engine.speed_bonuses[level - 1]
+
+Run `python -m data.config` to write data/config.bin; the Android build does
+this through p4a_hook.py, so a device can use the config without PyYAML. When
+no compiled copy matches and PyYAML is missing, loading fails instead of
+guessing at settings.
+
+Modules that expose config values as globals use lazy_settings(), so the
+config is only loaded on first access and importing them touches no files.
+"""
+import hashlib
+import marshal
+import os
+import sys
+from core.paths import default_cache_dir, write_atomic
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.yml')
+BUNDLED_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.bin')
+CACHE_FILENAME = 'config.bin'
+CACHE_VERSION = 2
+MARSHAL_VERSION = 4  # Readable by every Python 3 the build may ship
+
+def _coerce(value, kind, where):
+    """Check a parsed value against its declared type and normalize it"""
+    if isinstance(kind, tuple):
+        if not isinstance(value, (list, tuple)):
+            raise ValueError(f"{where} must be a list")
+        return tuple(_coerce(item, kind[0], f"{where}[{i}]") for i, item in enumerate(value))
+    if isinstance(kind, type) and issubclass(kind, ConfigSection):
+        return kind.from_dict(value, where)
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{where} must be {kind.__name__}, got {value!r}")
+    if kind is float and isinstance(value, (int, float)):
+        return float(value)
+    if kind is int and isinstance(value, int):
+        return value
+    if kind is str and isinstance(value, str):
+        return value
+    raise ValueError(f"{where} must be {kind.__name__}, got {value!r}")
+
+def _plain(value):
+    """Turn config values back into plain data"""
+    if isinstance(value, ConfigSection):
+        return value.to_dict()
+    return value
+
+class ConfigSection:
+    """Base for config sections; subclasses declare FIELDS as name -> type"""
+    __slots__ = ()
+    FIELDS = {}
+
+    @classmethod
+    def from_dict(cls, data, path=''):
+        """Validate a mapping and build the section"""
+        if not isinstance(data, dict):
+            raise ValueError(f"{path or 'config'} must be a mapping")
+        unknown = set(data) - set(cls.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown setting {path + '.' if path else ''}{sorted(unknown)[0]}")
+        section = cls.__new__(cls)
+        for name, kind in cls.FIELDS.items():
+            where = f"{path}.{name}" if path else name
+            if name not in data:
+                raise ValueError(f"{where} is missing")
+            setattr(section, name, _coerce(data[name], kind, where))
+        section.check(path)
+        return section
+
+    def check(self, path):
+        """Cross-field validation; raises ValueError"""
+
+    def to_dict(self):
+        """Convert back to plain data"""
+        return {name: _plain(getattr(self, name)) for name in self.FIELDS}
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+# Economy
+class CargoTable(ConfigSection):
+    FIELDS = {'standard': float, 'oversize': float, 'superload': float}
+    __slots__ = tuple(FIELDS)
+
+    def by_cargo_type(self):
+        """Get the table keyed like Contract.cargo_type"""
+        return {'Standard': self.standard, 'Oversize': self.oversize, 'Superload': self.superload}
+
+class DeadlineTable(ConfigSection):
+    FIELDS = {'urgent': float, 'standard': float, 'relaxed': float}
+    __slots__ = tuple(FIELDS)
+
+class EconomyConfig(ConfigSection):
+    FIELDS = {
+        'base_rate_per_mile': float,
+        'distance_scale': int,
+        'weight_multipliers': CargoTable,
+        'oversize_bonuses': CargoTable,
+        'deadline_multipliers': DeadlineTable,
+        'early_delivery_bonus': float,
+        'late_delivery_penalty_min': float,
+        'late_delivery_penalty_max': float
+    }
+    __slots__ = tuple(FIELDS)
+
+class PenaltyConfig(ConfigSection):
+    FIELDS = {'collision_damage': int, 'bridge_strike': int, 'off_road_fine': int, 'towing_fee': int}
+    __slots__ = tuple(FIELDS)
+
+# Vehicle
+class VehicleConfig(ConfigSection):
+    FIELDS = {
+        'fuel_capacity_base': float,
+        'fuel_consumption_base': float,
+        'fuel_price_per_gallon': float,
+        'max_speed': float,
+        'acceleration': float,
+        'deceleration': float,
+        'turn_speed': float,
+        'off_road_speed_penalty': float,
+        'off_road_fuel_penalty': float
+    }
+    __slots__ = tuple(FIELDS)
+
+# Upgrades
+class UpgradeTrack(ConfigSection):
+    """Base for upgrade tracks; every list has one entry per level"""
+    __slots__ = ()
+
+    def check(self, path):
+        for name in self.FIELDS:
+            if len(getattr(self, name)) != len(self.levels):
+                raise ValueError(f"{path}.{name} needs one entry per level")
+
+class EngineUpgrades(UpgradeTrack):
+    FIELDS = {'levels': (int,), 'costs': (int,), 'speed_bonuses': (float,)}
+    __slots__ = tuple(FIELDS)
+
+class FuelTankUpgrades(UpgradeTrack):
+    FIELDS = {'levels': (int,), 'costs': (int,), 'capacities': (int,)}
+    __slots__ = tuple(FIELDS)
+
+class FrameUpgrades(UpgradeTrack):
+    FIELDS = {'levels': (int,), 'costs': (int,), 'collision_reduction': (float,)}
+    __slots__ = tuple(FIELDS)
+
+class UpgradeConfig(ConfigSection):
+    FIELDS = {'engine': EngineUpgrades, 'fuel_tank': FuelTankUpgrades, 'frame': FrameUpgrades}
+    __slots__ = tuple(FIELDS)
+
+# Missions and player
+class MissionConfig(ConfigSection):
+    FIELDS = {
+        'cargo_type_weights': CargoTable,
+        'deadline_base_calculation': str,
+        'deadline_variance_hours': (int,),
+        'deadline_min_hours': int,
+        'deadline_max_hours': int
+    }
+    __slots__ = tuple(FIELDS)
+
+class StartingResources(ConfigSection):
+    FIELDS = {'cash': int, 'fuel': float, 'truck_level': int}
+    __slots__ = tuple(FIELDS)
+
+# UI
+class ColorConfig(ConfigSection):
+    FIELDS = {name: (int,) for name in ('background', 'road', 'fuel_good', 'fuel_warning',
+                                        'fuel_critical', 'cash', 'warning')}
+    __slots__ = tuple(FIELDS)
+
+class UIConfig(ConfigSection):
+    FIELDS = {
+        'screen_width': int,
+        'screen_height': int,
+        'fps_target': int,
+        'fuel_gauge_pos': (int,),
+        'speedometer_pos': (int,),
+        'cash_display_pos': (int,),
+        'timer_pos': (int,),
+        'colors': ColorConfig
+    }
+    __slots__ = tuple(FIELDS)
+
+class GameConfig(ConfigSection):
+    """The whole of config.yml; digest identifies the source it was built from"""
+    FIELDS = {
+        'economy': EconomyConfig,
+        'penalties': PenaltyConfig,
+        'vehicle': VehicleConfig,
+        'upgrades': UpgradeConfig,
+        'missions': MissionConfig,
+        'starting_resources': StartingResources,
+        'ui': UIConfig
+    }
+    __slots__ = tuple(FIELDS) + ('digest',)
+
+def config_digest(source):
+    """Hash config.yml bytes together with everything that changes the compiled form"""
+    salt = f"{CACHE_VERSION}|{MARSHAL_VERSION}|".encode()
+    return hashlib.blake2b(salt + source, digest_size=16).hexdigest()
+
+def _read_compiled(path, digest):
+    """Load compiled config data if the file exists and matches the digest"""
+    try:
+        with open(path, 'rb') as f:
+            cached_digest, data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return data if cached_digest == digest else None
+
+def compile_config(source):
+    """Parse and validate config.yml bytes; returns a GameConfig"""
+    import yaml  # Only needed when no compiled copy matches
+    config = GameConfig.from_dict(yaml.safe_load(source))
+    config.digest = config_digest(source)
+    return config
+
+def write_compiled(config, path):
+    """Write a compiled config file"""
+    write_atomic(path, marshal.dumps((config.digest, config.to_dict()), MARSHAL_VERSION))
+
+def load_config(path=CONFIG_PATH, cache_dir=None):
+    """Load the game config, compiling and caching it when config.yml changed"""
+    with open(path, 'rb') as f:
+        source = f.read()
+
+    digest = config_digest(source)
+    cache_path = os.path.join(cache_dir or default_cache_dir(), CACHE_FILENAME)
+    for compiled_path in (cache_path, BUNDLED_CACHE_PATH):
+        data = _read_compiled(compiled_path, digest)
+        if data is not None:
+            config = GameConfig.from_dict(data)
+            config.digest = digest
+            return config
+
+    try:
+        config = compile_config(source)
+    except ImportError:
+        raise RuntimeError(f"No compiled config matches {path} and PyYAML is not installed; "
+                           f"run `python -m data.config` to bundle one") from None
+    try:
+        write_compiled(config, cache_path)
+    except OSError:
+        pass  # Read-only cache dir; parse again next launch
+    return config
+
+_config = None
+
+def get_config():
+    """Get the process-wide game config"""
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
+
+def lazy_settings(module_name, settings):
+    """Build a module __getattr__ that reads config-backed globals on first access
+
+    settings maps a global name to a function of the GameConfig. The value is
+    stored as a module global, so later reads are plain lookups.
+    """
+    module_globals = sys.modules[module_name].__dict__
+
+    def __getattr__(name):
+        setting = settings.get(name)
+        if setting is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = module_globals[name] = setting(get_config())
+        return value
+    return __getattr__
+
+def set_config(config):
+    """Swap in a new process-wide config (between frames)"""
+    global _config
+    _config = config
+
+if __name__ == "__main__":
+    with open(CONFIG_PATH, 'rb') as f:
+        compiled = compile_config(f.read())
+    write_compiled(compiled, BUNDLED_CACHE_PATH)
+    print(f"Wrote {BUNDLED_CACHE_PATH} ({compiled.digest})")
@@ -0,0 +1,46 @@
+"""
+City Distance Table
+Precomputed city-to-city grid distances shared by dispatch and route planning
+"""
+import numpy as np
+
+DISTANCE_SCALE = 10  # Grid-based distance: (|dx| + |dy|) / scale
+
+class DistanceTable:
+    """Dense matrix of grid distances (in miles) between every pair of cities"""
+
+    def __init__(self, cities):
+        self.cities = cities
+        self.names = [city['name'] for city in cities]
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+        xs = np.array([city['x'] for city in cities], dtype=np.float64)
+        ys = np.array([city['y'] for city in cities], dtype=np.float64)
+
+        # Same formula as Contract.distance_miles, for every pair at once
+        self.miles = (np.abs(xs[:, None] - xs[None, :]) +
+                      np.abs(ys[:, None] - ys[None, :])) / DISTANCE_SCALE
+
+    def city_index(self, city):
+        """Get the row/column index of a city dict"""
+        return self.index[city['name']]
+
+    def city_indices(self, cities):
+        """Get an index array for a sequence of city dicts"""
+        return np.fromiter((self.index[city['name']] for city in cities),
+                           dtype=np.intp, count=len(cities))
+
+    def between(self, origin, destination):
+        """Get the distance in miles between two city dicts"""
+        return self.miles[self.index[origin['name']], self.index[destination['name']]]
+
+_table_cache = {}
+
+def get_distance_table(cities):
+    """Get a cached distance table for a city list"""
+    key = tuple((city['name'], city['x'], city['y']) for city in cities)
+    table = _table_cache.get(key)
+    if table is None:
+        table = DistanceTable(cities)
+        _table_cache[key] = table
+    return table
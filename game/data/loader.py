@@ -5,10 +5,12 @@ import json
 import random
 from entities.contract import Contract
 
-def load_cities():
+CITIES_PATH = 'data/cities.json'
+
+def load_cities(path=CITIES_PATH):
     """Load city data from JSON file"""
     try:
-        with open('data/cities.json', 'r') as f:
+        with open(path, 'r') as f:
             return json.load(f)['cities']
     except FileNotFoundError:
         # Fallback data if file not found
@@ -1,13 +1,21 @@
 import pygame
 import math
 import sys
+from core.fonts import LazyFont
 
-pygame.init()
-screen = pygame.display.set_mode((800, 600))
-pygame.display.set_caption("Heavy Haul Tycoon")
-clock = pygame.time.Clock()
-FONT = pygame.font.SysFont(None, 24)
-LARGE_FONT = pygame.font.SysFont(None, 32)
+screen = None
+clock = None
+
+def init_display():
+    """Open the game window; called by the entry point rather than on import"""
+    global screen, clock
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    pygame.display.set_caption("Heavy Haul Tycoon")
+    clock = pygame.time.Clock()
+
+FONT = LazyFont(None, 24)
+LARGE_FONT = LazyFont(None, 32)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -189,6 +197,7 @@ def render_hud(speed, cash, fuel):
 
 def main_loop():
     """Enhanced main game loop"""
+    init_display()
     truck = Truck(400, 300)
     fuel = 100.0
     cash = 10000
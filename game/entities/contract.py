@@ -2,7 +2,7 @@
 Contract Entity - Represents delivery contracts
 """
 import random
-from core.constants import BASE_RATE_PER_MILE
+from systems.pricing import get_pricing
 
 class Contract:
     """Represents a delivery contract with route, cargo, and payment details"""
@@ -13,28 +13,10 @@ class Contract:
         self.cargo_type = cargo_type
         self.deadline_hours = deadline_hours
         
-        # Calculate distance and payment
-        dx = abs(dest_city['x'] - origin_city['x'])
-        dy = abs(dest_city['y'] - origin_city['y'])
-        self.distance_miles = (dx + dy) / 10
-        
-        # Payment calculation
-        weight_multipliers = {'Standard': 1.1, 'Oversize': 1.25, 'Superload': 1.5}
-        oversize_bonuses = {'Standard': 0.0, 'Oversize': 0.20, 'Superload': 0.40}
-        
-        base_payment = BASE_RATE_PER_MILE * self.distance_miles
-        weight_factor = weight_multipliers[cargo_type] - 1
-        oversize_factor = oversize_bonuses[cargo_type]
-        
-        # Deadline multiplier
-        if deadline_hours <= 4:
-            deadline_multiplier = 1.3
-        elif deadline_hours <= 6:
-            deadline_multiplier = 1.15
-        else:
-            deadline_multiplier = 1.0
-            
-        self.payout = int(base_payment * (1 + weight_factor + oversize_factor) * deadline_multiplier)
+        # Calculate distance and payment from the current pricing table
+        pricing = get_pricing()
+        self.distance_miles = pricing.distance(origin_city, dest_city)
+        self.payout = pricing.payout(origin_city, dest_city, cargo_type, deadline_hours)
         
         # Cargo description
         descriptions = {
@@ -44,6 +26,11 @@ class Contract:
         }
         self.cargo_description = random.choice(descriptions[cargo_type])
     
+    def reprice(self, pricing):
+        """Recalculate distance and payment after the pricing tables change"""
+        self.distance_miles = pricing.distance(self.origin, self.destination)
+        self.payout = pricing.payout(self.origin, self.destination, self.cargo_type, self.deadline_hours)
+    
     @property
     def route_text(self):
         """Get formatted route string"""
@@ -3,54 +3,16 @@ Truck Entity - Player's vehicle
 """
 import pygame
 import math
-from core.constants import TruckConfig, BLUE, LIGHT_GRAY, DARK_GRAY
+from core.constants import BLUE, LIGHT_GRAY, DARK_GRAY
+from sim.truck import TruckModel
 
-class Truck:
-    """Player's truck with physics, rendering, and collision detection"""
-    
-    def __init__(self, start_x, start_y):
-        self.x = start_x
-        self.y = start_y
-        self.angle = 0
-        self.speed = 0
-        self.max_speed = TruckConfig.MAX_SPEED
-        self.acceleration = TruckConfig.ACCELERATION
-        self.deceleration = TruckConfig.DECELERATION
-        self.turn_speed = TruckConfig.TURN_SPEED
-        
-    def update(self, keys, dt, speed_multiplier=1.0):
-        """Update truck position and rotation based on input"""
-        # Acceleration/Deceleration
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            self.speed = min(self.speed + self.acceleration, self.max_speed * speed_multiplier)
-        elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            self.speed = max(self.speed - self.acceleration, -self.max_speed * TruckConfig.REVERSE_SPEED_MULTIPLIER)
-        else:
-            if self.speed > 0:
-                self.speed = max(0, self.speed - self.deceleration)
-            elif self.speed < 0:
-                self.speed = min(0, self.speed + self.deceleration)
-        
-        # Turning
-        if abs(self.speed) > 0.1:
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                self.angle -= self.turn_speed
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                self.angle += self.turn_speed
-        
-        # Movement
-        if abs(self.speed) > 0.05:
-            rad = math.radians(self.angle)
-            self.x += math.cos(rad) * self.speed
-            self.y += math.sin(rad) * self.speed
-        
-        # Keep on screen but allow more space
-        self.x = max(30, min(770, self.x))
-        self.y = max(30, min(570, self.y))
+class Truck(TruckModel):
+    """Player's truck: TruckModel physics and collision, drawn with pygame"""
     
     def get_rect(self):
-        """Get collision rectangle for the truck"""
-        return pygame.Rect(self.x - 30, self.y - 15, 60, 30)
+        """Get collision rectangle for the truck as a pygame.Rect (for pygame-side collision checks)"""
+        left, top, right, bottom = self.get_bounds()
+        return pygame.Rect(left, top, right - left, bottom - top)
     
     def draw(self, screen):
         """Render the truck on screen"""
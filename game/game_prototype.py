@@ -7,6 +7,8 @@ import sys
 import math
 import json
 import random
+from core.fonts import LazyFont
+from data.config import get_config
 
 # Load game data
 def load_cities():
@@ -21,16 +23,22 @@ def load_cities():
             {"name": "Phoenix", "x": 60, "y": 380}
         ]
 
-pygame.init()
-screen = pygame.display.set_mode((800, 600))
-pygame.display.set_caption("Heavy Haul Tycoon - Integrated")
-clock = pygame.time.Clock()
+screen = None
+clock = None
+
+def init_display():
+    """Open the game window; called by the entry point rather than on import"""
+    global screen, clock
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    pygame.display.set_caption("Heavy Haul Tycoon - Integrated")
+    clock = pygame.time.Clock()
 
 # Fonts
-SMALL_FONT = pygame.font.SysFont(None, 18)
-FONT = pygame.font.SysFont(None, 24)
-LARGE_FONT = pygame.font.SysFont(None, 32)
-TITLE_FONT = pygame.font.SysFont(None, 48)
+SMALL_FONT = LazyFont(None, 18)
+FONT = LazyFont(None, 24)
+LARGE_FONT = LazyFont(None, 32)
+TITLE_FONT = LazyFont(None, 48)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -47,9 +55,10 @@ ROAD_GRAY = (80, 80, 80)
 GRASS_GREEN = (40, 60, 40)
 
 # Game constants
-BASE_RATE_PER_MILE = 6.00
+CONFIG = get_config()
+BASE_RATE_PER_MILE = CONFIG.economy.base_rate_per_mile
 FUEL_DRAIN_RATE = 0.008  # Reduced from 0.03 to make fuel last longer
-BRIDGE_PENALTY = 5000
+BRIDGE_PENALTY = CONFIG.penalties.bridge_strike
 
 class GameState:
     def __init__(self):
@@ -531,6 +540,7 @@ def render_results_screen(game_state, mission_time, time_bonus, penalties):
 
 def main():
     """Main game loop"""
+    init_display()
     game_state = GameState()
     cities = load_cities()
     truck = None
@@ -1,10 +1,18 @@
 import pygame
 import sys
+from core.fonts import LazyFont
 
-pygame.init()
-screen = pygame.display.set_mode((800, 600))
-clock = pygame.time.Clock()
-FONT = pygame.font.SysFont(None, 24)
+screen = None
+clock = None
+
+def init_display():
+    """Open the game window; called by the entry point rather than on import"""
+    global screen, clock
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    clock = pygame.time.Clock()
+
+FONT = LazyFont(None, 24)
 
 # Game state
 truck = pygame.Rect(400, 300, 50, 30)
@@ -23,6 +31,7 @@ def render_fuel_gauge(current_fuel):
 
 def main_loop():
     global fuel
+    init_display()
     running = True
     
     while running:
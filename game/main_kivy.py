@@ -1,48 +1,215 @@
+"""
+Heavy Haul Tycoon - Kivy Frontend
+Kivy driving view for the Android build, running the shared sim.mission core
+
+The truck, fuel, roads, bridge and delivery rules are the same
+MissionSimulation the pygame game steps; this module is only the input and
+rendering adapter. Keyboard input is packed into sim Controls, the
+simulation advances in fixed 1/FPS ticks however Kivy schedules frames, and
+the 800x600 map is scaled into the window with y flipped to Kivy's bottom-up
+coordinates.
+"""
 from kivy.app import App
 from kivy.uix.widget import Widget
-from kivy.graphics import Rectangle, Color
+from kivy.graphics import Rectangle, Color, Line, PushMatrix, PopMatrix, Translate, Rotate, Scale
 from kivy.clock import Clock
 from kivy.uix.label import Label
 from kivy.core.window import Window
-from kivy.uix.floatlayout import FloatLayout
+from core.game_state import GameState
+from data.loader import load_cities, generate_contracts
+from sim.controls import Controls, encode_inputs
+from sim.fuel import FuelModel
+from sim.mission import MissionSimulation, begin_mission, end_mission
+from sim.physics import PhysicsModel
+from sim.rules import FPS, TRUCK_START, DELIVERY_RADIUS, WORLD_SIZE, TRUCK_SIZE
+from sim.truck import TruckModel
+
+# Fuel bar colors by remaining fraction, matching the pygame HUD
+FUEL_COLORS = ((0.5, (0, 0.8, 0, 1)), (0.25, (1, 1, 0, 1)), (0, (0.8, 0, 0, 1)))
+
+# Map colors (core.constants values as Kivy rgba)
+GRASS_COLOR = (0.16, 0.24, 0.16, 1)
+ROAD_COLOR = (0.31, 0.31, 0.31, 1)
+STATION_COLOR = (0.78, 0.78, 0.78, 1)
+BRIDGE_COLOR = (0.5, 0.5, 0.5, 1)
+DESTINATION_COLOR = (0, 0.78, 0, 0.6)
+TRUCK_COLOR = (0, 0.39, 0.78, 1)
+
+# Keyboard keys for each simulation input
+KEY_INPUTS = {
+    'up': 'up', 'w': 'up',
+    'down': 'down', 's': 'down',
+    'left': 'left', 'a': 'left',
+    'right': 'right', 'd': 'right',
+    'r': 'refuel'
+}
+MAX_TICKS_PER_FRAME = 5  # Catch up after a slow frame, but never spiral
+
+def fuel_color(fuel):
+    """Get the fuel bar color for a fuel level (0-100)"""
+    for threshold, color in FUEL_COLORS:
+        if fuel / 100.0 > threshold:
+            return color
+    return FUEL_COLORS[-1][1]
 
 class TruckGame(Widget):
+    """Retained-mode driving view over a MissionSimulation
+
+    Canvas instructions are created once in _build_canvas(). The static map
+    is only repositioned in _layout() when the window is resized, and each
+    frame only changes the truck transform, the fuel bar and the labels whose
+    values changed (tracked in the shown_* attributes), since every new label
+    text renders a new texture. The frame clock runs while a mission is being
+    driven, because mission time is counted in simulation ticks, and stops on
+    the results screen until SPACE starts the next contract.
+    """
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.truck_x = 400
-        self.truck_y = 300
-        self.speed = 200  # pixels per second
-        self.fuel = 100.0
-        self.fuel_drain = 10.0  # per second when moving
-        
-        # Create fuel label
-        self.fuel_label = Label(
-            text=f'Fuel: {self.fuel:.1f}%',
-            pos=(20, Window.height - 60),
-            size_hint=(None, None),
-            color=(1, 1, 1, 1)
-        )
+        self.cities = load_cities()
+        self.game_state = GameState()
+        self.controls = Controls()
+        self.keys_pressed = set()  # Simulation input names currently held
+        self.truck = TruckModel(*TRUCK_START)
+        self.fuel_model = FuelModel()
+        self.physics_model = PhysicsModel()
+        self.mission = None
+        self.accumulator = 0.0
+        self.scale = 1.0
+        self.origin = (0, 0)
+
+        # Labels
+        self.shown_fuel_text = None
+        self.fuel_label = Label(size_hint=(None, None), color=(1, 1, 1, 1))
         self.add_widget(self.fuel_label)
-        
-        # Game over label
-        self.game_over_label = Label(
-            text='Out of fuel! Game Over',
-            pos=(Window.width/2 - 100, Window.height/2),
-            size_hint=(None, None),
-            color=(1, 0, 0, 1)
-        )
-        
+        self.shown_status_text = None
+        self.status_label = Label(size_hint=(None, None), color=(1, 1, 1, 1))
+        self.add_widget(self.status_label)
+        self.result_label = Label(size_hint=(None, None), color=(1, 1, 0, 1), halign='center')
+
+        self._build_canvas()
+        Window.bind(size=self._layout)
+
         # Bind keyboard events
         self._keyboard = Window.request_keyboard(self._keyboard_closed, self)
         if self._keyboard:
             self._keyboard.bind(on_key_down=self.on_key_down)
             self._keyboard.bind(on_key_up=self.on_key_up)
-        
-        # Movement state
-        self.keys_pressed = set()
-        
-        # Start the game loop
-        Clock.schedule_interval(self.update, 1.0/60.0)
+
+        self._frame_event = None
+        self._start_contract()
+
+    def _build_canvas(self):
+        """Create every drawing instruction once, behind the child labels"""
+        physics = self.physics_model
+        self.map_rects = []  # (Rectangle, map rect) pairs placed by _layout()
+        with self.canvas.before:
+            Color(*GRASS_COLOR)
+            self.background = Rectangle()
+
+            # Static map from the simulation's own layout
+            Color(*ROAD_COLOR)
+            for road in physics.roads:
+                self.map_rects.append((Rectangle(), road))
+            Color(*STATION_COLOR)
+            for station in self.fuel_model.fuel_stations:
+                self.map_rects.append((Rectangle(), station['rect']))
+            Color(*BRIDGE_COLOR)
+            self.map_rects.append((Rectangle(), physics.bridge_visual))
+
+            Color(*DESTINATION_COLOR)
+            self.destination = Line(width=2)
+
+            # Truck, drawn in map units around its center and placed by a transform
+            PushMatrix()
+            self.truck_translate = Translate()
+            self.truck_scale = Scale()
+            self.truck_rotate = Rotate(axis=(0, 0, 1))
+            Color(*TRUCK_COLOR)
+            width, height = TRUCK_SIZE
+            Rectangle(pos=(-width / 2, -height / 2), size=(width, height))
+            PopMatrix()
+            self.shown_truck = None
+
+            # Fuel bar background
+            Color(0.24, 0.24, 0.24, 1)
+            self.fuel_background = Rectangle(size=(200, 20))
+
+            # Fuel bar
+            self.shown_fuel_color = fuel_color(self.game_state.fuel)
+            self.shown_fuel_width = None
+            self.fuel_bar_color = Color(*self.shown_fuel_color)
+            self.fuel_bar = Rectangle(size=(0, 20))
+        self._layout()
+
+    def _layout(self, *args):
+        """Fit the map into the window and place everything window-relative (on start and resize)"""
+        map_width, map_height = WORLD_SIZE
+        self.scale = min(Window.width / map_width, Window.height / map_height)
+        self.origin = ((Window.width - map_width * self.scale) / 2, (Window.height - map_height * self.scale) / 2)
+        self.background.size = (Window.width, Window.height)
+        for rectangle, rect in self.map_rects:
+            x, y, w, h = rect
+            rectangle.pos = self._to_screen(x, y + h)
+            rectangle.size = (w * self.scale, h * self.scale)
+        self.truck_scale.xyz = (self.scale, self.scale, 1)
+        self._place_destination()
+        self.shown_truck = None  # Re-place the truck on the next sync
+
+        self.fuel_background.pos = (20, Window.height - 40)
+        self.fuel_bar.pos = (20, Window.height - 40)
+        self.fuel_label.pos = (20, Window.height - 60)
+        self.status_label.pos = (Window.width - 220, Window.height - 50)
+        self.result_label.pos = (Window.width / 2 - 50, Window.height / 2)
+        if self.mission is not None:
+            self._sync()
+
+    def _to_screen(self, x, y):
+        """Map a point in the 800x600 map (y down) to window coordinates (y up)"""
+        return self.origin[0] + x * self.scale, self.origin[1] + (WORLD_SIZE[1] - y) * self.scale
+
+    def _place_destination(self):
+        """Draw the delivery zone around the current contract's destination"""
+        if self.mission is None:
+            return
+        x, y = self._to_screen(*self.mission.get_destination_position())
+        self.destination.circle = (x, y, DELIVERY_RADIUS * self.scale)
+
+    # Missions
+
+    def _start_contract(self):
+        """Take the next contract and start driving it"""
+        game_state = self.game_state
+        if self.mission is not None:
+            end_mission(game_state)  # Refuel between missions, like the pygame game
+        begin_mission(game_state, generate_contracts(self.cities, 1)[0])
+        self.truck.x, self.truck.y = TRUCK_START
+        self.truck.angle = 0
+        self.truck.speed = 0
+        self.mission = MissionSimulation(game_state, self.truck, self.fuel_model, self.physics_model)
+        self.accumulator = 0.0
+        if self.result_label.parent is not None:
+            self.remove_widget(self.result_label)
+        self._place_destination()
+        self._sync()
+        if self._frame_event is None:
+            self._frame_event = Clock.schedule_interval(self.update, 1.0 / FPS)
+
+    def _show_results(self):
+        """Show how the mission ended"""
+        game_state = self.game_state
+        if game_state.mission_completed:
+            earned = game_state.current_contract.payout + game_state.last_time_bonus - sum(game_state.last_penalties)
+            text = f'Delivered! +${earned:,}'
+        elif game_state.fuel <= 0:
+            text = 'Out of fuel!'
+        else:
+            text = 'Deadline missed'
+        self.result_label.text = f'{text}\nSPACE: next contract'
+        if self.result_label.parent is None:
+            self.add_widget(self.result_label)
+
+    # Input adapter
 
     def _keyboard_closed(self):
         if self._keyboard:
@@ -53,73 +220,67 @@ class TruckGame(Widget):
     def on_key_down(self, keyboard, keycode, text, modifiers):
         # keycode is a tuple (scan_code, key_name)
         key_name = keycode[1]
-        if key_name in ['left', 'right', 'up', 'down']:
-            self.keys_pressed.add(key_name)
+        if key_name in KEY_INPUTS:
+            self.keys_pressed.add(KEY_INPUTS[key_name])
+        elif key_name == 'spacebar' and self.mission is not None and self.mission.finished:
+            self._start_contract()
         return True
 
     def on_key_up(self, keyboard, keycode):
-        # keycode is a tuple (scan_code, key_name)  
-        key_name = keycode[1]
-        if key_name in self.keys_pressed:
-            self.keys_pressed.remove(key_name)
+        # keycode is a tuple (scan_code, key_name)
+        self.keys_pressed.discard(KEY_INPUTS.get(keycode[1]))
         return True
 
+    # Frame loop
+
     def update(self, dt):
-        moved = False
-        
-        if self.fuel > 0:
-            # Handle movement
-            if 'left' in self.keys_pressed:  # Left arrow
-                self.truck_x -= self.speed * dt
-                moved = True
-            if 'right' in self.keys_pressed:  # Right arrow
-                self.truck_x += self.speed * dt
-                moved = True
-            if 'up' in self.keys_pressed:  # Up arrow
-                self.truck_y += self.speed * dt
-                moved = True
-            if 'down' in self.keys_pressed:  # Down arrow
-                self.truck_y -= self.speed * dt
-                moved = True
-            
-            # Drain fuel when moving
-            if moved:
-                self.fuel -= self.fuel_drain * dt
-                if self.fuel < 0:
-                    self.fuel = 0
-        
-        # Keep truck on screen
-        self.truck_x = max(25, min(Window.width - 75, self.truck_x))
-        self.truck_y = max(25, min(Window.height - 75, self.truck_y))
-        
-        # Update fuel display
-        self.fuel_label.text = f'Fuel: {self.fuel:.1f}%'
-        
-        # Show game over if out of fuel
-        if self.fuel <= 0 and self.game_over_label.parent is None:
-            self.add_widget(self.game_over_label)
-        elif self.fuel > 0 and self.game_over_label.parent is not None:
-            self.remove_widget(self.game_over_label)
-        
-        # Redraw
-        self.canvas.clear()
-        with self.canvas:
-            # Draw background
-            Color(0.08, 0.08, 0.08, 1)
-            Rectangle(pos=(0, 0), size=(Window.width, Window.height))
-            
-            # Draw fuel bar background
-            Color(0.24, 0.24, 0.24, 1)
-            Rectangle(pos=(20, Window.height - 40), size=(200, 20))
-            
-            # Draw fuel bar
-            Color(0, 0.8, 0, 1)
-            fuel_width = max(0, (self.fuel / 100.0) * 200)
-            Rectangle(pos=(20, Window.height - 40), size=(fuel_width, 20))
-            
-            # Draw truck
-            Color(0.8, 0, 0, 1)
-            Rectangle(pos=(self.truck_x, self.truck_y), size=(50, 30))
+        """Run the simulation ticks this frame owes, then sync the view"""
+        self.controls.mask = encode_inputs(self.keys_pressed)
+        self.accumulator = min(self.accumulator + dt, MAX_TICKS_PER_FRAME / FPS)
+        finished = self.mission.finished
+        while self.accumulator >= 1.0 / FPS and not finished:
+            self.accumulator -= 1.0 / FPS
+            finished = self.mission.step(self.controls)
+        self._sync()
+
+        # Stop the clock on the results screen; SPACE restarts it
+        if finished:
+            self._show_results()
+            self._frame_event = None
+            return False
+
+    # Rendering adapter
+
+    def _sync(self):
+        """Push changed values into the retained instructions and labels"""
+        # Compare against what we last set; reading values back from Kivy returns float32 copies
+        truck = (self.truck.x, self.truck.y, self.truck.angle)
+        if truck != self.shown_truck:
+            self.shown_truck = truck
+            self.truck_translate.xy = self._to_screen(truck[0], truck[1])
+            self.truck_rotate.angle = -truck[2]  # Clockwise in the y-down map
+
+        fuel = self.game_state.fuel
+        fuel_width = max(0, (fuel / 100.0) * 200)
+        if fuel_width != self.shown_fuel_width:
+            self.shown_fuel_width = fuel_width
+            self.fuel_bar.size = (fuel_width, 20)
+            color = fuel_color(fuel)
+            if color != self.shown_fuel_color:
+                self.shown_fuel_color = color
+                self.fuel_bar_color.rgba = color
+
+        # Update fuel and mission displays (a new text means a new label texture)
+        fuel_text = f'Fuel: {fuel:.1f}%'
+        if fuel_text != self.shown_fuel_text:
+            self.shown_fuel_text = fuel_text
+            self.fuel_label.text = fuel_text
+        status_text = f'Cash: ${self.game_state.cash:,}  Time: {int(self.mission.elapsed_time)}s'
+        if self.game_state.refuel_available and not self.mission.finished:
+            status_text += '\nR: refuel'
+        if status_text != self.shown_status_text:
+            self.shown_status_text = status_text
+            self.status_label.text = status_text
 
 class HeavyHaulApp(App):
     def build(self):
@@ -4,21 +4,39 @@ Refactored for scalability and maintainability
 """
 import pygame
 import sys
+import os
+import random
+import time
+from core import constants
 from core.constants import *
 from core.game_state import GameState
 from data.loader import load_cities, generate_contracts
 from entities.truck import Truck
 from scenes.contracts import ContractScene
+from scenes.analytics import AnalyticsScene
 from systems.fuel import FuelSystem
 from systems.physics import PhysicsSystem
+from systems.mission import MissionSimulation, end_mission
+from sim.controls import Controls
+from systems.replay import InputRecorder, encode_keys, contract_to_dict
+from systems.telemetry import MissionTelemetry, TelemetryWriter
+from systems.hot_reload import DataReloader
+from systems.save_game import SAVE_FILENAME, contract_to_save
+from systems.world_store import WorldStore
+from systems.autosave import AutosaveService, recover
+from core.paths import default_save_dir
+from data.config import get_config
 from rendering.hud import HUD
+from core.profiler import FrameProfiler, ProfilerOverlay
+from core.capture import ProfileCapture
+from core.gc_control import GCController
 
 class Game:
     """Main game class that manages the overall game loop and systems"""
     
     def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.init()  # Other subsystems start on first use
+        self.screen = pygame.display.set_mode((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
         pygame.display.set_caption("Heavy Haul Tycoon - Modular")
         self.clock = pygame.time.Clock()
         
@@ -32,20 +50,73 @@ class Game:
         self.physics_system = PhysicsSystem()
         self.hud = HUD(self.fonts)
         
+        # Frame profiler (F3 or HH_PROFILE=1) and cProfile capture (F4 or HH_CPROFILE=<frames>)
+        self.profiler = FrameProfiler()
+        self.capture = ProfileCapture()
+        self.gc_control = GCController()  # HH_GC=default leaves the collector alone
+        self.profiler_overlay = ProfilerOverlay(self.profiler, capture=self.capture)
+        
         # Scenes
         self.contract_scene = ContractScene(self.fonts, self.cities)
+        self.analytics_scene = AnalyticsScene(self.fonts, self.cities)
         
         # Game objects
         self.truck = None
+        self.mission = None
+        
+        # Input recording (saved per mission when HH_REPLAY_DIR is set)
+        self.recorder = InputRecorder()
+        self.controls = Controls()  # Refilled from the keyboard every frame
+        self.replay_dir = os.environ.get('HH_REPLAY_DIR')
+        
+        # Mission telemetry (written per mission when HH_TELEMETRY_DIR is set)
+        self.telemetry = None
+        self.telemetry_writer = None
+        telemetry_dir = os.environ.get('HH_TELEMETRY_DIR')
+        if telemetry_dir:
+            self.telemetry = MissionTelemetry()
+            self.telemetry_writer = TelemetryWriter(telemetry_dir)
+        
+        # Data hot reload (HH_HOT_RELOAD=1 watches config.yml and cities.json)
+        self.reloader = None
+        if os.environ.get('HH_HOT_RELOAD'):
+            self.reloader = DataReloader()
+            self.reloader.start()
         
-        # Generate initial contracts
+        # Generate initial contracts, then continue the saved company if there is one
         self.game_state.available_contracts = generate_contracts(self.cities)
+        self.save_path = os.path.join(default_save_dir(), SAVE_FILENAME)
+        self.autosave = AutosaveService(self.save_path)
+        self.autosave.start(self.game_state, self._load_game())
+        
+        # Mission and ledger history across sessions (HH_WORLD_DB=<path>)
+        self.world_store = None
+        self.replay_path = None
+        self.archived_ledger = len(self.game_state.ledger)
+        if os.environ.get('HH_WORLD_DB'):
+            self.world_store = WorldStore(os.environ['HH_WORLD_DB'])
+            try:
+                self.world_store.start()
+            except ValueError as e:
+                print(e)
+                self.world_store = None
+        self.analytics_scene.world_store = self.world_store
+    
+    def _load_game(self):
+        """Restore the saved company and its journal; returns the last journal sequence"""
+        try:
+            return recover(self.game_state, self.save_path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not load {self.save_path}: {e}")
+            return 0
     
     def handle_events(self):
         """Handle pygame events"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
+            elif self.profiler_overlay.handle_event(event) or self.capture.handle_event(event):
+                continue
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return False
@@ -54,10 +125,16 @@ class Game:
                 if self.game_state.scene == "contracts":
                     truck = self.contract_scene.handle_event(event, self.game_state)
                     if truck:  # Contract was selected
-                        self.truck = truck
+                        self._start_mission(truck)
+                elif self.game_state.scene == "analytics":
+                    self.analytics_scene.handle_event(event, self.game_state)
                 elif self.game_state.scene == "results":
                     if event.key == pygame.K_SPACE:
                         self._start_new_contracts()
+                    elif event.key == pygame.K_r:
+                        self._retry_mission(self.mission.checkpoints[0])
+                    elif event.key == pygame.K_c:
+                        self._retry_mission(self.mission.checkpoints[-1])
         
         return True
     
@@ -72,66 +149,103 @@ class Game:
         elif self.game_state.scene == "results":
             pass  # Results scene is static
     
+    def _start_mission(self, truck):
+        """Set up the mission simulation and start recording input"""
+        seed = random.randrange(2 ** 32)
+        random.seed(seed)
+        self.truck = truck
+        if self.reloader:
+            truck.stats.apply_config(get_config())  # Trucks default to the config loaded at startup
+        if self.telemetry:
+            self.telemetry.start({
+                'seed': seed,
+                'contract': contract_to_dict(self.game_state.current_contract),
+                'cash': self.game_state.cash,
+                'fuel': self.game_state.fuel
+            })
+        self.mission = MissionSimulation(self.game_state, truck, self.fuel_system, self.physics_system,
+                                         self.profiler, self.telemetry)
+        self.recorder.start(seed, self.game_state)
+    
+    def _retry_mission(self, checkpoint):
+        """Rewind the finished mission to a checkpoint and keep driving"""
+        self.mission.restore(checkpoint)
+        del self.recorder.inputs[checkpoint.ticks:]  # The replay stays valid from the mission start
+        self.recorder.result = None
+        self.game_state.mission_start_time = pygame.time.get_ticks() / 1000.0 - checkpoint.ticks / constants.FPS
+    
     def _update_driving(self, dt):
         """Update driving gameplay"""
-        # Safety check - ensure truck exists
-        if self.truck is None:
+        # Safety check - ensure mission exists
+        if self.mission is None:
             return
-            
-        keys = pygame.key.get_pressed()
-        
-        # Handle refueling
-        self.fuel_system.check_refuel_availability(self.game_state, self.truck)
-        if keys[pygame.K_r]:
-            self.fuel_system.attempt_refuel(self.game_state)
         
-        # Update truck physics
-        if self.game_state.fuel > 0:
-            self.truck.update(keys, dt)
-            self.fuel_system.update_fuel_consumption(self.game_state, self.truck)
-        else:
-            # Out of fuel - mission fails
-            self.game_state.switch_scene("results")
-            self._calculate_mission_results()
+        # Drive the simulation from the same bitmask that gets recorded
+        self.controls.mask = encode_keys(pygame.key.get_pressed())
+        self.recorder.record(self.controls.mask)
+        if self.mission.step(self.controls):
+            self._end_mission()
+    
+    def _end_mission(self):
+        """Finish the recording and save it if replays are enabled"""
+        self.recorder.finish(self.game_state)
+        if self.replay_dir:
+            os.makedirs(self.replay_dir, exist_ok=True)
+            filename = f"mission_{time.strftime('%Y%m%d_%H%M%S')}.hhr"
+            self.replay_path = os.path.join(self.replay_dir, filename)
+            self.recorder.save(self.replay_path)
+        if self.telemetry:
+            self.telemetry_writer.submit(*self.telemetry.export(self.recorder.result))
+    
+    def _apply_reload(self, update):
+        """Swap reloaded data tables into the running game between frames"""
+        if update is None:
             return
-        
-        # Physics and collision updates
-        self.physics_system.update_off_road_timer(self.game_state, self.truck, dt)
-        self.physics_system.check_bridge_collision(self.game_state, self.truck)
-        
-        # Check mission completion
-        elapsed_time = pygame.time.get_ticks() / 1000.0 - self.game_state.mission_start_time
-        dest_x, dest_y = self._get_destination_position()
-        
-        mission_complete = self.physics_system.check_delivery_completion(
-            self.game_state, self.truck, dest_x, dest_y
-        )
-        
-        deadline_exceeded = elapsed_time > self.game_state.current_contract.get_deadline_seconds()
-        
-        if mission_complete or deadline_exceeded:
-            self.game_state.switch_scene("results")
-            self._calculate_mission_results(elapsed_time)
+        if 'stats' in update and self.truck is not None:
+            self.truck.stats.apply_config(update['config'])
+        if 'cities' in update:
+            self.cities = update['cities']
+            self.contract_scene.cities = self.cities
+            self.analytics_scene.set_cities(self.cities)
+            self.game_state.available_contracts = generate_contracts(self.cities)
+        elif 'pricing' in update:
+            for contract in self.game_state.available_contracts:
+                contract.reprice(update['pricing'])
+            self.game_state.market_revision += 1  # Journal the new payouts
+        if 'pricing' in update or 'stats' in update:
+            self.contract_scene.quote_engine.clear()
     
-    def _get_destination_position(self):
-        """Get destination position on screen"""
-        dest_x = self.game_state.current_contract.destination['x'] * 6
-        dest_y = self.game_state.current_contract.destination['y'] * 1.2
-        return dest_x, dest_y
+    def _commit_mission(self):
+        """Record the final attempt of the finished mission once it can no longer be retried"""
+        if self.game_state.scene == "results" and self.recorder.result is not None:
+            self.game_state.completed_contracts.append({
+                'contract': contract_to_dict(self.game_state.current_contract),
+                'result': self.recorder.result
+            })
+        self._archive_mission()
     
-    def _calculate_mission_results(self, mission_time=0):
-        """Calculate and store mission results"""
-        time_remaining = max(0, self.game_state.current_contract.get_deadline_seconds() - mission_time)
-        time_bonus = int(time_remaining * 10) if self.game_state.mission_completed else 0
-        penalties = sum(self.game_state.mission_penalties)
-        
-        payment = self.game_state.complete_mission(mission_time, time_bonus, self.game_state.mission_penalties)
+    def _archive_mission(self):
+        """Store the final attempt of the finished mission and new ledger entries in the world store"""
+        if self.world_store is None:
+            return
+        if self.game_state.scene == "results" and self.recorder.result is not None:
+            replay = None
+            if self.replay_path:
+                replay = (self.replay_path, self.recorder.header['seed'], len(self.recorder.inputs))
+            self.world_store.add_mission(contract_to_save(self.game_state.current_contract),
+                                         self.recorder.result, replay)
+        ledger = self.game_state.ledger
+        self.archived_ledger = min(self.archived_ledger, len(ledger))
+        self.world_store.add_ledger_entries(ledger.entry(i) for i in range(self.archived_ledger, len(ledger)))
+        self.archived_ledger = len(ledger)
+        self.replay_path = None
     
     def _start_new_contracts(self):
         """Generate new contracts and return to contract selection"""
+        self._commit_mission()  # Retries are no longer possible
         self.game_state.switch_scene("contracts")
         self.game_state.available_contracts = generate_contracts(self.cities)
-        self.game_state.fuel = STARTING_FUEL  # Refuel between missions
+        end_mission(self.game_state)
     
     def render(self):
         """Render the current scene"""
@@ -143,6 +257,11 @@ class Game:
             
         elif self.game_state.scene == "results":
             self._render_results()
+            
+        elif self.game_state.scene == "analytics":
+            self.analytics_scene.render(self.screen, self.game_state)
+        
+        self.profiler_overlay.render(self.screen)
     
     def _render_driving(self):
         """Render driving scene"""
@@ -150,28 +269,31 @@ class Game:
         if self.truck is None:
             return
             
-        self.screen.fill(GRASS_GREEN)
+        profiler = self.profiler
         
         # Render world elements
-        self.physics_system.render_roads(self.screen)
-        self.fuel_system.render_fuel_stations(self.screen, self.fonts)
-        self.physics_system.render_bridge(self.screen, self.fonts)
-        
-        # Render destination
-        dest_x, dest_y = self._get_destination_position()
-        self._render_destination(dest_x, dest_y)
+        with profiler.scope('world'):
+            self.screen.fill(GRASS_GREEN)
+            self.physics_system.render_roads(self.screen)
+            self.fuel_system.render_fuel_stations(self.screen, self.fonts)
+            self.physics_system.render_bridge(self.screen, self.fonts)
+            
+            # Render destination
+            dest_x, dest_y = self.mission.get_destination_position()
+            self._render_destination(dest_x, dest_y)
         
         # Render truck
-        self.truck.draw(self.screen)
+        with profiler.scope('truck draw'):
+            self.truck.draw(self.screen)
         
-        # Render interactive elements
-        self.fuel_system.render_refuel_prompts(self.screen, self.fonts, self.game_state, self.truck)
-        self.physics_system.render_collision_warnings(self.screen, self.fonts, self.game_state, self.truck)
-        
-        # Render HUD
-        elapsed_time = pygame.time.get_ticks() / 1000.0 - self.game_state.mission_start_time
-        on_road = self.physics_system.is_on_road(self.truck)
-        self.hud.render_driving_hud(self.screen, self.game_state, self.truck, elapsed_time, dest_x, dest_y, on_road)
+        # Render interactive elements and HUD
+        with profiler.scope('hud'):
+            self.fuel_system.render_refuel_prompts(self.screen, self.fonts, self.game_state, self.truck)
+            self.physics_system.render_collision_warnings(self.screen, self.fonts, self.game_state, self.truck)
+            
+            elapsed_time = self.mission.elapsed_time
+            on_road = self.physics_system.is_on_road(self.truck)
+            self.hud.render_driving_hud(self.screen, self.game_state, self.truck, elapsed_time, dest_x, dest_y, on_road)
     
     def _render_destination(self, dest_x, dest_y):
         """Render pulsing destination marker"""
@@ -201,7 +323,7 @@ class Game:
         else:
             title_text = self.fonts['title'].render("MISSION FAILED", True, RED)
         
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
+        title_rect = title_text.get_rect(center=(constants.SCREEN_WIDTH // 2, 100))
         self.screen.blit(title_text, title_rect)
         
         # Results breakdown
@@ -246,24 +368,48 @@ class Game:
         self.screen.blit(final_cash_text, (100, y_offset + 20))
         
         # Continue instruction
-        continue_text = self.fonts['normal'].render("Press SPACE for new contract | ESC to quit", True, WHITE)
-        self.screen.blit(continue_text, (200, 500))
+        continue_text = self.fonts['normal'].render("SPACE: new contract | R: retry | C: last checkpoint | ESC: quit", True, WHITE)
+        self.screen.blit(continue_text, (160, 500))
     
     def run(self):
         """Main game loop"""
         running = True
+        self.gc_control.after_load()
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            dt = self.clock.tick(constants.FPS) / 1000.0
+            if self.reloader:
+                self._apply_reload(self.reloader.poll())
             
-            running = self.handle_events()
+            self.gc_control.begin_frame(self.game_state.scene)
+            self.capture.begin_frame()
+            with self.profiler.scope('events'):
+                running = self.handle_events()
             if not running:
                 break
             
-            self.update(dt)
-            self.render()
+            with self.profiler.scope('update'):
+                self.update(dt)
+            with self.profiler.scope('render'):
+                self.render()
             
-            pygame.display.flip()
+            with self.profiler.scope('present'):
+                pygame.display.flip()
+            self.profiler.end_frame()
+            self.capture.end_frame(self.game_state.scene)
+            self.autosave.track(self.game_state)
+            self.gc_control.end_frame()
         
+        self.capture.close(self.game_state.scene)
+        self._commit_mission()
+        self.autosave.close(self.game_state)
+        if self.world_store:
+            self.world_store.close()
+        if self.telemetry_writer:
+            self.telemetry_writer.close()
+        if self.reloader:
+            self.reloader.stop()
+        self.contract_scene.quote_engine.shutdown()
+        self.gc_control.shutdown()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,30 @@
+"""
+Android Build Hook
+python-for-android hook (buildozer.spec p4a.hook) that bundles the compiled config
+
+Devices have no PyYAML, so the build compiles data/config.yml into
+data/config.bin inside the app sources buildozer hands to p4a. The build
+fails if the config cannot be compiled, rather than shipping without it.
+"""
+import os
+import subprocess
+import sys
+
+def _app_dir(toolchain):
+    """Find the app source directory passed to p4a with --private"""
+    private = getattr(toolchain.args, 'private', None)
+    unknown_args = getattr(toolchain.args, 'unknown_args', None) or []
+    for i, arg in enumerate(unknown_args):
+        if arg == '--private' and i + 1 < len(unknown_args):
+            private = unknown_args[i + 1]
+        elif arg.startswith('--private='):
+            private = arg.split('=', 1)[1]
+    if not private or not os.path.isfile(os.path.join(private, 'data', 'config.yml')):
+        raise RuntimeError(f"Cannot find data/config.yml in the app sources ({private!r})")
+    return private
+
+def before_apk_build(toolchain):
+    """Write data/config.bin into the app sources before they are packaged"""
+    subprocess.check_call([sys.executable, '-m', 'data.config'], cwd=_app_dir(toolchain))
+
+before_aab_build = before_apk_build
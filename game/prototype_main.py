@@ -14,6 +14,7 @@ try:
     from core.engine import GameEngine, Scene, GameState, Config
     from core.ui import HUD, Button
     from systems.driving import Environment, DeliveryZone, CollisionSystem
+    from sim.stats import StatsPipeline
 except ImportError as e:
     print(f"Import error: {e}")
     print("Running simplified standalone version...")
@@ -26,10 +27,15 @@ class Truck:
         self.y = y
         self.angle = 0  # Facing right initially
         self.speed = 0
-        self.max_speed = Config.TRUCK_MAX_SPEED
-        self.acceleration = Config.TRUCK_ACCELERATION
-        self.deceleration = Config.TRUCK_DECELERATION
-        self.turn_speed = Config.TRUCK_TURN_SPEED
+        self.stats = StatsPipeline(
+            max_speed=Config.TRUCK_MAX_SPEED,
+            acceleration=Config.TRUCK_ACCELERATION,
+            deceleration=Config.TRUCK_DECELERATION,
+            turn_speed=Config.TRUCK_TURN_SPEED,
+            reverse_speed_multiplier=0.5,
+            fuel_drain_rate=Config.FUEL_DRAIN_RATE,
+            fuel_capacity=Config.FUEL_CAPACITY
+        )
         
         # Truck components
         self.cab_width = 35
@@ -37,31 +43,29 @@ class Truck:
         self.trailer_width = 50
         self.trailer_height = 15
         
-        # Physics state
-        self.speed_multiplier = 1.0
-        
-    def update(self, keys, dt, speed_multiplier=1.0):
+    def update(self, keys, dt):
         """Update truck position and rotation based on input"""
-        self.speed_multiplier = speed_multiplier
+        # Surface, upgrade and cargo effects are already folded into the stats
+        stats = self.stats.effective
         
         # Acceleration/Deceleration
         if keys[pygame.K_UP] or keys[pygame.K_w]:
-            self.speed = min(self.speed + self.acceleration, self.max_speed * speed_multiplier)
+            self.speed = min(self.speed + stats.acceleration, stats.max_speed)
         elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            self.speed = max(self.speed - self.acceleration, -self.max_speed * 0.5 * speed_multiplier)
+            self.speed = max(self.speed - stats.acceleration, -stats.reverse_speed)
         else:
             # Natural deceleration
             if self.speed > 0:
-                self.speed = max(0, self.speed - self.deceleration)
+                self.speed = max(0, self.speed - stats.deceleration)
             elif self.speed < 0:
-                self.speed = min(0, self.speed + self.deceleration)
+                self.speed = min(0, self.speed + stats.deceleration)
         
         # Turning (only when moving)
         if abs(self.speed) > 0.1:
             if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                self.angle -= self.turn_speed
+                self.angle -= stats.turn_speed
             if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                self.angle += self.turn_speed
+                self.angle += stats.turn_speed
         
         # Movement
         if abs(self.speed) > 0.05:
@@ -163,7 +167,6 @@ class DrivingScene(Scene):
         self.mission_completed = False
         
         # Game state
-        self.fuel_consumption_rate = Config.FUEL_DRAIN_RATE
         self.penalties_this_mission = []
         
         # Initialize mission
@@ -190,6 +193,7 @@ class DrivingScene(Scene):
         
         if self.engine.player_data['cash'] >= cost:
             self.engine.player_data['cash'] -= int(cost)
+            self.engine.ledger.record('fuel', -int(cost))
             self.engine.player_data['fuel'] = 100.0
             self.hud.add_status_message(f"Refueled! Cost: ${cost:.0f}", (255, 255, 0))
         else:
@@ -200,8 +204,11 @@ class DrivingScene(Scene):
         if not self.mission_active:
             return
         
+        profiler = self.engine.profiler
+        
         # Check collisions first
-        collision_results = self.collision_system.check_truck_collisions(self.truck, self.engine.player_data)
+        with profiler.scope('collision'):
+            collision_results = self.collision_system.check_truck_collisions(self.truck, self.engine.player_data)
         
         # Handle bridge strikes (mission failure)
         if collision_results['bridge_strike']:
@@ -209,21 +216,22 @@ class DrivingScene(Scene):
             self.hud.add_status_message("MISSION FAILED! Bridge Strike!", (255, 0, 0), 5.0)
             for penalty_text, penalty_amount in collision_results['penalties']:
                 self.engine.player_data['cash'] -= penalty_amount
+                self.engine.ledger.record('penalty', -penalty_amount)
                 self.penalties_this_mission.append((penalty_text, penalty_amount))
             return
         
-        # Update truck with speed multiplier for off-road
+        # Update truck with the surface it is on (slower and thirstier off-road)
+        self.truck.stats.set_surface(collision_results['surface'])
         if self.engine.player_data['fuel'] > 0:
-            self.truck.update(keys, dt, collision_results['speed_multiplier'])
+            with profiler.scope('truck'):
+                self.truck.update(keys, dt)
             
-            # Fuel consumption (more when moving, extra when off-road)
-            if abs(self.truck.speed) > 0.1:
-                consumption = self.fuel_consumption_rate * (1 + abs(self.truck.speed) / 5)
-                if collision_results['off_road']:
-                    consumption *= 1.5  # Extra fuel consumption off-road
-                    
-                self.engine.player_data['fuel'] -= consumption
-                self.engine.player_data['fuel'] = max(0, self.engine.player_data['fuel'])
+            # Fuel consumption (more when moving)
+            with profiler.scope('fuel'):
+                if abs(self.truck.speed) > 0.1:
+                    consumption = self.truck.stats.effective.fuel_drain_rate * (1 + abs(self.truck.speed) / 5)
+                    self.engine.player_data['fuel'] -= consumption
+                    self.engine.player_data['fuel'] = max(0, self.engine.player_data['fuel'])
         else:
             # Out of fuel
             self.truck.speed = 0
@@ -261,7 +269,8 @@ class DrivingScene(Scene):
                 self.complete_mission()
         
         # Update HUD
-        self.hud.update(dt, self.engine.player_data, self.truck)
+        with profiler.scope('hud update'):
+            self.hud.update(dt, self.engine.player_data, self.truck)
     
     def complete_mission(self):
         """Complete the delivery mission"""
@@ -277,6 +286,12 @@ class DrivingScene(Scene):
         final_payment = max(0, total_payment - total_penalties)
         
         self.engine.player_data['cash'] += final_payment
+        ledger = self.engine.ledger
+        ledger.record('payout', base_payment)
+        if time_bonus:
+            ledger.record('time_bonus', time_bonus)
+        if final_payment < total_payment:
+            ledger.record('penalty', final_payment - total_payment)
         
         # Show completion message
         self.hud.add_status_message(f"DELIVERY COMPLETE! Payment: ${final_payment:,}", (0, 255, 0), 5.0)
@@ -288,17 +303,22 @@ class DrivingScene(Scene):
     
     def render(self):
         """Render the driving scene"""
-        # Render environment
-        self.environment.render(self.screen, self.engine.colors, self.engine.get_font('medium'))
+        profiler = self.engine.profiler
         
-        # Render delivery zone
-        self.delivery_zone.render(self.screen, self.engine.colors, self.engine.get_font('medium'))
+        # Render environment
+        with profiler.scope('world'):
+            self.environment.render(self.screen, self.engine.colors, self.engine.get_font('medium'))
+            
+            # Render delivery zone
+            self.delivery_zone.render(self.screen, self.engine.colors, self.engine.get_font('medium'))
         
         # Render truck
-        self.truck.draw(self.screen, self.engine.colors)
+        with profiler.scope('truck draw'):
+            self.truck.draw(self.screen, self.engine.colors)
         
         # Render HUD
-        self.hud.render(self.screen)
+        with profiler.scope('hud'):
+            self.hud.render(self.screen)
         
         # Mission status
         if self.mission_completed:
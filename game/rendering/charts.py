@@ -0,0 +1,135 @@
+"""
+Chart Rendering
+Time-series line charts drawn from downsampled data into cached surfaces
+
+A chart only ever draws about one point per horizontal pixel: lttb() reduces
+long series with the largest-triangle-three-buckets method, which keeps the
+peaks and dips a plain stride would skip. The finished chart (frame, line and
+labels) is rendered once into its own surface and reused until the data key
+passed to render() changes, so a frame costs one blit however long the series.
+"""
+import time
+import numpy as np
+import pygame
+from core.constants import *
+
+def lttb(x, y, threshold):
+    """Reduce (x, y) to `threshold` points with largest-triangle-three-buckets
+
+    The first and last points are kept. Every bucket in between contributes
+    the point forming the largest triangle with the point picked from the
+    previous bucket and the average of the next one.
+    """
+    count = len(x)
+    if threshold >= count or threshold < 3:
+        return x, y
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Bucket boundaries for the points between the first and the last
+    edges = (np.arange(threshold - 1) * ((count - 2) / (threshold - 2))).astype(np.int64) + 1
+    edges[-1] = count - 1
+    sums_x = np.add.reduceat(x, edges[:-1])
+    sums_y = np.add.reduceat(y, edges[:-1])
+    sizes = np.diff(edges)
+    # Average of each following bucket; the last bucket looks ahead to the final point
+    next_x = np.append(sums_x[1:] / sizes[1:], x[-1])
+    next_y = np.append(sums_y[1:] / sizes[1:], y[-1])
+
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0] = 0
+    picked[-1] = count - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # Twice the triangle area, without the constant 1/2
+        areas = np.abs((x[previous] - next_x[bucket]) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (next_y[bucket] - y[previous]))
+        previous = start + int(areas.argmax())
+        picked[bucket + 1] = previous
+    return x[picked], y[picked]
+
+def format_value(value, prefix=''):
+    """Format an axis label compactly (1.2k, 3.4M)"""
+    sign = '-' if value < 0 else ''
+    magnitude = abs(value)
+    for divisor, suffix in ((1e9, 'B'), (1e6, 'M'), (1e3, 'k')):
+        if magnitude >= divisor:
+            return f"{sign}{prefix}{magnitude / divisor:.1f}{suffix}"
+    if magnitude >= 10 or magnitude == int(magnitude):
+        return f"{sign}{prefix}{magnitude:,.0f}"
+    return f"{sign}{prefix}{magnitude:.2f}"
+
+def format_time(stamp, span):
+    """Format a time axis label with the precision the span needs"""
+    if span > 300 * 86400:
+        return time.strftime('%Y-%m-%d', time.localtime(stamp))
+    return time.strftime('%b %d %H:%M', time.localtime(stamp))
+
+class TimeSeriesChart:
+    """Line chart of one series over time, cached as a surface"""
+
+    def __init__(self, rect, title, color, fonts, prefix='$'):
+        self.rect = pygame.Rect(rect)
+        self.title = title
+        self.color = color
+        self.fonts = fonts
+        self.prefix = prefix  # Put before values in labels
+        self.key = None
+        self.surface = None
+
+    def render(self, screen, key, series):
+        """Blit the chart, redrawing it only when `key` differs from the last call
+
+        series is called with no arguments to get (times, values) when a redraw
+        is needed; times are Unix timestamps.
+        """
+        if self.surface is None or key != self.key:
+            self.surface = self._draw(*series())
+            self.key = key
+        screen.blit(self.surface, self.rect)
+
+    def _draw(self, times, values):
+        """Render the frame, line and labels into a new surface"""
+        surface = pygame.Surface(self.rect.size)
+        surface.fill(BLACK)
+        width, height = self.rect.size
+        pygame.draw.rect(surface, DARK_GRAY, surface.get_rect(), border_radius=6)
+        title = self.fonts['small'].render(self.title, True, WHITE)
+        surface.blit(title, (10, 6))
+
+        plot = pygame.Rect(60, 28, width - 75, height - 50)
+        pygame.draw.rect(surface, GRAY, plot, 1)
+        if len(times) == 0:
+            empty = self.fonts['small'].render("No transactions yet", True, LIGHT_GRAY)
+            surface.blit(empty, empty.get_rect(center=plot.center))
+            return surface
+
+        times, values = lttb(times, values, plot.width)
+        latest = self.fonts['small'].render(f"Now: {format_value(values[-1], self.prefix)}", True, self.color)
+        surface.blit(latest, (width - latest.get_width() - 12, 6))
+
+        low, high = float(values.min()), float(values.max())
+        if high == low:
+            low, high = low - 1, high + 1
+        start, end = float(times[0]), float(times[-1])
+        span = end - start or 1.0
+        xs = plot.left + (times - start) * ((plot.width - 1) / span)
+        ys = plot.bottom - 1 - (values - low) * ((plot.height - 1) / (high - low))
+        if low < 0 < high:
+            zero_y = plot.bottom - 1 - (0 - low) * ((plot.height - 1) / (high - low))
+            pygame.draw.line(surface, GRAY, (plot.left, zero_y), (plot.right - 1, zero_y))
+        if len(xs) > 1:
+            pygame.draw.lines(surface, self.color, False, np.column_stack((xs, ys)).tolist(), 2)
+        else:
+            pygame.draw.circle(surface, self.color, (int(xs[0]), int(ys[0])), 3)
+
+        # Axis labels
+        small = self.fonts['small']
+        for value, y in ((high, plot.top), (low, plot.bottom - 12)):
+            label = small.render(format_value(value, self.prefix), True, LIGHT_GRAY)
+            surface.blit(label, (plot.left - label.get_width() - 6, y))
+        for stamp, x, align in ((start, plot.left, 'left'), (end, plot.right, 'right')):
+            label = small.render(format_time(stamp, span), True, LIGHT_GRAY)
+            surface.blit(label, (x if align == 'left' else x - label.get_width(), plot.bottom + 4))
+        return surface
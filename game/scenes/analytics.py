@@ -0,0 +1,147 @@
+"""
+Finance Analytics Scene
+Cash, revenue per mile and fuel spend over time, charted from the ledger
+
+With a world store (HH_WORLD_DB), H switches to the mission history of every
+session, read one page at a time through the store's keyset-paginated
+queries. A page is only queried when it is opened, never per frame.
+"""
+import sqlite3
+import time
+import numpy as np
+import pygame
+from scenes.base_scene import BaseScene
+from core import constants
+from core.constants import *
+from rendering.charts import TimeSeriesChart
+from systems.economy import CATEGORY_CODES
+from systems.pricing import get_pricing
+
+HISTORY_ROWS = 18  # Missions per history page
+
+class AnalyticsScene(BaseScene):
+    """Company performance charts"""
+
+    def __init__(self, fonts, cities, world_store=None):
+        super().__init__(fonts)
+        self.cities = cities
+        self.world_store = world_store  # Optional WorldStore for the mission history
+        self.show_history = False
+        self.history = []        # Missions on the open history page
+        self.history_pages = []  # `before` id of every page up to the open one
+        self.history_more = False
+        self.lane_miles = {}  # Lane name -> route distance
+        self.cash_chart = TimeSeriesChart((20, 60, constants.SCREEN_WIDTH - 40, 170), "Cash", GREEN, fonts)
+        self.rate_chart = TimeSeriesChart((20, 240, constants.SCREEN_WIDTH - 40, 170), "Revenue per Mile", YELLOW, fonts)
+        self.fuel_chart = TimeSeriesChart((20, 420, constants.SCREEN_WIDTH - 40, 170), "Fuel Spend (cumulative)",
+                                          ORANGE, fonts)
+
+    def set_cities(self, cities):
+        """Use a reloaded city list for lane distances"""
+        self.cities = cities
+        self.lane_miles.clear()
+        self.rate_chart.key = None
+
+    def handle_event(self, event, game_state):
+        """Return to contract selection, or toggle and page the mission history"""
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key in (pygame.K_a, pygame.K_BACKSPACE):
+            self.show_history = False
+            game_state.switch_scene("contracts")
+        elif event.key == pygame.K_h and self.world_store is not None:
+            self.show_history = not self.show_history
+            if self.show_history:
+                self._load_history([None])
+        elif self.show_history and event.key in (pygame.K_RIGHT, pygame.K_PAGEDOWN) and self.history_more:
+            self._load_history(self.history_pages + [self.history[-1]['id']])
+        elif self.show_history and event.key in (pygame.K_LEFT, pygame.K_PAGEUP) and len(self.history_pages) > 1:
+            self._load_history(self.history_pages[:-1])
+
+    def _load_history(self, pages):
+        """Query the history page that starts before the last id in pages"""
+        try:
+            rows = self.world_store.missions(before=pages[-1], limit=HISTORY_ROWS + 1)
+        except sqlite3.Error as e:
+            print(f"World store query failed: {e}")
+            rows = []
+        self.history = rows[:HISTORY_ROWS]
+        self.history_more = len(rows) > HISTORY_ROWS
+        self.history_pages = pages
+
+    def render(self, screen, game_state):
+        """Render the charts (each is redrawn only when the ledger changes)"""
+        screen.fill(BLACK)
+        if self.show_history:
+            self._render_history(screen)
+            return
+        title_text = self.fonts['large'].render("Company Finances", True, WHITE)
+        screen.blit(title_text, title_text.get_rect(center=(constants.SCREEN_WIDTH // 2, 20)))
+        hint = "A or BACKSPACE to return to contracts"
+        if self.world_store is not None:
+            hint += ", H for mission history"
+        hint_text = self.fonts['small'].render(hint, True, LIGHT_GRAY)
+        screen.blit(hint_text, hint_text.get_rect(center=(constants.SCREEN_WIDTH // 2, 45)))
+
+        ledger = game_state.ledger
+        key = (id(ledger), ledger.revision)
+        starting_cash = game_state.cash - ledger.total.profit
+        self.cash_chart.render(screen, key + (starting_cash,), lambda: self._cash_series(ledger, starting_cash))
+        self.rate_chart.render(screen, key, lambda: self._rate_series(ledger))
+        self.fuel_chart.render(screen, key, lambda: self._fuel_series(ledger))
+
+    def _render_history(self, screen):
+        """Render the open page of the mission history"""
+        title_text = self.fonts['large'].render(f"Mission History (page {len(self.history_pages)})", True, WHITE)
+        screen.blit(title_text, title_text.get_rect(center=(constants.SCREEN_WIDTH // 2, 20)))
+        hint_text = self.fonts['small'].render("LEFT/RIGHT to page, H for charts, A to return to contracts",
+                                               True, LIGHT_GRAY)
+        screen.blit(hint_text, hint_text.get_rect(center=(constants.SCREEN_WIDTH // 2, 45)))
+        if not self.history:
+            empty_text = self.fonts['normal'].render("No missions recorded yet", True, LIGHT_GRAY)
+            screen.blit(empty_text, empty_text.get_rect(center=(constants.SCREEN_WIDTH // 2, 120)))
+            return
+
+        y = 75
+        for mission in self.history:
+            when = time.strftime('%m-%d %H:%M', time.localtime(mission['time']))
+            outcome = f"{mission['mission_time']:.0f}s" if mission['completed'] else "failed"
+            color = WHITE if mission['completed'] else ORANGE
+            for x, text in ((20, when), (130, f"{mission['origin']} to {mission['destination']}"), (470, mission['cargo_type']),
+                            (580, f"${mission['payout']:,}"), (700, outcome)):
+                cell_text = self.fonts['small'].render(text, True, color)
+                screen.blit(cell_text, (x, y))
+            y += 28
+
+    def _cash_series(self, ledger, starting_cash):
+        """Get cash after every transaction"""
+        rows = ledger.view()
+        return rows['time'], starting_cash + np.cumsum(rows['amount'])
+
+    def _rate_series(self, ledger):
+        """Get payout per mile for every delivery"""
+        rows = ledger.view()
+        payouts = rows['category'] == CATEGORY_CODES['payout']
+        miles = np.array([self._miles(lane) for lane in ledger.lanes] + [np.nan])
+        distance = miles[rows['lane'][payouts]]  # Lane -1 picks the trailing NaN
+        known = distance > 0
+        return rows['time'][payouts][known], rows['amount'][payouts][known] / distance[known]
+
+    def _fuel_series(self, ledger):
+        """Get total fuel spend after every refuel"""
+        rows = ledger.view()
+        fuel = rows['category'] == CATEGORY_CODES['fuel']
+        return rows['time'][fuel], np.cumsum(-rows['amount'][fuel])
+
+    def _miles(self, lane):
+        """Get a lane's route distance (NaN for cities no longer on the map)"""
+        miles = self.lane_miles.get(lane)
+        if miles is None:
+            cities = {city['name']: city for city in self.cities}
+            origin, _, destination = lane.partition(' → ')
+            if origin in cities and destination in cities:
+                miles = get_pricing().distance(cities[origin], cities[destination])
+            else:
+                miles = np.nan
+            self.lane_miles[lane] = miles
+        return miles
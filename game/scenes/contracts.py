@@ -3,9 +3,15 @@ Contract Selection Scene
 """
 import pygame
 from scenes.base_scene import BaseScene
+from core import constants
 from core.constants import *
 from data.loader import generate_contracts
 from entities.truck import Truck
+from systems.contracts import LoadChainPlanner
+from systems.mission import begin_mission
+from systems.quotes import QuoteEngine
+
+CHAIN_ROWS = 3  # Best load chains listed under the cards
 
 class ContractScene(BaseScene):
     """Contract selection screen"""
@@ -13,6 +19,10 @@ class ContractScene(BaseScene):
     def __init__(self, fonts, cities):
         super().__init__(fonts)
         self.cities = cities
+        self.quote_engine = QuoteEngine()
+        self.chain_planner = None  # LoadChainPlanner for self.cities, built on first use
+        self.chains = []
+        self._chains_key = None
     
     def handle_event(self, event, game_state):
         """Handle contract selection input"""
@@ -23,13 +33,13 @@ class ContractScene(BaseScene):
                 return self._select_contract(game_state, 1)
             elif event.key == pygame.K_3 and len(game_state.available_contracts) > 2:
                 return self._select_contract(game_state, 2)
+            elif event.key == pygame.K_a:
+                game_state.switch_scene("analytics")
         return None
     
     def _select_contract(self, game_state, index):
         """Select a contract and transition to driving"""
-        game_state.current_contract = game_state.available_contracts[index]
-        game_state.switch_scene("driving")
-        game_state.reset_mission_state()
+        begin_mission(game_state, game_state.available_contracts[index])
         game_state.mission_start_time = pygame.time.get_ticks() / 1000.0
         
         # Create truck at safe starting position
@@ -47,7 +57,7 @@ class ContractScene(BaseScene):
         
         # Title
         title_text = self.fonts['title'].render("Select Rate Confirmation", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        title_rect = title_text.get_rect(center=(constants.SCREEN_WIDTH // 2, 50))
         screen.blit(title_text, title_rect)
         
         # Cash
@@ -58,8 +68,52 @@ class ContractScene(BaseScene):
         self._render_contract_cards(screen, game_state)
         
         # Instructions
-        instruction_text = self.fonts['normal'].render("Press 1, 2, or 3 to select Rate Con", True, WHITE)
+        instruction_text = self.fonts['normal'].render("Press 1, 2, or 3 to select Rate Con | A: finances", True, WHITE)
         screen.blit(instruction_text, (250, 350))
+        
+        self._render_chains(screen, game_state)
+    
+    def _plan_chains(self, game_state):
+        """Get the best load chains on the board, re-planned only when the board, prices or cities change"""
+        contracts = game_state.available_contracts
+        start = self._truck_city(game_state)
+        key = (id(self.cities), id(contracts), game_state.market_revision, start['name'] if start else None)
+        if key == self._chains_key:
+            return self.chains
+        if self.chain_planner is None or self.chain_planner.cities is not self.cities:
+            self.chain_planner = LoadChainPlanner(self.cities)
+        
+        # Without a last delivery, a chain may start at any pickup on the board
+        starts = [start] if start is not None else list({c.origin['name']: c.origin for c in contracts}.values())
+        chains = []
+        for city in starts:
+            chains.extend(self.chain_planner.plan(city, contracts, top_n=CHAIN_ROWS))
+        chains.sort(key=lambda chain: chain['profit'], reverse=True)
+        self.chains = chains[:CHAIN_ROWS]
+        self._chains_key = key
+        return self.chains
+    
+    def _truck_city(self, game_state):
+        """Get the city of the last delivery, where the truck now is (None before the first one)"""
+        if not game_state.completed_contracts:
+            return None
+        name = game_state.completed_contracts[-1]['contract']['destination']['name']
+        return next((city for city in self.cities if city['name'] == name), None)
+    
+    def _render_chains(self, screen, game_state):
+        """List the most profitable chains of contracts on the board"""
+        chains = self._plan_chains(game_state)
+        if not chains:
+            return
+        contracts = game_state.available_contracts
+        heading_text = self.fonts['normal'].render("Best load chains", True, WHITE)
+        screen.blit(heading_text, (50, 390))
+        for i, chain in enumerate(chains):
+            stops = " then ".join(f"#{contracts.index(contract) + 1}" for contract in chain['contracts'])
+            chain_text = self.fonts['small'].render(
+                f"{stops}: ${chain['profit']:,.0f} net in {chain['hours']:.1f}h "
+                f"({chain['deadhead_miles']:,.0f} mi empty)", True, LIGHT_GRAY)
+            screen.blit(chain_text, (50, 420 + i * 22))
     
     def _render_contract_cards(self, screen, game_state):
         """Render individual contract cards"""
@@ -105,6 +159,18 @@ class ContractScene(BaseScene):
             # Payment
             payment_surface = self.fonts['normal'].render(f"${contract.payout:,}", True, GREEN)
             screen.blit(payment_surface, (card_x + 10, y_offset))
+            y_offset += 22
+            
+            # Estimated net profit (filled in once the quote is ready)
+            quote = self.quote_engine.get_quote(contract)
+            if quote is None:
+                quote_surface = self.fonts['small'].render("Est. net: quoting...", True, LIGHT_GRAY)
+            else:
+                margin = (quote['high'] - quote['low']) / 2
+                quote_color = GREEN if quote['expected_profit'] > 0 else RED
+                quote_surface = self.fonts['small'].render(
+                    f"Est. net: ${quote['expected_profit']:,.0f} ± {margin:,.0f}", True, quote_color)
+            screen.blit(quote_surface, (card_x + 10, y_offset))
             
             # Number to select
             number_text = self.fonts['large'].render(str(i + 1), True, WHITE)
@@ -0,0 +1 @@
+# Frontend-agnostic simulation core (no pygame or Kivy imports)
@@ -0,0 +1,83 @@
+"""
+Mission Checkpoints
+Immutable snapshots of a running mission for instant retries
+
+A checkpoint holds only numbers, strings and tuples: the truck's position and
+stats inputs, the mission-related GameState fields, the simulation tick, the
+random module's state and the ledger and telemetry positions. Nothing in it
+is ever mutated, so checkpoints share data freely (stats keys, RNG state tuples and penalty
+tuples are referenced, not copied) and one checkpoint can be restored any
+number of times. Restoring writes the values back into the existing truck,
+GameState and simulation; no scene, truck or system is rebuilt.
+"""
+import random
+
+class MissionCheckpoint:
+    """Snapshot of the mission state at one simulation tick"""
+
+    __slots__ = ('label', 'ticks', 'truck', 'stats', 'cash', 'fuel', 'ledger', 'penalties', 'flags',
+                 'off_road_time', 'rng_state', 'telemetry')
+
+    def __init__(self, label, ticks, truck, stats, cash, fuel, ledger, penalties, flags, off_road_time,
+                 rng_state, telemetry):
+        self.label = label
+        self.ticks = ticks
+        self.truck = truck              # (x, y, angle, speed)
+        self.stats = stats              # (upgrade levels, surface, weather, cargo type)
+        self.cash = cash
+        self.fuel = fuel
+        self.ledger = ledger            # Ledger entry count
+        self.penalties = penalties      # Tuple of penalty amounts so far
+        self.flags = flags              # (mission completed, bridge penalty applied, refuel available)
+        self.off_road_time = off_road_time
+        self.rng_state = rng_state
+        self.telemetry = telemetry      # MissionTelemetry.mark(), or None
+
+    def __repr__(self):
+        return f"MissionCheckpoint({self.label!r}, tick={self.ticks})"
+
+    @classmethod
+    def capture(cls, mission, label):
+        """Snapshot a MissionSimulation"""
+        game_state = mission.game_state
+        truck = mission.truck
+        stats = truck.stats
+        return cls(
+            label,
+            mission.ticks,
+            (truck.x, truck.y, truck.angle, truck.speed),
+            (stats.upgrade_levels, stats.surface, stats.weather, stats.cargo_type),
+            game_state.cash,
+            game_state.fuel,
+            len(game_state.ledger),
+            tuple(game_state.mission_penalties),
+            (game_state.mission_completed, game_state.bridge_penalty_applied, game_state.refuel_available),
+            game_state.off_road_warning_time,
+            random.getstate(),
+            mission.telemetry.mark() if mission.telemetry is not None else None
+        )
+
+    def restore(self, mission):
+        """Put a MissionSimulation back exactly as it was when captured"""
+        game_state = mission.game_state
+        truck = mission.truck
+        truck.x, truck.y, truck.angle, truck.speed = self.truck
+        upgrade_levels, surface, weather, cargo_type = self.stats
+        truck.stats.set_upgrades(upgrade_levels)  # Setters reuse the already compiled records
+        truck.stats.set_surface(surface)
+        truck.stats.set_weather(weather)
+        truck.stats.set_cargo(cargo_type)
+
+        game_state.cash = self.cash
+        game_state.fuel = self.fuel
+        game_state.ledger.truncate(self.ledger)
+        game_state.mission_penalties = list(self.penalties)
+        game_state.mission_completed, game_state.bridge_penalty_applied, game_state.refuel_available = self.flags
+        game_state.off_road_warning_time = self.off_road_time
+        game_state.switch_scene("driving")
+        random.setstate(self.rng_state)
+
+        mission.ticks = self.ticks
+        mission.finished = False
+        if mission.telemetry is not None and self.telemetry is not None:
+            mission.telemetry.rewind(self.telemetry)
@@ -0,0 +1,41 @@
+"""
+Simulation Controls
+Driving input as a bitmask, the one form every frontend and replays share
+"""
+
+# One bit per input read by TruckModel.update and the refuel check
+INPUT_BITS = {
+    'up': 1,
+    'down': 2,
+    'left': 4,
+    'right': 8,
+    'refuel': 16
+}
+UP = INPUT_BITS['up']
+DOWN = INPUT_BITS['down']
+LEFT = INPUT_BITS['left']
+RIGHT = INPUT_BITS['right']
+REFUEL = INPUT_BITS['refuel']
+
+def encode_inputs(names):
+    """Pack input names ('up', 'refuel', ...) into a bitmask, ignoring unknown names"""
+    mask = 0
+    for name in names:
+        mask |= INPUT_BITS.get(name, 0)
+    return mask
+
+class Controls:
+    """Inputs held during one simulation tick
+
+    Frontends keep one instance and overwrite `mask` every tick, so feeding
+    input allocates nothing.
+    """
+
+    __slots__ = ('mask',)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    def held(self, name):
+        """Check whether an input is held"""
+        return bool(self.mask & INPUT_BITS[name])
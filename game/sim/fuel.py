@@ -0,0 +1,53 @@
+"""
+Fuel Model
+Fuel burn, fuel station reach and refueling rules
+"""
+from sim.geometry import Rect, bounds, overlaps
+from sim.rules import REFUEL_COST
+
+STATION_REACH = 40  # Station zones are the building grown by this much (half on each side)
+
+class FuelModel:
+    """Fuel consumption, refueling and fuel station zones"""
+
+    def __init__(self):
+        self.fuel_stations = [
+            {'x': 140, 'y': 210, 'rect': Rect(100, 180, 80, 60)},
+            {'x': 660, 'y': 430, 'rect': Rect(620, 400, 80, 60)}
+        ]
+        # The stations never move, so their zones are built once instead of every tick
+        self.station_zones = [bounds(station['rect'].inflate(STATION_REACH, STATION_REACH))
+                              for station in self.fuel_stations]
+
+    def update_fuel_consumption(self, game_state, truck):
+        """Update fuel consumption based on truck speed"""
+        if abs(truck.speed) > 0.1:
+            consumption = truck.stats.effective.fuel_drain_rate * (1 + abs(truck.speed) / 5)
+            game_state.fuel -= consumption
+            game_state.fuel = max(0, game_state.fuel)
+
+    def station_in_reach(self, truck):
+        """Get the fuel station whose zone the truck overlaps, or None"""
+        truck_bounds = truck.get_bounds()
+        for station, zone in zip(self.fuel_stations, self.station_zones):
+            if overlaps(zone, truck_bounds):
+                return station
+        return None
+
+    def check_refuel_availability(self, game_state, truck):
+        """Check if truck is near a fuel station and can refuel"""
+        if self.station_in_reach(truck) is not None:
+            game_state.refuel_available = (game_state.fuel < 100)
+            return True
+        game_state.refuel_available = False
+        return False
+
+    def attempt_refuel(self, game_state):
+        """Attempt to refuel if conditions are met"""
+        if game_state.refuel_available and game_state.cash >= REFUEL_COST:
+            return game_state.refuel_truck(REFUEL_COST)
+        return False
+
+    def is_out_of_fuel(self, game_state):
+        """Check if truck is out of fuel"""
+        return game_state.fuel <= 0
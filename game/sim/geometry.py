@@ -0,0 +1,63 @@
+"""
+Simulation Geometry
+Integer rectangles that collide exactly like pygame.Rect
+
+The simulation has to give the same answers under every frontend, and replays
+recorded before the core moved out of pygame must still play back the same.
+Rect therefore copies pygame's rules: coordinates are truncated toward zero,
+edges that only touch do not overlap, and a rectangle with no area overlaps
+nothing. It is a tuple, so pygame drawing calls and pygame.Rect() accept it.
+
+Per-tick checks skip Rect objects entirely: static shapes keep their
+bounds() and moving ones compute theirs with truncated ints, and overlaps()
+compares the two tuples directly.
+"""
+
+class Rect(tuple):
+    """Immutable (x, y, w, h) rectangle with pygame.Rect collision rules"""
+
+    __slots__ = ()
+
+    def __new__(cls, x, y, w, h):
+        return tuple.__new__(cls, (int(x), int(y), int(w), int(h)))
+
+    def __repr__(self):
+        return f"Rect{tuple(self)}"
+
+    x = left = property(lambda self: self[0])
+    y = top = property(lambda self: self[1])
+    w = width = property(lambda self: self[2])
+    h = height = property(lambda self: self[3])
+    right = property(lambda self: self[0] + self[2])
+    bottom = property(lambda self: self[1] + self[3])
+    size = property(lambda self: (self[2], self[3]))
+    center = property(lambda self: (self[0] + self[2] // 2, self[1] + self[3] // 2))
+
+    def move(self, dx, dy):
+        """Get a copy shifted by (dx, dy)"""
+        return Rect(self[0] + dx, self[1] + dy, self[2], self[3])
+
+    def inflate(self, dx, dy):
+        """Get a copy grown by dx and dy around the same center"""
+        return Rect(self[0] - int(dx / 2), self[1] - int(dy / 2), self[2] + dx, self[3] + dy)
+
+    def colliderect(self, other):
+        """Check whether two rectangles overlap (x, y, w, h tuples work too)"""
+        x, y, w, h = self
+        ox, oy, ow, oh = other
+        return bool(w and h and ow and oh and x < ox + ow and y < oy + oh and x + w > ox and y + h > oy)
+
+    def collidepoint(self, px, py):
+        """Check whether a point is inside (right and bottom edges excluded)"""
+        x, y, w, h = self
+        px, py = int(px), int(py)
+        return x <= px < x + w and y <= py < y + h
+
+def bounds(rect):
+    """Get (left, top, right, bottom) of a Rect, for overlaps() and point checks"""
+    x, y, w, h = rect
+    return x, y, x + w, y + h
+
+def overlaps(a, b):
+    """Check whether two (left, top, right, bottom) bounds with area overlap, like Rect.colliderect"""
+    return a[0] < b[2] and a[1] < b[3] and a[2] > b[0] and a[3] > b[1]
@@ -0,0 +1,153 @@
+"""
+Mission Simulation
+Fixed-step driving mission rules, shared by every frontend and headless replays
+
+Nothing here imports pygame or Kivy. A frontend builds the simulation, packs
+its input into Controls once per tick, calls step(), and draws whatever state
+it likes afterwards; the pygame game, the Kivy build, replays and benchmarks
+all run this same step.
+"""
+from contextlib import nullcontext
+from sim.checkpoints import MissionCheckpoint
+from sim.controls import REFUEL
+from sim.fuel import FuelModel
+from sim.physics import PhysicsModel
+from sim import rules
+from sim.rules import REFUEL_COST
+
+# Contract cities are drawn on screen at (x * 6, y * 1.2)
+DESTINATION_SCALE = (6, 1.2)
+
+def begin_mission(game_state, contract):
+    """Make a contract the current mission and clear the last mission's flags"""
+    game_state.current_contract = contract
+    game_state.switch_scene("driving")
+    game_state.reset_mission_state()
+
+def end_mission(game_state):
+    """Between-missions rule: the truck is refueled for the next contract"""
+    game_state.fuel = rules.STARTING_FUEL
+    game_state.reset_mission_state()
+
+class NullProfiler:
+    """Stands in for core.profiler.FrameProfiler when no frontend profiles the mission"""
+
+    _scope = nullcontext()
+
+    def scope(self, name):
+        """Get a shared context manager that does nothing"""
+        return self._scope
+
+class MissionSimulation:
+    """Advances one delivery mission by exactly one frame per step()
+
+    Mission time is counted in frames rather than read from the wall clock, so
+    feeding the same inputs always produces the same result. A checkpoint is
+    taken at the start and after every fuel stop; restore() rewinds to one.
+    """
+
+    def __init__(self, game_state, truck, fuel_system=None, physics_system=None, profiler=None,
+                 telemetry=None):
+        self.game_state = game_state
+        self.truck = truck
+        self.fuel_system = fuel_system or FuelModel()
+        self.physics_system = physics_system or PhysicsModel()
+        self.profiler = profiler or NullProfiler()
+        self.telemetry = telemetry  # Optional MissionTelemetry
+        self.ticks = 0
+        self.finished = False
+        self.checkpoints = []
+        self.checkpoint('start')  # Callers seed the RNG before building the simulation
+
+    @property
+    def elapsed_time(self):
+        """Get mission time in seconds"""
+        return self.ticks / rules.FPS
+
+    def checkpoint(self, label):
+        """Snapshot the mission and keep it for retries"""
+        checkpoint = MissionCheckpoint.capture(self, label)
+        self.checkpoints.append(checkpoint)
+        return checkpoint
+
+    def restore(self, checkpoint=None):
+        """Rewind to a checkpoint (default: the latest one) and drop any taken after it"""
+        checkpoint = checkpoint or self.checkpoints[-1]
+        del self.checkpoints[self.checkpoints.index(checkpoint) + 1:]
+        checkpoint.restore(self)
+        return checkpoint
+
+    def get_destination_position(self):
+        """Get destination position on screen"""
+        destination = self.game_state.current_contract.destination
+        return destination['x'] * DESTINATION_SCALE[0], destination['y'] * DESTINATION_SCALE[1]
+
+    def step(self, controls):
+        """Advance one frame with the given Controls; returns True once the mission has ended"""
+        if self.finished:
+            return True
+        game_state = self.game_state
+        profiler = self.profiler
+        telemetry = self.telemetry
+
+        # Handle refueling
+        refueled = False
+        with profiler.scope('fuel'):
+            self.fuel_system.check_refuel_availability(game_state, self.truck)
+            if controls.mask & REFUEL:
+                refueled = self.fuel_system.attempt_refuel(game_state)
+                if refueled and telemetry is not None:
+                    telemetry.event(self.ticks, 'refuel', REFUEL_COST)
+
+        # Update truck physics
+        if game_state.fuel > 0:
+            with profiler.scope('truck'):
+                self.truck.update(controls, 1.0 / rules.FPS)
+            with profiler.scope('fuel'):
+                self.fuel_system.update_fuel_consumption(game_state, self.truck)
+        else:
+            # Out of fuel - mission fails
+            self._finish(0)
+            return True
+        self.ticks += 1
+
+        # Physics and collision updates
+        penalty_count = len(game_state.mission_penalties)
+        with profiler.scope('collision'):
+            self.physics_system.update_off_road_timer(game_state, self.truck, 1.0 / rules.FPS)
+            self.physics_system.check_bridge_collision(game_state, self.truck)
+
+        if telemetry is not None:
+            for amount in game_state.mission_penalties[penalty_count:]:
+                telemetry.event(self.ticks, 'penalty', amount)
+            telemetry.observe_off_road(self.ticks, not self.physics_system.is_on_road(self.truck))
+            telemetry.sample(self.ticks, self.truck, game_state.fuel)
+
+        # Check mission completion
+        dest_x, dest_y = self.get_destination_position()
+        mission_complete = self.physics_system.check_delivery_completion(game_state, self.truck, dest_x, dest_y)
+        deadline_exceeded = self.elapsed_time > game_state.current_contract.get_deadline_seconds()
+
+        if mission_complete or deadline_exceeded:
+            self._finish(self.elapsed_time)
+            return True
+        if refueled:
+            self.checkpoint('fuel stop')
+        return False
+
+    def _finish(self, mission_time):
+        """Calculate and store mission results"""
+        game_state = self.game_state
+        time_remaining = max(0, game_state.current_contract.get_deadline_seconds() - mission_time)
+        time_bonus = int(time_remaining * 10) if game_state.mission_completed else 0
+        game_state.complete_mission(mission_time, time_bonus, game_state.mission_penalties)
+        game_state.switch_scene("results")
+        self.finished = True
+
+        if self.telemetry is not None:
+            if game_state.mission_completed:
+                self.telemetry.event(self.ticks, 'delivery', game_state.current_contract.payout + time_bonus)
+            elif game_state.fuel <= 0:
+                self.telemetry.event(self.ticks, 'out_of_fuel')
+            else:
+                self.telemetry.event(self.ticks, 'deadline_missed')
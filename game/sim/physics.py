@@ -0,0 +1,59 @@
+"""
+Physics Model
+Road network, bridge hazard, off-road and delivery rules
+"""
+import math
+from sim.geometry import Rect, bounds, overlaps
+from sim import rules
+from sim.rules import DELIVERY_RADIUS
+
+class PhysicsModel:
+    """Handles collision detection and physics interactions"""
+
+    def __init__(self):
+        # Road network definition
+        self.roads = [
+            Rect(0, 250, 800, 100),      # Main horizontal road
+            Rect(150, 100, 100, 200),    # North vertical road
+            Rect(550, 300, 100, 200)     # South vertical road
+        ]
+
+        # Hazards
+        self.bridge_danger = Rect(400, 250, 80, 20)
+        self.bridge_visual = Rect(400, 230, 80, 40)
+
+        # Checked every tick, so kept as plain bounds
+        self.road_bounds = [bounds(road) for road in self.roads]
+        self.bridge_bounds = bounds(self.bridge_danger)
+
+    def is_on_road(self, truck):
+        """Check if truck is on a road"""
+        x, y = int(truck.x), int(truck.y)  # Truncated like pygame.Rect.collidepoint
+        for left, top, right, bottom in self.road_bounds:
+            if left <= x < right and top <= y < bottom:
+                return True
+        return False
+
+    def check_bridge_collision(self, game_state, truck):
+        """Check for bridge collision and apply penalty"""
+        if overlaps(self.bridge_bounds, truck.get_bounds()):
+            if not game_state.bridge_penalty_applied:
+                game_state.mission_penalties.append(rules.BRIDGE_PENALTY)
+                game_state.bridge_penalty_applied = True
+            return True
+        return False
+
+    def update_off_road_timer(self, game_state, truck, dt):
+        """Update off-road warning timer"""
+        if abs(truck.speed) > 0 and not self.is_on_road(truck):
+            game_state.off_road_warning_time += dt
+        else:
+            game_state.off_road_warning_time = 0
+
+    def check_delivery_completion(self, game_state, truck, dest_x, dest_y, dest_radius=DELIVERY_RADIUS):
+        """Check if truck has reached the destination"""
+        distance_to_dest = math.sqrt((truck.x - dest_x) ** 2 + (truck.y - dest_y) ** 2)
+        if distance_to_dest < dest_radius and not game_state.mission_completed:
+            game_state.mission_completed = True
+            return True
+        return False
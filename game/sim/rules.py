@@ -0,0 +1,41 @@
+"""
+Simulation Rules
+Balance numbers the simulation needs, without the pygame display constants
+
+Rules taken from data/config.yml (CONFIG, FPS, BRIDGE_PENALTY, STARTING_CASH,
+STARTING_FUEL and TruckConfig) are read on first access, so importing the
+simulation loads nothing from disk. Code that runs at import time should read
+them as rules.NAME when it is called rather than binding them up front.
+"""
+from data.config import lazy_settings
+
+# Game balance constants
+FUEL_DRAIN_RATE = 0.008
+REFUEL_COST = 50
+REVERSE_SPEED_MULTIPLIER = 0.5
+
+# World layout, in the 800x600 map space every frontend scales from
+WORLD_SIZE = (800, 600)
+TRUCK_BOUNDS = (30, 770, 30, 570)  # Left, right, top, bottom limits of the truck's center
+TRUCK_SIZE = (60, 30)  # Collision box, centered on the truck
+TRUCK_START = (100, 300)
+DELIVERY_RADIUS = 50
+
+def _truck_config(config):
+    """Build the truck physics constants from the vehicle config"""
+    class TruckConfig:
+        MAX_SPEED = config.vehicle.max_speed
+        ACCELERATION = config.vehicle.acceleration
+        DECELERATION = config.vehicle.deceleration
+        TURN_SPEED = config.vehicle.turn_speed
+        REVERSE_SPEED_MULTIPLIER = REVERSE_SPEED_MULTIPLIER
+    return TruckConfig
+
+__getattr__ = lazy_settings(__name__, {
+    'CONFIG': lambda config: config,
+    'FPS': lambda config: config.ui.fps_target,  # Simulation ticks per second of mission time
+    'BRIDGE_PENALTY': lambda config: config.penalties.bridge_strike,
+    'STARTING_CASH': lambda config: config.starting_resources.cash,
+    'STARTING_FUEL': lambda config: config.starting_resources.fuel,
+    'TruckConfig': _truck_config
+})
@@ -0,0 +1,160 @@
+"""
+Effective Stats System
+Composes base truck stats with upgrade, surface, weather and cargo modifiers
+"""
+from data.config import get_config, lazy_settings
+from sim.rules import FUEL_DRAIN_RATE, REVERSE_SPEED_MULTIPLIER
+
+def surface_modifiers(config):
+    """Speed and fuel-burn multipliers per surface"""
+    vehicle = config.vehicle
+    return {
+        'road': {'speed': 1.0, 'fuel': 1.0},
+        'off_road': {'speed': vehicle.off_road_speed_penalty, 'fuel': vehicle.off_road_fuel_penalty}
+    }
+
+# Speed and fuel-burn multipliers per condition
+WEATHER_MODIFIERS = {
+    'clear': {'speed': 1.0, 'fuel': 1.0}
+}
+CARGO_MODIFIERS = {
+    None: {'speed': 1.0, 'fuel': 1.0},
+    'Standard': {'speed': 1.0, 'fuel': 1.0},
+    'Oversize': {'speed': 1.0, 'fuel': 1.0},
+    'Superload': {'speed': 1.0, 'fuel': 1.0}
+}
+
+def base_stats(config):
+    """Truck stats before any modifier"""
+    vehicle = config.vehicle
+    return {
+        'max_speed': vehicle.max_speed,
+        'acceleration': vehicle.acceleration,
+        'deceleration': vehicle.deceleration,
+        'turn_speed': vehicle.turn_speed,
+        'reverse_speed_multiplier': REVERSE_SPEED_MULTIPLIER,
+        'fuel_drain_rate': FUEL_DRAIN_RATE,
+        'fuel_capacity': config.starting_resources.fuel
+    }
+
+# SURFACE_MODIFIERS and BASE_STATS, read from the config on first access
+__getattr__ = lazy_settings(__name__, {'SURFACE_MODIFIERS': surface_modifiers, 'BASE_STATS': base_stats})
+
+class EffectiveStats:
+    """Final truck stats for the current conditions, read directly by hot loops"""
+    __slots__ = ('max_speed', 'reverse_speed', 'acceleration', 'deceleration', 'turn_speed',
+                 'fuel_drain_rate', 'fuel_capacity', 'damage_multiplier')
+
+    def __init__(self, max_speed, reverse_speed, acceleration, deceleration, turn_speed,
+                 fuel_drain_rate, fuel_capacity, damage_multiplier):
+        self.max_speed = max_speed
+        self.reverse_speed = reverse_speed
+        self.acceleration = acceleration
+        self.deceleration = deceleration
+        self.turn_speed = turn_speed
+        self.fuel_drain_rate = fuel_drain_rate
+        self.fuel_capacity = fuel_capacity
+        self.damage_multiplier = damage_multiplier
+
+class StatsPipeline:
+    """Per-truck modifier inputs with a cached EffectiveStats record
+
+    Setters only drop the cached record when their input actually changes, and
+    compiled records are kept per input combination, so driving on and off the
+    road just swaps between two prebuilt records.
+    """
+
+    def __init__(self, upgrade_config=None, **base_overrides):
+        config = get_config()
+        self.base = dict(base_stats(config), **base_overrides)
+        self.upgrade_config = upgrade_config
+        self.surface_modifiers = surface_modifiers(config)
+        self.upgrade_levels = (1, 1, 1)  # engine, fuel tank, frame
+        self.surface = 'road'
+        self.weather = 'clear'
+        self.cargo_type = None
+
+        self._effective = None
+        self._compiled = {}
+
+    @property
+    def effective(self):
+        """Get the effective stats, compiling them if an input changed"""
+        if self._effective is None:
+            key = (self.upgrade_levels, self.surface, self.weather, self.cargo_type)
+            self._effective = self._compiled.get(key)
+            if self._effective is None:
+                self._effective = self._compile()
+                self._compiled[key] = self._effective
+        return self._effective
+
+    def set_upgrades(self, upgrade_levels):
+        """Set (engine, fuel tank, frame) upgrade levels"""
+        upgrade_levels = tuple(upgrade_levels)
+        if upgrade_levels != self.upgrade_levels:
+            self.upgrade_levels = upgrade_levels
+            self._effective = None
+
+    def set_surface(self, surface):
+        """Set the surface under the truck ('road' or 'off_road')"""
+        if surface != self.surface:
+            self.surface = surface
+            self._effective = None
+
+    def set_weather(self, weather):
+        """Set the current weather"""
+        if weather != self.weather:
+            self.weather = weather
+            self._effective = None
+
+    def set_cargo(self, cargo_type):
+        """Set the cargo class being hauled (None when empty)"""
+        if cargo_type != self.cargo_type:
+            self.cargo_type = cargo_type
+            self._effective = None
+
+    def set_upgrade_config(self, upgrade_config):
+        """Swap the upgrade tables and drop every compiled record"""
+        self.upgrade_config = upgrade_config
+        self._compiled.clear()
+        self._effective = None
+
+    def apply_config(self, config):
+        """Pick up reloaded vehicle and upgrade settings, dropping every compiled record"""
+        vehicle = config.vehicle
+        self.base.update(max_speed=vehicle.max_speed, acceleration=vehicle.acceleration,
+                         deceleration=vehicle.deceleration, turn_speed=vehicle.turn_speed)
+        self.surface_modifiers = surface_modifiers(config)
+        if self.upgrade_config is not None:
+            self.upgrade_config = config.upgrades
+        self._compiled.clear()
+        self._effective = None
+
+    def _upgrade_modifiers(self):
+        """Get speed multiplier, tank capacity and damage multiplier from the UpgradeConfig"""
+        if self.upgrade_config is None:
+            return 1.0, self.base['fuel_capacity'], 1.0
+        engine, fuel_tank, frame = (level - 1 for level in self.upgrade_levels)
+        upgrades = self.upgrade_config
+        return (upgrades.engine.speed_bonuses[engine],
+                float(upgrades.fuel_tank.capacities[fuel_tank]),
+                upgrades.frame.collision_reduction[frame])
+
+    def _compile(self):
+        """Build the stats record for the current inputs"""
+        engine_bonus, fuel_capacity, damage_multiplier = self._upgrade_modifiers()
+        surface = self.surface_modifiers[self.surface]
+        weather = WEATHER_MODIFIERS[self.weather]
+        cargo = CARGO_MODIFIERS[self.cargo_type]
+
+        max_speed = self.base['max_speed'] * engine_bonus * surface['speed'] * weather['speed'] * cargo['speed']
+        return EffectiveStats(
+            max_speed=max_speed,
+            reverse_speed=max_speed * self.base['reverse_speed_multiplier'],
+            acceleration=self.base['acceleration'],
+            deceleration=self.base['deceleration'],
+            turn_speed=self.base['turn_speed'],
+            fuel_drain_rate=self.base['fuel_drain_rate'] * surface['fuel'] * weather['fuel'] * cargo['fuel'],
+            fuel_capacity=fuel_capacity,
+            damage_multiplier=damage_multiplier
+        )
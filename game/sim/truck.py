@@ -0,0 +1,65 @@
+"""
+Truck Model
+The truck's driving physics, independent of how it is drawn
+"""
+import math
+from sim.controls import UP, DOWN, LEFT, RIGHT
+from sim.geometry import Rect
+from sim.rules import TRUCK_BOUNDS, TRUCK_SIZE
+from sim.stats import StatsPipeline
+
+class TruckModel:
+    """Position, heading and speed of the player's truck"""
+
+    def __init__(self, start_x, start_y):
+        self.x = start_x
+        self.y = start_y
+        self.angle = 0
+        self.speed = 0
+        self.stats = StatsPipeline()  # Upgrades, surface, weather and cargo modifiers
+
+    def update(self, controls, dt):
+        """Update truck position and rotation from one tick of Controls"""
+        stats = self.stats.effective
+        mask = controls.mask
+
+        # Acceleration/Deceleration
+        if mask & UP:
+            self.speed = min(self.speed + stats.acceleration, stats.max_speed)
+        elif mask & DOWN:
+            self.speed = max(self.speed - stats.acceleration, -stats.reverse_speed)
+        else:
+            if self.speed > 0:
+                self.speed = max(0, self.speed - stats.deceleration)
+            elif self.speed < 0:
+                self.speed = min(0, self.speed + stats.deceleration)
+
+        # Turning
+        if abs(self.speed) > 0.1:
+            if mask & LEFT:
+                self.angle -= stats.turn_speed
+            if mask & RIGHT:
+                self.angle += stats.turn_speed
+
+        # Movement
+        if abs(self.speed) > 0.05:
+            rad = math.radians(self.angle)
+            self.x += math.cos(rad) * self.speed
+            self.y += math.sin(rad) * self.speed
+
+        # Keep on the map but allow more space
+        left, right, top, bottom = TRUCK_BOUNDS
+        self.x = max(left, min(right, self.x))
+        self.y = max(top, min(bottom, self.y))
+
+    def get_rect(self):
+        """Get collision rectangle for the truck"""
+        width, height = TRUCK_SIZE
+        return Rect(self.x - width // 2, self.y - height // 2, width, height)
+
+    def get_bounds(self):
+        """Get get_rect() as (left, top, right, bottom), without building a Rect"""
+        width, height = TRUCK_SIZE
+        left = int(self.x - width // 2)
+        top = int(self.y - height // 2)
+        return left, top, left + width, top + height
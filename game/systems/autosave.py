@@ -0,0 +1,257 @@
+"""
+Autosave System
+Background journal of company changes, compacted into atomic save snapshots
+
+The main loop only diffs a few GameState fields once per frame and queues
+small records. A writer thread appends them to an append-only journal and
+fsyncs it at least every FLUSH_SECONDS. It keeps its own plain-data copy of
+the company up to date, so compaction can write a full snapshot (through
+systems.save_game) without touching live state or game objects. After the
+snapshot is renamed into place, the journal is started over.
+
+Journal record layout (little-endian):
+    length, crc32, kind     RECORD header
+    payload                 UTF-8 JSON, including the record's sequence number
+
+Recovery loads the snapshot and replays journal records newer than the
+snapshot's sequence. It stops at the first torn or corrupt record, so a crash
+mid-write loses only that record.
+"""
+import json
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+import numpy as np
+from systems.save_game import (SaveFile, capture_company, contract_to_save, restore_company,
+                               write_company)
+
+JOURNAL_SUFFIX = '.journal'
+SEQUENCE_COLUMN = 'journal.sequence'
+FLUSH_SECONDS = 1.0
+COMPACT_RECORDS = 256
+FUEL_RECORD_SECONDS = 2.0  # Fuel changes every driving frame; journal it at most this often
+
+RECORD = struct.Struct('<IIB')  # payload length, crc32 of kind + payload, kind
+RECORD_KINDS = {
+    'cash': 1,
+    'fuel': 2,
+    'upgrades': 3,
+    'market': 4,
+    'contract': 5,
+    'ledger': 6,
+    'ledger_truncate': 7
+}
+RECORD_NAMES = {code: name for name, code in RECORD_KINDS.items()}
+SYNC = 'sync'  # Queued by flush() to force an fsync
+
+def apply_record(company, kind, data):
+    """Apply one journal record to plain company data (see capture_company)"""
+    if kind == 'cash':
+        company['cash'] += data['amount']
+    elif kind == 'fuel':
+        company['fuel'] = data['fuel']
+    elif kind == 'upgrades':
+        company['upgrade_levels'] = tuple(data['levels'])
+    elif kind == 'market':
+        company['market'] = data['contracts']
+    elif kind == 'contract':
+        company['completed'].append(data['record'])
+    elif kind == 'ledger':
+        company['ledger'].record(**data['entry'])
+    elif kind == 'ledger_truncate':
+        company['ledger'].truncate(data['count'])
+
+def encode_record(kind, data):
+    """Pack a journal record"""
+    code = RECORD_KINDS[kind]
+    payload = json.dumps(data).encode('utf-8')
+    return RECORD.pack(len(payload), zlib.crc32(bytes([code]) + payload), code) + payload
+
+def read_journal(path):
+    """Yield (kind, data) for every intact record, stopping at the first damaged one"""
+    try:
+        with open(path, 'rb') as f:
+            buffer = f.read()
+    except FileNotFoundError:
+        return
+    offset = 0
+    while offset + RECORD.size <= len(buffer):
+        length, crc, code = RECORD.unpack_from(buffer, offset)
+        start = offset + RECORD.size
+        payload = buffer[start:start + length]
+        if len(payload) < length or zlib.crc32(bytes([code]) + payload) != crc or code not in RECORD_NAMES:
+            return  # Torn write at the end of the journal
+        yield RECORD_NAMES[code], json.loads(payload.decode('utf-8'))
+        offset = start + length
+
+def recover(game_state, save_path):
+    """Load the last snapshot and replay the journal over it
+
+    Returns the sequence number of the last record applied (0 for a new company).
+    """
+    sequence = 0
+    company = capture_company(game_state)
+    if os.path.exists(save_path):
+        with SaveFile(save_path) as save:
+            company = save.company()
+            if SEQUENCE_COLUMN in save.sections:
+                sequence = int(save.column(SEQUENCE_COLUMN)[0])
+    replayed = 0
+    for kind, data in read_journal(save_path + JOURNAL_SUFFIX):
+        if data['seq'] > sequence:
+            apply_record(company, kind, data)
+            sequence = data['seq']
+            replayed += 1
+    if replayed or os.path.exists(save_path):
+        restore_company(game_state, company)
+    return sequence
+
+class AutosaveService:
+    """Journals GameState changes from the main loop and snapshots them in the background"""
+
+    def __init__(self, save_path, flush_seconds=FLUSH_SECONDS, compact_records=COMPACT_RECORDS):
+        self.save_path = save_path
+        self.journal_path = save_path + JOURNAL_SUFFIX
+        self.flush_seconds = flush_seconds
+        self.compact_records = compact_records
+        self.queue = queue.Queue()
+        self.snapshots = 0
+        self.thread = None
+
+        # Main-thread view of what has been journaled
+        self.sequence = 0
+        self._cash = None
+        self._fuel = None
+        self._fuel_time = 0.0
+        self._upgrade_levels = None
+        self._market = None
+        self._market_revision = 0
+        self._completed = 0
+        self._ledger = 0
+
+    def start(self, game_state, sequence=0):
+        """Start journaling from a recovered GameState"""
+        os.makedirs(os.path.dirname(self.save_path) or '.', exist_ok=True)
+        self.sequence = sequence
+        self._remember(game_state)
+        company = capture_company(game_state)
+        self.thread = threading.Thread(target=self._run, args=(company, sequence),
+                                       name="autosave", daemon=True)
+        self.thread.start()
+
+    def track(self, game_state):
+        """Queue records for whatever changed since the last call (once per frame)"""
+        if game_state.cash != self._cash:
+            self.record('cash', amount=game_state.cash - self._cash)
+            self._cash = game_state.cash
+        if game_state.upgrade_levels != self._upgrade_levels:
+            self.record('upgrades', levels=list(game_state.upgrade_levels))
+            self._upgrade_levels = game_state.upgrade_levels
+        if (game_state.available_contracts is not self._market or
+                game_state.market_revision != self._market_revision):
+            self.record('market', contracts=[contract_to_save(c) for c in game_state.available_contracts])
+            self._market = game_state.available_contracts
+            self._market_revision = game_state.market_revision
+        while self._completed < len(game_state.completed_contracts):
+            self.record('contract', record=game_state.completed_contracts[self._completed])
+            self._completed += 1
+        ledger = game_state.ledger
+        if ledger.truncated is not None:
+            if ledger.truncated < self._ledger:
+                self.record('ledger_truncate', count=ledger.truncated)
+                self._ledger = ledger.truncated
+            ledger.truncated = None
+        while self._ledger < len(ledger):
+            self.record('ledger', entry=ledger.entry(self._ledger))
+            self._ledger += 1
+        if game_state.fuel != self._fuel:
+            now = time.perf_counter()
+            if now - self._fuel_time >= FUEL_RECORD_SECONDS or game_state.scene != 'driving':
+                self.record('fuel', fuel=game_state.fuel)
+                self._fuel = game_state.fuel
+                self._fuel_time = now
+
+    def record(self, kind, **data):
+        """Queue one record; never blocks"""
+        self.sequence += 1
+        data['seq'] = self.sequence
+        self.queue.put((kind, data))
+
+    def flush(self):
+        """Block until everything queued so far is written to the journal and fsynced"""
+        self.queue.put(SYNC)
+        self.queue.join()
+
+    def close(self, game_state=None):
+        """Journal final changes, write a last snapshot and stop the thread"""
+        if self.thread is None:
+            return
+        if game_state is not None:
+            self._fuel_time = 0.0
+            self.track(game_state)
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+
+    def _remember(self, game_state):
+        """Mark the current state as already journaled"""
+        self._cash = game_state.cash
+        self._fuel = game_state.fuel
+        self._upgrade_levels = game_state.upgrade_levels
+        self._market = game_state.available_contracts
+        self._market_revision = game_state.market_revision
+        self._completed = len(game_state.completed_contracts)
+        self._ledger = len(game_state.ledger)
+        game_state.ledger.truncated = None
+
+    def _run(self, company, sequence):
+        """Writer thread: append, fsync on a timer, compact when the journal grows"""
+        journal = open(self.journal_path, 'ab')
+        pending = 0      # Records written since the last fsync
+        journaled = 0    # Records in the journal since the last snapshot
+        last_sync = time.perf_counter()
+        try:
+            while True:
+                timeout = max(0.0, self.flush_seconds - (time.perf_counter() - last_sync)) if pending else None
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = False
+                try:
+                    if item and item is not SYNC:
+                        kind, data = item
+                        journal.write(encode_record(kind, data))
+                        apply_record(company, kind, data)
+                        sequence = data['seq']
+                        pending += 1
+                        journaled += 1
+                    if pending and (item is None or item is False or item is SYNC or
+                                    time.perf_counter() - last_sync >= self.flush_seconds):
+                        journal.flush()
+                        os.fsync(journal.fileno())
+                        pending = 0
+                        last_sync = time.perf_counter()
+                    if item is None or journaled >= self.compact_records:
+                        journal = self._compact(journal, company, sequence)
+                        journaled = 0
+                        pending = 0
+                except (OSError, ValueError) as e:
+                    print(f"Autosave failed: {e}")
+                finally:
+                    if item is not False:
+                        self.queue.task_done()
+                if item is None:
+                    return
+        finally:
+            journal.close()
+
+    def _compact(self, journal, company, sequence):
+        """Write a full snapshot, then start an empty journal"""
+        write_company(self.save_path, company, columns={SEQUENCE_COLUMN: np.array([sequence], dtype=np.uint64)})
+        self.snapshots += 1
+        # A crash before this truncate is harmless: recovery skips records the snapshot holds
+        journal.close()
+        return open(self.journal_path, 'wb')
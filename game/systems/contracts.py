@@ -0,0 +1,113 @@
+"""
+Contract Planning System
+Chains contracts from the market into multi-stop runs for a single truck
+"""
+import heapq
+import itertools
+import numpy as np
+from core.constants import DEADHEAD_COST_PER_MILE, HAUL_SPEED_MPH
+from data.distances import get_distance_table
+
+class LoadChainPlanner:
+    """Finds the most profitable chains of back-to-back contracts for one truck
+
+    A chain is a sequence of contracts where the truck drives empty (deadhead)
+    from where it is to the next pickup, then hauls the load to its destination.
+    Every contract must be delivered before its deadline, counted in hours from
+    the start of the chain.
+
+    The search is a beam search over chain length. Each step expands the whole
+    beam against the whole market at once with NumPy, drops extensions that miss
+    a deadline or lose money, and prunes any chain whose payout-per-hour upper
+    bound cannot beat the chains already found.
+    """
+
+    def __init__(self, cities, max_stops=4, beam_width=64,
+                 speed_mph=HAUL_SPEED_MPH, deadhead_cost_per_mile=DEADHEAD_COST_PER_MILE):
+        self.cities = cities
+        self.distances = get_distance_table(cities)
+        self.max_stops = max_stops
+        self.beam_width = beam_width
+        self.speed_mph = speed_mph
+        self.deadhead_cost_per_mile = deadhead_cost_per_mile
+
+    def plan(self, start_city, contracts, top_n=3):
+        """Get the top chains starting from a city
+
+        Returns a list of dicts, best first, with the chained 'contracts', net
+        'profit', total 'hours' and 'deadhead_miles'.
+        """
+        contracts = list(contracts)
+        if not contracts or self.max_stops < 1:
+            return []
+
+        miles = self.distances.miles
+        origins = self.distances.city_indices([contract.origin for contract in contracts])
+        destinations = self.distances.city_indices([contract.destination for contract in contracts])
+        payouts = np.array([contract.payout for contract in contracts], dtype=np.float64)
+        deadlines = np.array([contract.deadline_hours for contract in contracts], dtype=np.float64)
+        loaded_hours = miles[origins, destinations] / self.speed_mph
+
+        # Upper bounds: no remaining stops can pay more than the best payout per
+        # loaded hour over the time left, or more than the best payouts combined
+        best_rate = (payouts / np.maximum(loaded_hours, 1e-9)).max()
+        last_deadline = deadlines.max()
+        top_payouts = np.concatenate(([0.0], np.cumsum(np.sort(payouts)[::-1])))
+
+        # Beam state, one row per partial chain
+        city = np.array([self.distances.city_index(start_city)], dtype=np.intp)
+        hours = np.zeros(1)
+        profit = np.zeros(1)
+        deadhead_total = np.zeros(1)
+        chains = np.empty((1, 0), dtype=np.intp)
+        used = np.zeros((1, len(contracts)), dtype=bool)
+
+        results = []  # min-heap of (profit, -order found, result)
+        counter = itertools.count()
+        for depth in range(1, self.max_stops + 1):
+            deadhead = miles[city[:, None], origins[None, :]]
+            arrive = hours[:, None] + deadhead / self.speed_mph + loaded_hours[None, :]
+            gain = payouts[None, :] - self.deadhead_cost_per_mile * deadhead
+            new_profit = profit[:, None] + gain
+
+            # Prune on deadlines, losing legs and the upper bound
+            remaining = min(self.max_stops - depth, len(contracts) - depth)
+            bound = new_profit + np.minimum(top_payouts[max(remaining, 0)],
+                                            best_rate * np.maximum(last_deadline - arrive, 0.0))
+            threshold = results[0][0] if len(results) >= top_n else -np.inf
+            keep = ~used & (arrive <= deadlines[None, :]) & (gain > 0) & (bound > threshold)
+
+            rows, cols = np.nonzero(keep)
+            if rows.size == 0:
+                break
+            scores = new_profit[rows, cols]
+            if rows.size > self.beam_width:
+                best = np.argpartition(-scores, self.beam_width - 1)[:self.beam_width]
+                rows, cols, scores = rows[best], cols[best], scores[best]
+
+            # Advance the beam
+            deadhead_total = deadhead_total[rows] + deadhead[rows, cols]
+            city = destinations[cols]
+            hours = arrive[rows, cols]
+            profit = scores
+            chains = np.column_stack((chains[rows], cols))
+            used = used[rows]
+            used[np.arange(len(cols)), cols] = True
+
+            # Every chain in the beam is a complete plan on its own
+            for b in np.argsort(-profit)[:top_n]:
+                if len(results) >= top_n and profit[b] <= results[0][0]:
+                    break
+                result = {
+                    'contracts': [contracts[j] for j in chains[b]],
+                    'profit': float(profit[b]),
+                    'hours': float(hours[b]),
+                    'deadhead_miles': float(deadhead_total[b])
+                }
+                item = (float(profit[b]), -next(counter), result)
+                if len(results) < top_n:
+                    heapq.heappush(results, item)
+                else:
+                    heapq.heapreplace(results, item)
+
+        return [result for _, _, result in sorted(results, reverse=True)]
@@ -0,0 +1,267 @@
+"""
+Fleet Dispatch System
+Pairs idle trucks with open contracts to maximize total profit net of deadhead
+"""
+import numpy as np
+from core.constants import DEADHEAD_COST_PER_MILE
+
+class FleetDispatcher:
+    """Solves the truck-to-contract assignment with a Hungarian-style algorithm
+
+    Trucks are parked at cities and contracts are picked up at their origin city.
+    Pairing a truck with a contract is worth the contract payout minus the cost of
+    driving empty to the origin. Pairs that would lose money are never made; the
+    truck simply stays idle.
+
+    Every truck parked in the same city has the same profit row, so the solver
+    works on one row per city ("class") instead of one per truck. The truck x
+    contract problem is padded to a square and solved with shortest augmenting
+    paths (Jonker-Volgenant style), vectorized over contracts with NumPy. Dual
+    prices are kept between solves, so changing a few trucks or contracts only
+    re-routes the affected pairs.
+    """
+
+    def __init__(self, distance_table, deadhead_cost_per_mile=DEADHEAD_COST_PER_MILE):
+        self.distances = distance_table
+        self.deadhead_cost_per_mile = deadhead_cost_per_mile
+
+        self.truck_cities = np.empty(0, dtype=np.intp)  # -1 marks an unavailable truck
+        self.contracts = []
+
+        # Solver state, rebuilt by _full_solve()
+        self.size = 0
+        self.cost = None            # classes x columns, negative clipped profit
+        self.class_city = []        # city index per class (-1 for the empty class)
+        self.row_class = None
+        self.class_u = None         # dual price per class
+        self.col_v = None           # dual price per column
+        self.row_to_col = None
+        self.col_to_row = None
+        self.free_rows = []         # unassigned rows per class
+        self._dirty_rows = set()
+        self._dirty_cols = set()
+
+    def set_fleet(self, truck_cities):
+        """Set the city each truck is parked at (None if the truck is unavailable)"""
+        self.truck_cities = np.fromiter(
+            (-1 if city is None else self.distances.city_index(city) for city in truck_cities),
+            dtype=np.intp, count=len(truck_cities))
+        self.cost = None
+
+    def set_market(self, contracts):
+        """Set the list of open contracts (None entries are skipped)"""
+        self.contracts = list(contracts)
+        self.cost = None
+
+    def move_trucks(self, changes):
+        """Update a few trucks in place: {truck_index: city or None}"""
+        for i, city in changes.items():
+            self.truck_cities[i] = -1 if city is None else self.distances.city_index(city)
+            self._dirty_rows.add(i)
+
+    def update_contracts(self, changes):
+        """Update a few contracts in place: {contract_index: contract or None}"""
+        for j, contract in changes.items():
+            self.contracts[j] = contract
+            self._dirty_cols.add(j)
+
+    def solve(self):
+        """Assign trucks to contracts
+
+        Returns an array with the contract index for each truck, or -1 if the
+        truck should stay idle.
+        """
+        num_trucks = len(self.truck_cities)
+        num_contracts = len(self.contracts)
+        if num_trucks == 0 or num_contracts == 0:
+            return np.full(num_trucks, -1, dtype=np.intp)
+
+        if self.cost is None:
+            self._full_solve()
+        elif self._dirty_rows or self._dirty_cols:
+            self._incremental_solve()
+
+        assignment = self.row_to_col[:num_trucks].copy()
+        profit = -self.cost[self.row_class[:num_trucks], assignment]
+        assignment[(assignment >= num_contracts) | (profit <= 0)] = -1
+        return assignment
+
+    def total_profit(self, assignment):
+        """Get the total net profit of an assignment returned by solve()"""
+        trucks = np.flatnonzero(assignment >= 0)
+        return float(-self.cost[self.row_class[trucks], assignment[trucks]].sum())
+
+    def _column_profit(self, class_city, cols):
+        """Compute clipped net profit for classes x contract columns"""
+        class_city = np.asarray(class_city, dtype=np.intp)
+        block = np.zeros((len(class_city), len(cols)))
+
+        real_rows = np.flatnonzero(class_city >= 0)
+        real_cols = [k for k, j in enumerate(cols)
+                     if j < len(self.contracts) and self.contracts[j] is not None]
+        if real_rows.size == 0 or not real_cols:
+            return block
+
+        contracts = [self.contracts[cols[k]] for k in real_cols]
+        origins = self.distances.city_indices([contract.origin for contract in contracts])
+        payouts = np.array([contract.payout for contract in contracts], dtype=np.float64)
+
+        deadhead = self.distances.miles[class_city[real_rows][:, None], origins[None, :]]
+        net = payouts[None, :] - self.deadhead_cost_per_mile * deadhead
+        # A money-losing pair is worth the same as leaving both unmatched
+        block[np.ix_(real_rows, real_cols)] = np.maximum(net, 0.0)
+        return block
+
+    def _full_solve(self):
+        """Solve from scratch"""
+        n = max(len(self.truck_cities), len(self.contracts))
+        row_city = np.full(n, -1, dtype=np.intp)
+        row_city[:len(self.truck_cities)] = self.truck_cities
+
+        class_city, self.row_class = np.unique(row_city, return_inverse=True)
+        self.class_city = list(class_city)
+        self.size = n
+        self.cost = -self._column_profit(class_city, range(n))
+        self.row_to_col = np.full(n, -1, dtype=np.intp)
+        self.col_to_row = np.full(n, -1, dtype=np.intp)
+        self.free_rows = [list(np.flatnonzero(self.row_class == k)) for k in range(len(class_city))]
+        self._dirty_rows.clear()
+        self._dirty_cols.clear()
+
+        # Column reduction: price each contract at its best class, then hand it
+        # to that class if a truck there is still free
+        self.class_u = np.zeros(len(class_city))
+        self.col_v = self.cost.min(axis=0)
+        best_class = self.cost.argmin(axis=0)
+        for j in np.argsort(self.col_v):
+            free = self.free_rows[best_class[j]]
+            if free:
+                self._assign(free.pop(), j)
+
+        self._augment_all()
+
+    def _incremental_solve(self):
+        """Re-route only the trucks and contracts that changed since the last solve"""
+        num_trucks = len(self.truck_cities)
+
+        for i in sorted(self._dirty_rows):
+            self._release_row(i)
+            self.free_rows[self.row_class[i]].remove(i)
+            city = self.truck_cities[i] if i < num_trucks else -1
+            k = self._class_for_city(city)
+            self.row_class[i] = k
+            self.free_rows[k].append(i)
+
+        if self._dirty_cols:
+            cols = np.array(sorted(self._dirty_cols), dtype=np.intp)
+            self.cost[:, cols] = -self._column_profit(self.class_city, cols)
+            for j in cols:
+                if self.col_to_row[j] >= 0:
+                    self._release_row(self.col_to_row[j])
+            # Reprice so no class can do better than its current duals allow
+            self.col_v[cols] = (self.cost[:, cols] - self.class_u[:, None]).min(axis=0)
+
+        self._dirty_rows.clear()
+        self._dirty_cols.clear()
+        self._augment_all()
+
+    def _class_for_city(self, city):
+        """Get the class for a city, creating it if no truck has parked there yet"""
+        if city in self.class_city:
+            return self.class_city.index(city)
+
+        cost_row = -self._column_profit([city], range(self.size))
+        self.cost = np.vstack((self.cost, cost_row))
+        self.class_u = np.append(self.class_u, (cost_row[0] - self.col_v).min())
+        self.class_city.append(city)
+        self.free_rows.append([])
+        return len(self.class_city) - 1
+
+    def _assign(self, row, col):
+        """Give a column to a row"""
+        self.row_to_col[row] = col
+        self.col_to_row[col] = row
+
+    def _release_row(self, row):
+        """Free a row and the column it held"""
+        col = self.row_to_col[row]
+        if col >= 0:
+            self.col_to_row[col] = -1
+            self.row_to_col[row] = -1
+            self.free_rows[self.row_class[row]].append(row)
+
+    def _augment_all(self):
+        """Route every free row to a free column"""
+        for k in range(len(self.free_rows)):
+            while self.free_rows[k]:
+                self._augment(k)
+
+    def _augment(self, source):
+        """Find the cheapest augmenting path from a class with a free truck
+
+        Runs Dijkstra over columns: each step settles the cheapest pending
+        column, and a held column leads (at zero reduced cost) to its holder's
+        class, which is then scanned against every column in one vector step.
+        Duals are then shifted so the path becomes tight and one more row is
+        assigned.
+        """
+        cost, u, v = self.cost, self.class_u, self.col_v
+        n = self.size
+
+        # Held columns grouped by the class holding them
+        held = np.flatnonzero(self.col_to_row >= 0)
+        held_class = self.row_class[self.col_to_row[held]]
+        order = np.argsort(held_class, kind='stable')
+        held, held_class = held[order], held_class[order]
+        bounds = np.searchsorted(held_class, np.arange(len(u) + 1))
+        col_class = np.full(n, -1, dtype=np.intp)
+        col_class[held] = held_class
+
+        pending = np.full(n, np.inf)                # tentative distance of open columns
+        open_cols = np.ones(n, dtype=bool)
+        col_dist = np.empty(n)                      # distance of settled columns
+        col_pred = np.full(n, -1, dtype=np.intp)    # class each column was reached from
+        better = np.empty(n, dtype=bool)
+        class_via = {}                              # held column each class was reached by
+        scanned, scanned_dist = [], []
+
+        k, dist_k = source, 0.0
+        while True:
+            # Scan class k; its own held columns are settled at its distance
+            scanned.append(k)
+            scanned_dist.append(dist_k)
+            own = held[bounds[k]:bounds[k + 1]]
+            col_dist[own] = dist_k
+            pending[own] = np.inf
+            open_cols[own] = False
+
+            reach = cost[k] - v
+            reach += dist_k - u[k]
+            np.less(reach, pending, out=better)
+            better &= open_cols
+            np.copyto(pending, reach, where=better)
+            np.copyto(col_pred, k, where=better)
+
+            col = int(pending.argmin())
+            dist_k = pending[col]
+            k = col_class[col]
+            if k < 0:
+                break
+            class_via[k] = col
+
+        # Shift duals so reduced costs stay non-negative and the path is tight
+        sink, path_dist = col, dist_k
+        u[scanned] += path_dist - np.array(scanned_dist)
+        settled = ~open_cols
+        v[settled] += col_dist[settled] - path_dist
+
+        # Walk the path back: each class hands its via column to the next hop
+        col = sink
+        while True:
+            k = col_pred[col]
+            if k == source:
+                self._assign(self.free_rows[source].pop(), col)
+                break
+            via = class_via[k]
+            self._assign(self.col_to_row[via], col)
+            col = via
@@ -4,6 +4,7 @@ Handles roads, collision detection, and vehicle physics
 """
 import pygame
 import math
+from sim import stats
 
 class Road:
     """Road segment with collision detection"""
@@ -107,7 +108,7 @@ class Environment:
         self.roads = []
         self.bridges = []
         self.fuel_stations = []
-        self.off_road_penalty = 0.5  # Speed multiplier when off-road
+        self.off_road_penalty = stats.SURFACE_MODIFIERS['off_road']['speed']  # Speed multiplier when off-road
         
         self._create_default_environment()
     
@@ -154,12 +155,13 @@ class Environment:
                 return station
         return None
     
+    def get_surface(self, x, y):
+        """Get the surface type at a point"""
+        return 'road' if self.is_on_road(x, y) else 'off_road'
+    
     def get_speed_multiplier(self, truck_x, truck_y):
         """Get speed multiplier based on surface"""
-        if self.is_on_road(truck_x, truck_y):
-            return 1.0  # Normal speed on road
-        else:
-            return self.off_road_penalty  # Slower off-road
+        return stats.SURFACE_MODIFIERS[self.get_surface(truck_x, truck_y)]['speed']
     
     def render(self, screen, colors, font):
         """Render the environment"""
@@ -236,6 +238,7 @@ class CollisionSystem:
             'bridge_strike': False,
             'off_road': False,
             'fuel_station': None,
+            'surface': 'road',
             'speed_multiplier': 1.0,
             'penalties': []
         }
@@ -246,12 +249,10 @@ class CollisionSystem:
             results['bridge_strike'] = True
             results['penalties'].append(('Bridge Strike!', self.collision_penalties['bridge_strike']))
         
-        # Off-road check
-        if not self.environment.is_on_road(truck.x, truck.y):
-            results['off_road'] = True
-            results['speed_multiplier'] = self.environment.off_road_penalty
-        else:
-            results['speed_multiplier'] = self.environment.get_speed_multiplier(truck.x, truck.y)
+        # Off-road check (one road scan, shared by every result)
+        results['surface'] = self.environment.get_surface(truck.x, truck.y)
+        results['off_road'] = results['surface'] == 'off_road'
+        results['speed_multiplier'] = stats.SURFACE_MODIFIERS[results['surface']]['speed']
         
         # Fuel station check
         results['fuel_station'] = self.environment.get_nearby_fuel_station(truck_rect)
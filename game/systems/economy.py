@@ -0,0 +1,220 @@
+"""
+Economy Ledger
+Append-only record of every transaction, with running totals for profit reports
+
+Entries are stored column-wise in NumPy arrays that grow by doubling:
+time, category, amount (signed dollars), cargo type, lane and truck. Every
+append also updates running totals per category, cargo type, lane and truck,
+so reports never rescan the history, however long it gets. Lanes
+("Origin → Destination") are stored as small integer ids into `lanes`.
+"""
+import time
+import numpy as np
+from systems.pricing import CARGO_TYPES
+
+INITIAL_CAPACITY = 1024
+CATEGORIES = ('payout', 'time_bonus', 'penalty', 'fuel', 'upgrade')
+CATEGORY_CODES = {name: code for code, name in enumerate(CATEGORIES, 1)}
+CARGO_CODES = {name: code for code, name in enumerate(CARGO_TYPES, 1)}  # 0 = not tied to a haul
+COLUMNS = {
+    'time': np.float64,
+    'category': np.uint8,
+    'amount': np.int64,
+    'cargo': np.uint8,
+    'lane': np.int32,    # -1 = not tied to a lane
+    'truck': np.int16
+}
+COLUMN_PREFIX = 'ledger.'
+LANES_COLUMN = 'ledger.lanes'  # Lane names in id order, saved alongside the columns
+
+class Totals:
+    """Running income, expenses and entry count for one group"""
+
+    __slots__ = ('income', 'expenses', 'count')
+
+    def __init__(self):
+        self.income = 0
+        self.expenses = 0
+        self.count = 0
+
+    def __repr__(self):
+        return f"Totals(income={self.income}, expenses={self.expenses}, count={self.count})"
+
+    @property
+    def profit(self):
+        """Get income minus expenses"""
+        return self.income - self.expenses
+
+    def add(self, amount, sign=1):
+        """Count one entry (sign=-1 takes it back out)"""
+        if amount >= 0:
+            self.income += sign * amount
+        else:
+            self.expenses -= sign * amount
+        self.count += sign
+
+    def to_dict(self):
+        """Get the totals as a dict"""
+        return {'income': self.income, 'expenses': self.expenses, 'profit': self.profit, 'count': self.count}
+
+class Ledger:
+    """Columnar transaction log with O(1) running totals"""
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self.count = 0
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self.lanes = []
+        self.lane_ids = {}
+        self.truncated = None  # Lowest count truncated to since a reader last cleared this (autosave)
+        self.revision = 0  # Changes on every append or truncate, for caches built from the rows
+
+        # Running totals
+        self.total = Totals()
+        self.by_category = {}
+        self.by_cargo = {}
+        self.by_lane = {}
+        self.by_truck = {}
+
+    def __len__(self):
+        return self.count
+
+    def record(self, category, amount, cargo_type=None, lane=None, truck=0, timestamp=None):
+        """Append one transaction; amount is positive for income, negative for costs"""
+        lane_id = -1
+        if lane is not None:
+            lane_id = self.lane_ids.get(lane)
+            if lane_id is None:
+                lane_id = self.lane_ids[lane] = len(self.lanes)
+                self.lanes.append(lane)
+        self._append(time.time() if timestamp is None else timestamp, CATEGORY_CODES[category], int(amount),
+                     CARGO_CODES.get(cargo_type, 0), lane_id, truck)
+
+    def record_mission(self, contract, time_bonus, penalties):
+        """Record the payout, bonus and penalties of a delivered contract"""
+        cargo_type, lane = contract.cargo_type, contract.route_text
+        self.record('payout', contract.payout, cargo_type, lane)
+        if time_bonus:
+            self.record('time_bonus', time_bonus, cargo_type, lane)
+        for penalty in penalties:
+            self.record('penalty', -penalty, cargo_type, lane)
+
+    def truncate(self, count):
+        """Take back every entry after the first `count` (for mission retries)"""
+        columns = self.columns
+        for i in range(count, self.count):
+            self._tally(int(columns['amount'][i]), int(columns['category'][i]), int(columns['cargo'][i]),
+                        int(columns['lane'][i]), int(columns['truck'][i]), -1)
+        self.count = min(count, self.count)
+        self.revision += 1
+        self.truncated = self.count if self.truncated is None else min(self.truncated, self.count)
+
+    def entry(self, index):
+        """Get one entry as a JSON-friendly dict of record() arguments"""
+        columns = self.columns
+        lane = int(columns['lane'][index])
+        cargo = int(columns['cargo'][index])
+        return {
+            'timestamp': float(columns['time'][index]),
+            'category': CATEGORIES[columns['category'][index] - 1],
+            'amount': int(columns['amount'][index]),
+            'cargo_type': CARGO_TYPES[cargo - 1] if cargo else None,
+            'lane': self.lanes[lane] if lane >= 0 else None,
+            'truck': int(columns['truck'][index])
+        }
+
+    def view(self):
+        """Get read-only views of the recorded rows, one array per column"""
+        views = {}
+        for name, column in self.columns.items():
+            views[name] = column[:self.count]
+            views[name].flags.writeable = False
+        return views
+
+    def report(self):
+        """Get profit totals overall and per category, cargo type, lane and truck"""
+        return {
+            'total': self.total.to_dict(),
+            'category': {CATEGORIES[code - 1]: totals.to_dict() for code, totals in self.by_category.items()},
+            'cargo': {CARGO_TYPES[code - 1]: totals.to_dict() for code, totals in self.by_cargo.items() if code},
+            'lane': {self.lanes[lane]: totals.to_dict() for lane, totals in self.by_lane.items() if lane >= 0},
+            'truck': {truck: totals.to_dict() for truck, totals in self.by_truck.items()}
+        }
+
+    def copy(self):
+        """Get an independent copy"""
+        return Ledger.from_columns(self.to_columns())
+
+    def to_columns(self):
+        """Get copies of the rows as save file columns (see systems.save_game)"""
+        columns = {COLUMN_PREFIX + name: column[:self.count].copy() for name, column in self.columns.items()}
+        columns[LANES_COLUMN] = np.array([lane.encode('utf-8') for lane in self.lanes], dtype=bytes)
+        return columns
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Rebuild a ledger and its totals from save file columns"""
+        count = len(columns[COLUMN_PREFIX + 'amount']) if COLUMN_PREFIX + 'amount' in columns else 0
+        ledger = cls(max(INITIAL_CAPACITY, count))
+        for name, column in ledger.columns.items():
+            if count:
+                column[:count] = columns[COLUMN_PREFIX + name]
+        ledger.lanes = [lane.decode('utf-8') for lane in columns.get(LANES_COLUMN, ())]
+        ledger.lane_ids = {lane: i for i, lane in enumerate(ledger.lanes)}
+        ledger.count = count
+        ledger._rebuild_totals()
+        return ledger
+
+    def _append(self, timestamp, category, amount, cargo, lane, truck):
+        """Write one row, growing the columns when full"""
+        if self.count == len(self.columns['amount']):
+            for name, column in self.columns.items():
+                grown = np.zeros(len(column) * 2, dtype=column.dtype)
+                grown[:self.count] = column
+                self.columns[name] = grown
+        row = self.count
+        columns = self.columns
+        columns['time'][row] = timestamp
+        columns['category'][row] = category
+        columns['amount'][row] = amount
+        columns['cargo'][row] = cargo
+        columns['lane'][row] = lane
+        columns['truck'][row] = truck
+        self.count += 1
+        self.revision += 1
+        self._tally(amount, category, cargo, lane, truck, 1)
+
+    def _tally(self, amount, category, cargo, lane, truck, sign):
+        """Add one entry to (sign=1) or take it out of (sign=-1) the running totals"""
+        self.total.add(amount, sign)
+        for groups, key in ((self.by_category, category), (self.by_cargo, cargo),
+                            (self.by_lane, lane), (self.by_truck, truck)):
+            totals = groups.get(key)
+            if totals is None:
+                totals = groups[key] = Totals()
+            totals.add(amount, sign)
+            if not totals.count:
+                del groups[key]  # Fully taken back; reports match a ledger that never had it
+
+    def _rebuild_totals(self):
+        """Compute every running total from the columns in one vectorized pass (after loading)"""
+        amount = self.columns['amount'][:self.count]
+        income = np.where(amount >= 0, amount, 0)
+        expenses = np.where(amount < 0, -amount, 0)
+        self.total = Totals()
+        self.total.income, self.total.expenses, self.total.count = int(income.sum()), int(expenses.sum()), self.count
+        for groups, name in ((self.by_category, 'category'), (self.by_cargo, 'cargo'),
+                             (self.by_lane, 'lane'), (self.by_truck, 'truck')):
+            groups.clear()
+            if not self.count:
+                continue
+            # Sort rows by group, then sum each run of equal keys (exact in int64)
+            order = np.argsort(self.columns[name][:self.count], kind='stable')
+            keys = self.columns[name][:self.count][order]
+            starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+            group_income = np.add.reduceat(income[order], starts)
+            group_expenses = np.add.reduceat(expenses[order], starts)
+            counts = np.diff(np.append(starts, self.count))
+            for i, key in enumerate(keys[starts].tolist()):
+                totals = groups[key] = Totals()
+                totals.income, totals.expenses, totals.count = (int(group_income[i]), int(group_expenses[i]),
+                                                                int(counts[i]))
@@ -0,0 +1,155 @@
+"""
+Hot Reload System
+Watches config.yml and cities.json and rebuilds the tables that depend on them
+
+A background thread polls os.stat on the watched files. When one changes, the
+same thread loads it and rebuilds only the tables the change affects. The
+finished update waits until the main loop calls poll() between frames, and
+is then swapped in all at once, so a frame never sees half-updated data.
+Enable it in the modular game with HH_HOT_RELOAD=1. Replays recorded across
+a reload will not reproduce, because the rules changed mid-mission.
+"""
+import os
+import threading
+from data.config import CONFIG_PATH, get_config, load_config, set_config
+from data.loader import CITIES_PATH, load_cities
+from systems.pricing import PricingTable, get_pricing, set_pricing
+
+POLL_INTERVAL = 0.25  # Seconds between os.stat checks
+
+# Config sections each derived table is built from
+PRICING_SECTIONS = ('economy',)
+STATS_SECTIONS = ('vehicle', 'upgrades')
+
+def _file_signature(path):
+    """Get what we compare to detect a change (None if the file is missing)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+class FileWatcher:
+    """Polls file modification times on a daemon thread
+
+    on_change(changed_paths) runs on the watcher thread, once per poll that
+    finds changes.
+    """
+
+    def __init__(self, paths, on_change, interval=POLL_INTERVAL):
+        self.paths = list(paths)
+        self.on_change = on_change
+        self.interval = interval
+        self.signatures = {path: _file_signature(path) for path in self.paths}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start polling"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop polling and wait for the thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self):
+        """Compare signatures once and return the paths that changed"""
+        changed = []
+        for path in self.paths:
+            signature = _file_signature(path)
+            if signature != self.signatures[path]:
+                self.signatures[path] = signature
+                if signature is not None:  # Ignore the moment an editor deletes before rewriting
+                    changed.append(path)
+        return changed
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            changed = self.check()
+            if changed:
+                self.on_change(changed)
+
+class DataReloader:
+    """Rebuilds config-derived tables off the main thread and hands them over between frames
+
+    poll() returns None when nothing changed, otherwise a dict holding only
+    what was rebuilt: 'config' when a config section changed, plus 'stats'
+    when vehicle or upgrade settings did; 'cities' when the city list
+    changed; and 'pricing' when the economy or the cities changed. The
+    process-wide config and pricing table are already swapped when poll()
+    returns.
+    """
+
+    def __init__(self, config_path=CONFIG_PATH, cities_path=CITIES_PATH, interval=POLL_INTERVAL):
+        self.config_path = config_path
+        self.cities_path = cities_path
+        self.config = get_config()
+        self.cities = load_cities(cities_path)
+        self.pricing = get_pricing()
+        self.watcher = FileWatcher([config_path, cities_path], self._rebuild, interval)
+
+        self._ready = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start watching the data files"""
+        self.watcher.start()
+
+    def stop(self):
+        """Stop watching"""
+        self.watcher.stop()
+
+    def poll(self):
+        """Swap in finished rebuilds; call between frames"""
+        if self._ready is None:
+            return None
+        with self._lock:
+            update, self._ready = self._ready, None
+        if 'config' in update:
+            set_config(update['config'])
+        if 'pricing' in update:
+            set_pricing(update['pricing'])
+        return update
+
+    def _rebuild(self, changed):
+        """Load changed files and rebuild what depends on them (watcher thread)"""
+        update = {}
+        config = self.config
+        cities = self.cities
+        try:
+            if self.config_path in changed:
+                new_config = load_config(self.config_path)
+                changed_sections = [name for name in new_config.FIELDS
+                                    if getattr(new_config, name).to_dict() != getattr(config, name).to_dict()]
+                if changed_sections:
+                    config = update['config'] = new_config
+                    if any(name in STATS_SECTIONS for name in changed_sections):
+                        update['stats'] = True
+                    if any(name in PRICING_SECTIONS for name in changed_sections):
+                        update['pricing'] = None
+            if self.cities_path in changed:
+                new_cities = load_cities(self.cities_path)
+                if new_cities != cities:
+                    cities = update['cities'] = new_cities
+                    update['pricing'] = None
+            if 'pricing' in update:
+                update['pricing'] = PricingTable(config, cities)
+        except Exception as e:
+            # A half-saved or invalid file; keep the current data until it is fixed
+            print(f"Hot reload skipped: {e}")
+            return
+
+        if update:
+            self.config = config
+            self.cities = cities
+            with self._lock:
+                if self._ready is not None:
+                    self._ready.update(update)  # Main loop has not taken the last one yet
+                else:
+                    self._ready = update
+            print(f"Hot reloaded {', '.join(sorted(k for k in update if k != 'stats'))}")
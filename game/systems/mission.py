@@ -0,0 +1,5 @@
+"""
+Mission Simulation
+The driving mission now lives in sim.mission so every frontend shares it
+"""
+from sim.mission import DESTINATION_SCALE, MissionSimulation, begin_mission, end_mission
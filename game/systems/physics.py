@@ -1,56 +1,13 @@
 """
 Physics and Collision System
+pygame rendering for the road and hazard rules in sim.physics
 """
 import pygame
-import math
-from core.constants import BRIDGE_PENALTY
+from sim.physics import PhysicsModel
+
+class PhysicsSystem(PhysicsModel):
+    """Collision rules from PhysicsModel, plus roads and the bridge drawn with pygame"""
 
-class PhysicsSystem:
-    """Handles collision detection and physics interactions"""
-    
-    def __init__(self):
-        # Road network definition
-        self.roads = [
-            pygame.Rect(0, 250, 800, 100),      # Main horizontal road
-            pygame.Rect(150, 100, 100, 200),    # North vertical road
-            pygame.Rect(550, 300, 100, 200)     # South vertical road
-        ]
-        
-        # Hazards
-        self.bridge_danger = pygame.Rect(400, 250, 80, 20)
-        self.bridge_visual = pygame.Rect(400, 230, 80, 40)
-    
-    def is_on_road(self, truck):
-        """Check if truck is on a road"""
-        return any(road.collidepoint(truck.x, truck.y) for road in self.roads)
-    
-    def check_bridge_collision(self, game_state, truck):
-        """Check for bridge collision and apply penalty"""
-        truck_rect = truck.get_rect()
-        if self.bridge_danger.colliderect(truck_rect):
-            if not game_state.bridge_penalty_applied:
-                game_state.mission_penalties.append(BRIDGE_PENALTY)
-                game_state.bridge_penalty_applied = True
-            return True
-        return False
-    
-    def update_off_road_timer(self, game_state, truck, dt):
-        """Update off-road warning timer"""
-        if not self.is_on_road(truck) and abs(truck.speed) > 0:
-            if not hasattr(game_state, 'off_road_warning_time'):
-                game_state.off_road_warning_time = 0
-            game_state.off_road_warning_time += dt
-        else:
-            game_state.off_road_warning_time = 0
-    
-    def check_delivery_completion(self, game_state, truck, dest_x, dest_y, dest_radius=50):
-        """Check if truck has reached the destination"""
-        distance_to_dest = math.sqrt((truck.x - dest_x) ** 2 + (truck.y - dest_y) ** 2)
-        if distance_to_dest < dest_radius and not game_state.mission_completed:
-            game_state.mission_completed = True
-            return True
-        return False
-    
     def render_roads(self, screen):
         """Render the road network"""
         from core.constants import ROAD_GRAY, WHITE, YELLOW
@@ -0,0 +1,80 @@
+"""
+Contract Pricing System
+Precomputed payout matrix for every lane, cargo class and deadline tier
+"""
+import numpy as np
+from data.config import get_config
+from data.distances import get_distance_table
+
+CARGO_TYPES = ('Standard', 'Oversize', 'Superload')
+DEADLINE_TIERS = ('urgent', 'standard', 'relaxed')
+
+def deadline_tier(deadline_hours):
+    """Get the deadline tier index: urgent up to 4 hours, standard up to 6"""
+    if deadline_hours <= 4:
+        return 0
+    elif deadline_hours <= 6:
+        return 1
+    return 2
+
+class PricingTable:
+    """Contract payouts for one config and city list
+
+    payouts[cargo, tier] is a city-by-city matrix holding the same integer
+    payout Contract used to work out one contract at a time. Contracts between
+    cities that are not in the table fall back to the formula.
+    """
+
+    def __init__(self, config, cities):
+        economy = config.economy
+        self.base_rate = economy.base_rate_per_mile
+        self.distance_scale = economy.distance_scale
+        weights = economy.weight_multipliers.by_cargo_type()
+        bonuses = economy.oversize_bonuses.by_cargo_type()
+        # Same operation order as the per-contract formula, so payouts match exactly
+        self.cargo_factors = {cargo: 1 + (weights[cargo] - 1) + bonuses[cargo] for cargo in CARGO_TYPES}
+        tiers = economy.deadline_multipliers
+        self.deadline_multipliers = (tiers.urgent, tiers.standard, tiers.relaxed)
+
+        self.distances = get_distance_table(cities)
+        base = self.distances.miles * self.base_rate
+        self.payouts = {}
+        for cargo in CARGO_TYPES:
+            for tier, multiplier in enumerate(self.deadline_multipliers):
+                self.payouts[cargo, tier] = np.trunc(base * self.cargo_factors[cargo] * multiplier).astype(np.int64)
+
+    def distance(self, origin, destination):
+        """Get the grid distance in miles between two city dicts"""
+        return (abs(destination['x'] - origin['x']) + abs(destination['y'] - origin['y'])) / self.distance_scale
+
+    def payout(self, origin, destination, cargo_type, deadline_hours):
+        """Get the payout for a contract"""
+        tier = deadline_tier(deadline_hours)
+        i = self.distances.index.get(origin['name'])
+        j = self.distances.index.get(destination['name'])
+        if self._same_city(i, origin) and self._same_city(j, destination):
+            return int(self.payouts[cargo_type, tier][i, j])
+        base_payment = self.base_rate * self.distance(origin, destination)
+        return int(base_payment * self.cargo_factors[cargo_type] * self.deadline_multipliers[tier])
+
+    def _same_city(self, i, city):
+        """Check that a table row describes the same place as a city dict"""
+        if i is None:
+            return False
+        row = self.distances.cities[i]
+        return row['x'] == city['x'] and row['y'] == city['y']
+
+_pricing = None
+
+def get_pricing():
+    """Get the process-wide pricing table"""
+    global _pricing
+    if _pricing is None:
+        from data.loader import load_cities
+        _pricing = PricingTable(get_config(), load_cities())
+    return _pricing
+
+def set_pricing(pricing):
+    """Swap in a new pricing table (between frames)"""
+    global _pricing
+    _pricing = pricing
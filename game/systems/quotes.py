@@ -0,0 +1,311 @@
+"""
+Contract Quote System
+Estimates the real profit of a contract with Monte Carlo simulated drives
+"""
+import math
+import multiprocessing
+import zlib
+import threading
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from data.config import get_config, set_config
+from sim.fuel import FuelModel
+from sim.mission import DESTINATION_SCALE
+from sim.physics import PhysicsModel
+from sim import rules
+from sim.rules import DELIVERY_RADIUS, REFUEL_COST, TRUCK_BOUNDS, TRUCK_SIZE, TRUCK_START, WORLD_SIZE
+from sim.stats import StatsPipeline
+
+# Same layout as the simulation
+START_POSITION = TRUCK_START
+WORLD_BOUNDS = TRUCK_BOUNDS
+TRUCK_HALF_SIZE = (TRUCK_SIZE[0] // 2, TRUCK_SIZE[1] // 2)  # Half of TruckModel.get_rect()
+NOISE_BLOCK = 64  # Ticks of steering noise drawn per RNG call
+
+def _box_grid(boxes, margin_x=0, margin_y=0):
+    """Mark the one-unit map cells that lie within a margin of any (left, right, top, bottom) box"""
+    grid = np.zeros((WORLD_SIZE[1], WORLD_SIZE[0]), dtype=bool)
+    for left, right, top, bottom in boxes.astype(np.intp):
+        grid[max(0, top - margin_y):max(0, bottom + margin_y), max(0, left - margin_x):max(0, right + margin_x)] = True
+    return grid
+
+def _quote_seed(key):
+    """Seed a contract's drives from its key, leaving out the cache generation"""
+    return zlib.crc32(repr(key[1:]).encode())
+
+def _run_quote(engine_args, config, contract, upgrade_levels, seed):
+    """Quote one contract in a worker process, under the game's current config"""
+    set_config(config)  # Workers outlive hot reloads
+    return QuoteEngine(*engine_args, processes=0).simulate_quote(contract, upgrade_levels, seed)
+
+class QuoteEngine:
+    """Runs batches of headless drives per contract and summarizes the payout
+
+    Each simulated drive follows the same rules as the driving scene: the truck
+    accelerates and steers toward the destination with a per-driver wobble,
+    burns fuel like FuelModel, pays REFUEL_COST when it tops up at a station,
+    and is fined once if it clips the low bridge. A delivered load earns the
+    payout plus the time bonus from Game._calculate_mission_results, minus
+    penalties; running dry, getting no closer for give_up_seconds, or not
+    arriving within max_seconds earns nothing.
+
+    All drives of a batch advance together as NumPy arrays, one frame per step.
+    Quotes are cached per (route, cargo, deadline, upgrade levels) and computed
+    in a worker process, so the contract board never waits for them and a
+    long simulation never holds the game's GIL. With processes=0, or where
+    process pools are unavailable, the worker is a thread instead.
+    """
+
+    def __init__(self, upgrade_config=None, num_drives=256, max_seconds=180, give_up_seconds=15, processes=1):
+        self.upgrade_config = upgrade_config
+        self.num_drives = num_drives
+        self.processes = processes
+        self._engine_args = (upgrade_config, num_drives, max_seconds, give_up_seconds)
+        self.max_ticks = int(max_seconds * rules.FPS)
+        self.give_up_ticks = int(give_up_seconds * rules.FPS)
+
+        # Reuse the live world layout so quotes follow map changes
+        physics = PhysicsModel()
+        fuel = FuelModel()
+        self.roads = np.array([(r.left, r.right, r.top, r.bottom) for r in physics.roads], dtype=np.float64)
+        bridge = physics.bridge_danger
+        self.bridges = np.array([(bridge.left, bridge.right, bridge.top, bridge.bottom)], dtype=np.float64)
+        zones = [station['rect'].inflate(40, 40) for station in fuel.fuel_stations]
+        self.stations = np.array([(z.left, z.right, z.top, z.bottom) for z in zones], dtype=np.float64)
+
+        # Map lookups: roads are exact (integer edges, edge-exclusive like
+        # collidepoint); station and bridge cells only flag trucks that need
+        # the exact overlap test, so they are widened by one unit
+        half_w, half_h = TRUCK_HALF_SIZE
+        self.road_grid = _box_grid(self.roads)
+        self.station_grid = _box_grid(self.stations, half_w + 1, half_h + 1)
+        self.bridge_grid = _box_grid(self.bridges, half_w + 1, half_h + 1)
+
+        self._cache = {}
+        self._pending = {}  # key -> Future of a quote being computed
+        self._generation = 0  # Bumped by clear(); part of every key, so older work is never cached
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def get_quote(self, contract, upgrade_levels=(1, 1, 1)):
+        """Get a cached quote, or None while it is still being computed"""
+        key = self._quote_key(contract, upgrade_levels)
+        with self._lock:
+            quote = self._cache.get(key)
+            if quote is not None or key in self._pending:
+                return quote
+            future = self._pending[key] = self._submit(key, contract, tuple(upgrade_levels))
+        future.add_done_callback(lambda done: self._store(key, done))
+        return None
+
+    def quote(self, contract, upgrade_levels=(1, 1, 1)):
+        """Compute (or fetch) a quote right away on the calling thread"""
+        key = self._quote_key(contract, upgrade_levels)
+        with self._lock:
+            quote = self._cache.get(key)
+        if quote is None:
+            quote = self._compute(key, contract, upgrade_levels)
+        return quote
+
+    def clear(self):
+        """Drop cached quotes (after pricing or upgrade tables change)"""
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+            for future in self._pending.values():
+                future.cancel()  # Queued work from before the clear never starts
+            self._pending.clear()
+
+    def shutdown(self):
+        """Stop the worker"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _submit(self, key, contract, upgrade_levels):
+        """Queue a quote on the worker, falling back to a thread if processes are unavailable"""
+        seed = _quote_seed(key)
+        if self._executor is None and self.processes != 0:
+            # Spawned, not forked: the game already runs autosave and reload threads
+            self._executor = ProcessPoolExecutor(max_workers=self.processes,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+        if isinstance(self._executor, ProcessPoolExecutor):
+            try:
+                return self._executor.submit(_run_quote, self._engine_args, get_config(), contract,
+                                             upgrade_levels, seed)
+            except (OSError, NotImplementedError):
+                self._executor.shutdown(wait=False)  # No multiprocessing on this platform (e.g. some Android builds)
+                self.processes = 0
+        if self._executor is None or isinstance(self._executor, ProcessPoolExecutor):
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor.submit(self.simulate_quote, contract, upgrade_levels, seed)
+
+    def _store(self, key, future):
+        """Cache a finished quote unless clear() ran since it was requested"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        with self._lock:
+            if key[0] != self._generation:
+                return
+            self._pending.pop(key, None)
+            if error is None:
+                self._cache[key] = future.result()
+        if error is not None:
+            print(f"Quote failed: {error}")  # The board asks again on its next frame
+            if isinstance(error, BrokenExecutor):
+                self.processes = 0  # The worker process died; quote on a thread from now on
+                self._executor = None
+
+    def _quote_key(self, contract, upgrade_levels):
+        """Build the cache key for a contract"""
+        return (self._generation, contract.origin['name'], contract.destination['name'],
+                contract.cargo_type, contract.deadline_hours, tuple(upgrade_levels))
+
+    def _compute(self, key, contract, upgrade_levels):
+        """Simulate a contract on this thread and store its quote"""
+        quote = self.simulate_quote(contract, upgrade_levels, _quote_seed(key))
+        with self._lock:
+            if key[0] == self._generation:
+                self._cache[key] = quote
+        return quote
+
+    def simulate_quote(self, contract, upgrade_levels, seed):
+        """Simulate a contract with a seeded batch of drives and summarize it"""
+        outcome = self.simulate(contract, upgrade_levels, np.random.default_rng(seed))
+        return self.summarize(contract, outcome)
+
+    def simulate(self, contract, upgrade_levels=(1, 1, 1), rng=None):
+        """Run a batch of drives and return per-drive outcome arrays"""
+        if rng is None:
+            rng = np.random.default_rng()
+        n = self.num_drives
+        pipeline = StatsPipeline(self.upgrade_config)
+        pipeline.set_upgrades(upgrade_levels)
+        pipeline.set_cargo(contract.cargo_type)
+        stats = pipeline.effective
+        max_speed = stats.max_speed
+        capacity = stats.fuel_capacity
+        dest_x = contract.destination['x'] * DESTINATION_SCALE[0]
+        dest_y = contract.destination['y'] * DESTINATION_SCALE[1]
+        left, right, top, bottom = WORLD_BOUNDS
+
+        x = np.full(n, float(START_POSITION[0]))
+        y = np.full(n, float(START_POSITION[1]))
+        angle = np.zeros(n)
+        speed = 0.0  # Every drive starts at rest and holds the accelerator, so active drives share one speed
+        fuel = np.full(n, capacity)
+
+        # Driver behaviour: heading wobble and how low they let the tank get
+        wobble = np.zeros(n)
+        wobble_step = rng.uniform(0.5, 3.0, n)
+        refuel_below = rng.uniform(0.2, 0.6, n) * capacity
+
+        active = np.ones(n, dtype=bool)
+        delivered = np.zeros(n, dtype=bool)
+        finish_tick = np.full(n, self.max_ticks)
+        bridge_hit = np.zeros(n, dtype=bool)
+        refuels = np.zeros(n, dtype=np.int64)
+        off_road_ticks = np.zeros(n, dtype=np.int64)
+        closest = np.hypot(x - dest_x, y - dest_y)
+        last_progress = np.zeros(n, dtype=np.int64)
+
+        # Finished drives keep computing but are masked out, which costs less
+        # than indexing the active ones every tick
+        for tick in range(self.max_ticks):
+            # Out of fuel ends the mission before the truck moves
+            dry = active & (fuel <= 0)
+            finish_tick[dry] = tick
+            active &= ~dry
+            if not active.any():
+                break
+
+            # Refuel when passing a station with a low tank
+            cell_x, cell_y = x.astype(np.intp), y.astype(np.intp)
+            at_station = self._touching(self.station_grid, self.stations, x, y, cell_x, cell_y)
+            topping = active & at_station & (fuel < refuel_below)
+            refuels += topping
+            fuel[topping] = capacity
+
+            # Steer toward the destination
+            if tick % NOISE_BLOCK == 0:
+                noise = rng.standard_normal((NOISE_BLOCK, n))  # Same stream as one normal() per tick
+            wobble += noise[tick % NOISE_BLOCK] * wobble_step
+            wobble *= 0.98
+            target = np.degrees(np.arctan2(dest_y - y, dest_x - x)) + wobble
+            diff = (target - angle + 180.0) % 360.0 - 180.0
+            if speed > 0.1:
+                turning = active & (np.abs(diff) > stats.turn_speed / 2)
+                angle += turning * (stats.turn_speed * np.sign(diff))
+
+            # Truck.update with the accelerator held
+            speed = min(speed + stats.acceleration, max_speed)
+            rad = np.radians(angle)
+            np.copyto(x, np.minimum(np.maximum(x + np.cos(rad) * speed, left), right), where=active)
+            np.copyto(y, np.minimum(np.maximum(y + np.sin(rad) * speed, top), bottom), where=active)
+
+            # FuelModel.update_fuel_consumption
+            if speed > 0.1:
+                np.copyto(fuel, np.maximum(0.0, fuel - stats.fuel_drain_rate * (1 + speed / 5)), where=active)
+
+            # PhysicsModel checks
+            cell_x, cell_y = x.astype(np.intp), y.astype(np.intp)
+            off_road_ticks += active & ~self.road_grid[cell_y, cell_x]
+            bridge_hit |= active & self._touching(self.bridge_grid, self.bridges, x, y, cell_x, cell_y)
+
+            dist = np.hypot(x - dest_x, y - dest_y)
+            arrived = active & (dist < DELIVERY_RADIUS)
+            delivered |= arrived
+            finish_tick[arrived] = tick + 1
+            active &= ~arrived
+
+            # Drivers stuck against the map edge give up
+            closer = dist < closest - 1.0
+            np.copyto(closest, dist, where=closer)
+            np.copyto(last_progress, tick, where=closer)
+            stuck = active & (tick - last_progress > self.give_up_ticks)
+            finish_tick[stuck] = tick + 1
+            active &= ~stuck
+
+        return {
+            'delivered': delivered,
+            'mission_seconds': finish_tick / rules.FPS,
+            'penalties': np.where(bridge_hit, rules.BRIDGE_PENALTY * stats.damage_multiplier, 0.0),
+            'refuel_costs': refuels * float(REFUEL_COST),
+            'off_road_seconds': off_road_ticks / rules.FPS
+        }
+
+    def _touching(self, grid, boxes, x, y, cell_x, cell_y):
+        """Check which trucks overlap any of a set of (left, right, top, bottom) boxes
+
+        The grid lookup rules out most trucks; only the ones it flags get the
+        exact Rect.colliderect test.
+        """
+        touching = grid[cell_y, cell_x]
+        flagged = np.flatnonzero(touching)
+        if flagged.size:
+            half_w, half_h = TRUCK_HALF_SIZE
+            fx, fy = x[flagged, None], y[flagged, None]
+            touching[flagged] = ((fx - half_w < boxes[:, 1]) & (fx + half_w > boxes[:, 0]) &
+                                 (fy - half_h < boxes[:, 3]) & (fy + half_h > boxes[:, 2])).any(axis=1)
+        return touching
+
+    def summarize(self, contract, outcome):
+        """Turn per-drive outcomes into an expected net profit with a 95% interval"""
+        delivered = outcome['delivered']
+        time_remaining = np.maximum(0.0, contract.get_deadline_seconds() - outcome['mission_seconds'])
+        time_bonus = np.floor(time_remaining * 10)
+        earned = np.where(delivered, contract.payout + time_bonus - outcome['penalties'], 0.0)
+        net = earned - outcome['refuel_costs']
+
+        mean = float(net.mean())
+        margin = 1.96 * float(net.std(ddof=1)) / math.sqrt(len(net)) if len(net) > 1 else 0.0
+        return {
+            'expected_profit': mean,
+            'low': mean - margin,
+            'high': mean + margin,
+            'success_rate': float(delivered.mean()),
+            'expected_penalties': float(np.where(delivered, outcome['penalties'], 0.0).mean()),
+            'expected_refuel_cost': float(outcome['refuel_costs'].mean()),
+            'mean_mission_seconds': float(outcome['mission_seconds'][delivered].mean()) if delivered.any() else None
+        }
@@ -0,0 +1,163 @@
+"""
+Mission Replay System
+Records per-frame driving input and replays it headless at full speed
+"""
+import json
+import random
+import sys
+import time
+from array import array
+import pygame
+from core.game_state import GameState
+from entities.contract import Contract
+from entities.truck import Truck
+from sim.controls import INPUT_BITS, Controls
+from sim.rules import TRUCK_START
+from systems.mission import MissionSimulation
+
+REPLAY_VERSION = 1
+BINARY_EXTENSION = '.hhr'
+
+# pygame keys for each input bit (sim.controls.INPUT_BITS)
+KEY_BITS = {
+    pygame.K_UP: INPUT_BITS['up'], pygame.K_w: INPUT_BITS['up'],
+    pygame.K_DOWN: INPUT_BITS['down'], pygame.K_s: INPUT_BITS['down'],
+    pygame.K_LEFT: INPUT_BITS['left'], pygame.K_a: INPUT_BITS['left'],
+    pygame.K_RIGHT: INPUT_BITS['right'], pygame.K_d: INPUT_BITS['right'],
+    pygame.K_r: INPUT_BITS['refuel']
+}
+
+def encode_keys(keys):
+    """Pack the driving keys of a pygame key state into a bitmask"""
+    mask = 0
+    for key, bit in KEY_BITS.items():
+        if keys[key]:
+            mask |= bit
+    return mask
+
+class KeyState(Controls):
+    """Controls that also answer like pygame.key.get_pressed() for the recorded bitmask"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+def contract_to_dict(contract):
+    """Serialize a contract"""
+    return {
+        'origin': contract.origin,
+        'destination': contract.destination,
+        'cargo_type': contract.cargo_type,
+        'deadline_hours': contract.deadline_hours,
+        'cargo_description': contract.cargo_description
+    }
+
+def contract_from_dict(data):
+    """Rebuild a contract saved with contract_to_dict()"""
+    contract = Contract(data['origin'], data['destination'], data['cargo_type'], data['deadline_hours'])
+    contract.cargo_description = data['cargo_description']
+    return contract
+
+class InputRecorder:
+    """Logs one input bitmask per simulated frame of a mission"""
+
+    def __init__(self):
+        self.header = None
+        self.inputs = array('B')
+        self.result = None
+
+    def start(self, seed, game_state):
+        """Begin a recording from the mission's starting state"""
+        self.header = {
+            'version': REPLAY_VERSION,
+            'seed': seed,
+            'contract': contract_to_dict(game_state.current_contract),
+            'cash': game_state.cash,
+            'fuel': game_state.fuel
+        }
+        self.inputs = array('B')
+        self.result = None
+
+    def record(self, mask):
+        """Add the input for one frame"""
+        self.inputs.append(mask)
+
+    def finish(self, game_state):
+        """Store the outcome so replays can be checked against it"""
+        self.result = mission_result(game_state)
+
+    def to_dict(self):
+        """Get the recording as a JSON-friendly dict"""
+        return dict(self.header, inputs=self.inputs.tolist(), result=self.result)
+
+    def save(self, path):
+        """Write the recording, as a binary replay file if the path ends in .hhr"""
+        if path.endswith(BINARY_EXTENSION):
+            from systems.replay_file import write_replay
+            write_replay(path, self.to_dict())
+            return
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+def load_replay(path):
+    """Load a recording saved as JSON or as a binary replay file"""
+    if path.endswith(BINARY_EXTENSION):
+        from systems.replay_file import ReplayFile
+        with ReplayFile(path) as replay:
+            return replay.to_dict()
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def mission_result(game_state):
+    """Summarize the outcome of a finished mission"""
+    return {
+        'completed': game_state.mission_completed,
+        'mission_time': game_state.last_mission_time,
+        'time_bonus': game_state.last_time_bonus,
+        'penalties': list(game_state.last_penalties),
+        'cash': game_state.cash,
+        'fuel': game_state.fuel
+    }
+
+def start_mission(replay):
+    """Build a fresh mission simulation from a recording's starting state"""
+    game_state = GameState()
+    game_state.cash = replay['cash']
+    game_state.fuel = replay['fuel']
+    game_state.current_contract = contract_from_dict(replay['contract'])
+    game_state.switch_scene("driving")
+    game_state.reset_mission_state()
+    random.seed(replay['seed'])  # Same point as Game._start_mission
+    return MissionSimulation(game_state, Truck(*TRUCK_START))
+
+def run_replay(replay):
+    """Feed a recording back through the simulation as fast as possible
+
+    Returns the mission result, which matches replay['result'] for a faithful
+    recording.
+    """
+    mission = start_mission(replay)
+    keys = KeyState()
+    for mask in replay['inputs']:
+        keys.mask = mask
+        if mission.step(keys):
+            break
+    return mission_result(mission.game_state)
+
+def main(paths):
+    """Replay recordings from the command line and check them"""
+    mismatches = 0
+    for path in paths:
+        replay = load_replay(path)
+        start = time.perf_counter()
+        result = run_replay(replay)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        matches = replay.get('result') is None or result == replay['result']
+        mismatches += not matches
+        print(f"{path}: {len(replay['inputs'])} frames in {elapsed_ms:.1f} ms - "
+              f"{'OK' if matches else 'MISMATCH'} {result}")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
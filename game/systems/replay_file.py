@@ -0,0 +1,252 @@
+"""
+Replay File Format
+Compact binary mission recordings with keyframes for seeking
+
+Layout (little-endian):
+    header      magic, version, fps, keyframe interval, tick count, seed, sizes
+    meta        UTF-8 JSON: contract, starting cash/fuel and the recorded result
+    inputs      runs of (mask XOR previous mask, varint run length)
+    keyframes   full mission state every keyframe interval, for seeking
+    index       (tick, file offset) per keyframe
+    footer      index offset, keyframe count, magic
+
+Keyframes are produced by re-simulating the inputs when the file is written,
+so recording during play stays a one-byte append per frame.
+"""
+import bisect
+import json
+import mmap
+import struct
+from sim import rules
+from systems.replay import KeyState, start_mission, mission_result
+
+MAGIC = b'HHRP'
+INDEX_MAGIC = b'HHIX'
+FILE_VERSION = 1
+
+HEADER = struct.Struct('<4sHHIIQII')     # magic, version, fps, keyframe interval, ticks, seed, meta size, stream size
+# tick, stream offset, run skip, previous mask; truck x/y/angle/speed and fuel as doubles; cash as an
+# int64 like save_game.STATE; mission ticks, completed/bridge/refuel flags, off-road time, penalty count
+KEYFRAME = struct.Struct('<IIIB5dqI???dH')
+PENALTY = struct.Struct('<i')
+INDEX_ENTRY = struct.Struct('<IQ')
+FOOTER = struct.Struct('<QI4s')
+
+def _write_varint(out, value):
+    """Append an unsigned LEB128 varint"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(buffer, offset):
+    """Read an unsigned LEB128 varint; returns (value, next offset)"""
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+def encode_inputs(inputs):
+    """Run-length and delta encode input masks
+
+    Returns the encoded stream and, per run, (first tick, byte offset, mask
+    before the run) so keyframes can point into the stream.
+    """
+    stream = bytearray()
+    runs = []
+    previous = 0
+    i = 0
+    while i < len(inputs):
+        mask = inputs[i]
+        length = 1
+        while i + length < len(inputs) and inputs[i + length] == mask:
+            length += 1
+        runs.append((i, len(stream), previous))
+        stream.append(mask ^ previous)
+        _write_varint(stream, length)
+        previous = mask
+        i += length
+    return bytes(stream), runs
+
+def decode_inputs(buffer, start, end, skip=0, previous=0):
+    """Yield input masks from an encoded stream, skipping into the first run"""
+    offset = start
+    while offset < end:
+        mask = buffer[offset] ^ previous
+        length, offset = _read_varint(buffer, offset + 1)
+        for _ in range(length - skip):
+            yield mask
+        skip = 0
+        previous = mask
+
+def _capture_keyframe(mission, tick, run):
+    """Pack the mission state after `tick` frames"""
+    game_state = mission.game_state
+    truck = mission.truck
+    first_tick, stream_offset, previous = run
+    record = KEYFRAME.pack(
+        tick, stream_offset, tick - first_tick, previous,
+        truck.x, truck.y, truck.angle, truck.speed, game_state.fuel, int(game_state.cash),
+        mission.ticks, game_state.mission_completed, game_state.bridge_penalty_applied,
+        game_state.refuel_available, game_state.off_road_warning_time,
+        len(game_state.mission_penalties))
+    return record + b''.join(PENALTY.pack(p) for p in game_state.mission_penalties)
+
+def write_replay(path, replay, keyframe_seconds=5):
+    """Write a recording (InputRecorder.to_dict() format) as a binary replay file"""
+    inputs = replay['inputs']
+    interval = max(1, int(keyframe_seconds * rules.FPS))
+    stream, runs = encode_inputs(inputs)
+    meta = json.dumps({
+        'contract': replay['contract'],
+        'cash': replay['cash'],
+        'fuel': replay['fuel'],
+        'result': replay.get('result')
+    }).encode('utf-8')
+
+    # Re-simulate to capture keyframes at every interval
+    keyframes = []
+    run_starts = [run[0] for run in runs]
+    mission = start_mission(replay)
+    keys = KeyState()
+    for tick, mask in enumerate(inputs):
+        if tick % interval == 0:
+            run = runs[bisect.bisect_right(run_starts, tick) - 1]
+            keyframes.append((tick, _capture_keyframe(mission, tick, run)))
+        keys.mask = mask
+        if mission.step(keys):
+            break
+    if not keyframes:
+        keyframes.append((0, _capture_keyframe(mission, 0, (0, 0, 0))))
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FILE_VERSION, rules.FPS, interval, len(inputs),
+                            replay['seed'], len(meta), len(stream)))
+        f.write(meta)
+        f.write(stream)
+        index = []
+        for tick, record in keyframes:
+            index.append(INDEX_ENTRY.pack(tick, f.tell()))
+            f.write(record)
+        index_offset = f.tell()
+        f.write(b''.join(index))
+        f.write(FOOTER.pack(index_offset, len(keyframes), INDEX_MAGIC))
+
+class ReplayFile:
+    """Memory-mapped reader for binary replay files
+
+    Opening a file only reads the header, meta and index; inputs are decoded
+    lazily straight from the mapping, so large archives can be scanned cheaply.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self.fps, self.keyframe_interval, self.num_ticks,
+         self.seed, meta_size, stream_size) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FILE_VERSION:
+            raise ValueError(f"{path} is not a version {FILE_VERSION} replay file")
+
+        meta_start = HEADER.size
+        self.meta = json.loads(self._map[meta_start:meta_start + meta_size].decode('utf-8'))
+        self._stream_start = meta_start + meta_size
+        self._stream_end = self._stream_start + stream_size
+
+        index_offset, count, index_magic = FOOTER.unpack_from(self._map, len(self._map) - FOOTER.size)
+        if index_magic != INDEX_MAGIC:
+            raise ValueError(f"{path} has a damaged keyframe index")
+        entries = [INDEX_ENTRY.unpack_from(self._map, index_offset + i * INDEX_ENTRY.size)
+                   for i in range(count)]
+        self.keyframe_ticks = [tick for tick, _ in entries]
+        self._keyframe_offsets = [offset for _, offset in entries]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the mapping"""
+        self._map.close()
+        self._file.close()
+
+    @property
+    def duration(self):
+        """Get the recording length in seconds"""
+        return self.num_ticks / self.fps
+
+    def inputs(self):
+        """Yield every input mask from the start"""
+        return decode_inputs(self._map, self._stream_start, self._stream_end)
+
+    def to_dict(self):
+        """Get the recording in InputRecorder.to_dict() format"""
+        return dict(self.meta, seed=self.seed, inputs=list(self.inputs()))
+
+    def seek(self, seconds):
+        """Get a mission simulation positioned at a timestamp
+
+        Restores the nearest keyframe at or before the time and re-simulates
+        only the frames after it. Returns (mission, remaining input iterator).
+        """
+        tick = max(0, min(self.num_ticks, int(seconds * self.fps)))
+        position = bisect.bisect_right(self.keyframe_ticks, tick) - 1
+        mission, inputs = self._restore_keyframe(position)
+
+        keys = KeyState()
+        for _ in range(tick - self.keyframe_ticks[position]):
+            keys.mask = next(inputs)
+            if mission.step(keys):
+                break
+        return mission, inputs
+
+    def run(self, from_seconds=0):
+        """Play from a timestamp to the end and return the mission result"""
+        mission, inputs = self.seek(from_seconds)
+        keys = KeyState()
+        for mask in inputs:
+            keys.mask = mask
+            if mission.step(keys):
+                break
+        return mission_result(mission.game_state)
+
+    def _restore_keyframe(self, position):
+        """Rebuild mission state from a keyframe"""
+        offset = self._keyframe_offsets[position]
+        (tick, stream_offset, run_skip, previous, x, y, angle, speed, fuel, cash,
+         mission_ticks, completed, bridge_applied, refuel_available, off_road_time,
+         penalty_count) = KEYFRAME.unpack_from(self._map, offset)
+        penalties_start = offset + KEYFRAME.size
+        penalties = [PENALTY.unpack_from(self._map, penalties_start + i * PENALTY.size)[0]
+                     for i in range(penalty_count)]
+
+        mission = start_mission(dict(self.meta, seed=self.seed))
+        truck = mission.truck
+        truck.x, truck.y, truck.angle, truck.speed = x, y, angle, speed
+        game_state = mission.game_state
+        game_state.fuel = fuel
+        game_state.cash = cash
+        game_state.mission_completed = completed
+        game_state.bridge_penalty_applied = bridge_applied
+        game_state.refuel_available = refuel_available
+        game_state.off_road_warning_time = off_road_time
+        game_state.mission_penalties = penalties
+        mission.ticks = mission_ticks
+
+        inputs = decode_inputs(self._map, self._stream_start + stream_offset, self._stream_end,
+                               skip=run_skip, previous=previous)
+        return mission, inputs
+
+def scan_archive(paths):
+    """Yield (path, duration, meta) for many replay files without decoding inputs"""
+    for path in paths:
+        with ReplayFile(path) as replay:
+            yield path, replay.duration, replay.meta
@@ -0,0 +1,195 @@
+"""
+Save Game Format
+Versioned binary snapshots of the company: game state, upgrades, market and fleet
+
+Layout (little-endian):
+    header      magic, version, section count, directory offset, save time
+    state       cash, fuel, upgrade levels and scene as one fixed record
+    sections    market JSON, then one raw array per column (fleet.*, ledger.*, ...)
+    directory   (name, dtype, offset, size) per section
+
+Opening a save reads only the header, state record and directory. The market
+JSON is parsed on first use, and column arrays are zero-copy views of a memory
+mapping, so a save holding thousands of trucks opens in about the same time
+as an empty one.
+"""
+import json
+import mmap
+import struct
+import time
+import numpy as np
+from core.paths import write_atomic
+from systems.economy import COLUMN_PREFIX as LEDGER_PREFIX, Ledger
+from systems.replay import contract_to_dict, contract_from_dict
+
+MAGIC = b'HHSV'
+FILE_VERSION = 1
+SAVE_FILENAME = 'company.hhs'
+SCENES = ('contracts', 'driving', 'results')
+JSON_DTYPE = 'json'
+ALIGNMENT = 8  # Column arrays start on 8-byte boundaries so views are aligned
+NAME_BYTES = 32  # Longest section name the directory holds, in UTF-8 bytes
+
+HEADER = struct.Struct('<4sHHQd')         # magic, version, section count, directory offset, saved at
+STATE = struct.Struct('<qdBBBB')          # cash, fuel, engine/fuel tank/frame levels, scene
+DIRECTORY_ENTRY = struct.Struct(f'<{NAME_BYTES}s8sQQ')  # name, dtype, offset, size
+
+def contract_to_save(contract):
+    """Serialize a contract, keeping its agreed payout"""
+    return dict(contract_to_dict(contract), payout=contract.payout)
+
+def contract_from_save(data):
+    """Rebuild a saved contract with its original payout"""
+    contract = contract_from_dict(data)
+    contract.payout = data['payout']
+    return contract
+
+def capture_company(game_state):
+    """Get everything a save holds from a GameState, as plain data"""
+    current = game_state.current_contract
+    return {
+        'cash': game_state.cash,
+        'fuel': game_state.fuel,
+        'upgrade_levels': tuple(game_state.upgrade_levels),
+        'scene': game_state.scene,
+        'market': [contract_to_save(contract) for contract in game_state.available_contracts],
+        'current': contract_to_save(current) if current is not None else None,
+        'completed': list(game_state.completed_contracts),
+        'ledger': game_state.ledger.copy()
+    }
+
+def restore_company(game_state, company):
+    """Load plain company data into a GameState
+
+    A mission in progress cannot be resumed; it is abandoned and play
+    continues from contract selection.
+    """
+    game_state.cash = company['cash']
+    game_state.fuel = company['fuel']
+    game_state.upgrade_levels = tuple(company['upgrade_levels'])
+    game_state.available_contracts = [contract_from_save(data) for data in company['market']]
+    game_state.completed_contracts = list(company['completed'])
+    game_state.ledger = company['ledger']
+    game_state.current_contract = None
+    game_state.switch_scene('contracts')
+
+def write_save(path, game_state, fleet=None, columns=None):
+    """Write a GameState to a save file atomically"""
+    write_company(path, capture_company(game_state), fleet, columns)
+
+def write_company(path, company, fleet=None, columns=None):
+    """Write plain company data to a save file atomically
+
+    fleet is a dict of equal-length arrays, one per fleet attribute, stored as
+    'fleet.<name>' columns. The ledger is stored as 'ledger.<name>' columns.
+    columns holds any other named arrays. Section names longer than
+    NAME_BYTES raise ValueError rather than being cut short.
+    """
+    market = {'available': company['market'], 'current': company['current'], 'completed': company['completed']}
+    sections = [('market', JSON_DTYPE, json.dumps(market).encode('utf-8'))]
+    named = {f"fleet.{name}": values for name, values in (fleet or {}).items()}
+    if company.get('ledger') is not None:
+        named.update(company['ledger'].to_columns())
+    named.update(columns or {})
+    for name, values in named.items():
+        if len(name.encode('utf-8')) > NAME_BYTES:
+            raise ValueError(f"Save section name {name!r} is longer than {NAME_BYTES} bytes")
+        values = np.ascontiguousarray(values)
+        dtype = values.dtype.newbyteorder('<') if values.dtype.byteorder == '>' else values.dtype
+        sections.append((name, dtype.str, values.astype(dtype, copy=False).tobytes()))
+
+    body = bytearray()
+    offset = HEADER.size + STATE.size
+    directory = []
+    for name, dtype, data in sections:
+        padding = -(offset + len(body)) % ALIGNMENT
+        body += b'\0' * padding
+        directory.append(DIRECTORY_ENTRY.pack(name.encode('utf-8'), dtype.encode('ascii'),
+                                              offset + len(body), len(data)))
+        body += data
+    directory_offset = offset + len(body)
+
+    engine, fuel_tank, frame = company['upgrade_levels']
+    scene = SCENES.index(company['scene']) if company['scene'] in SCENES else 0
+    header = HEADER.pack(MAGIC, FILE_VERSION, len(sections), directory_offset, time.time())
+    state = STATE.pack(int(company['cash']), float(company['fuel']), engine, fuel_tank, frame, scene)
+    write_atomic(path, header + state + bytes(body) + b''.join(directory))
+
+class SaveFile:
+    """Memory-mapped reader for save files
+
+    Column arrays returned by column() and fleet() are read-only views of the
+    mapping; copy them to keep them after close().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, directory_offset, self.saved_at = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FILE_VERSION:
+            raise ValueError(f"{path} is not a version {FILE_VERSION} save file")
+        (self.cash, self.fuel, engine, fuel_tank, frame,
+         scene) = STATE.unpack_from(self._map, HEADER.size)
+        self.upgrade_levels = (engine, fuel_tank, frame)
+        self.scene = SCENES[scene] if scene < len(SCENES) else SCENES[0]
+
+        self.sections = {}
+        for i in range(count):
+            name, dtype, offset, size = DIRECTORY_ENTRY.unpack_from(
+                self._map, directory_offset + i * DIRECTORY_ENTRY.size)
+            self.sections[name.rstrip(b'\0').decode('utf-8')] = (dtype.rstrip(b'\0').decode('ascii'), offset, size)
+        self._market = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the mapping (it stays open while column views are alive)"""
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # Views still exist; the mapping is freed with the last one
+        self._file.close()
+
+    @property
+    def market(self):
+        """Get the saved contract board as plain dicts"""
+        if self._market is None:
+            _, offset, size = self.sections['market']
+            self._market = json.loads(self._map[offset:offset + size].decode('utf-8'))
+        return self._market
+
+    def column(self, name):
+        """Get a saved array as a read-only view"""
+        dtype, offset, size = self.sections[name]
+        dtype = np.dtype(dtype)
+        return np.frombuffer(self._map, dtype=dtype, count=size // dtype.itemsize, offset=offset)
+
+    def fleet(self):
+        """Get the fleet columns as a dict of arrays"""
+        return {name[len('fleet.'):]: self.column(name)
+                for name in self.sections if name.startswith('fleet.')}
+
+    def company(self):
+        """Get the saved company as plain data (see capture_company)"""
+        market = self.market
+        return {
+            'cash': self.cash,
+            'fuel': self.fuel,
+            'upgrade_levels': self.upgrade_levels,
+            'scene': self.scene,
+            'market': market['available'],
+            'current': market['current'],
+            'completed': market.get('completed', []),
+            'ledger': Ledger.from_columns({name: self.column(name) for name in self.sections
+                                           if name.startswith(LEDGER_PREFIX)})
+        }
+
+    def restore(self, game_state):
+        """Load the saved company into a GameState"""
+        restore_company(game_state, self.company())
@@ -0,0 +1,193 @@
+"""
+Mission Telemetry
+Typed mission events and per-tick truck samples in preallocated ring buffers, flushed in the background
+
+Each mission is written as one compressed .npz file with a column per field
+(sample_tick, x, y, speed, fuel, event_tick, event_type, event_value) plus a
+JSON 'meta' entry, so thousands of sessions can be loaded column-wise offline.
+"""
+import json
+import os
+import queue
+import threading
+import time
+import numpy as np
+
+TELEMETRY_VERSION = 1
+
+# Event types; event_value holds the dollar amount where one applies
+EVENT_TYPES = {
+    'penalty': 1,
+    'refuel': 2,
+    'off_road_enter': 3,
+    'off_road_exit': 4,
+    'delivery': 5,
+    'out_of_fuel': 6,
+    'deadline_missed': 7
+}
+EVENT_NAMES = {code: name for name, code in EVENT_TYPES.items()}
+
+SAMPLE_CAPACITY = 60 * 60 * 10  # Ten minutes of ticks at 60 FPS
+EVENT_CAPACITY = 1024
+
+class RingColumns:
+    """Fixed-capacity set of NumPy columns written one row at a time
+
+    When full, new rows overwrite the oldest ones; ordered() returns the
+    surviving rows oldest first.
+    """
+
+    def __init__(self, capacity, dtypes):
+        self.capacity = capacity
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+        self.count = 0  # Rows written since the last clear, including overwritten ones
+        self.first = 0  # Oldest row that may still be held (raised by rewind)
+
+    def clear(self):
+        """Forget all rows without reallocating"""
+        self.count = 0
+        self.first = 0
+
+    def rewind(self, count):
+        """Drop every row written after the first `count` rows"""
+        self.first = min(count, max(self.first, self.count - self.capacity))  # Slots reused since then are lost
+        self.count = min(count, self.count)
+
+    @property
+    def dropped(self):
+        """Get the number of rows lost to overwriting"""
+        return self.count - self.held
+
+    @property
+    def held(self):
+        """Get the number of rows still held"""
+        return self.count - max(self.first, self.count - self.capacity)
+
+    def append(self, *values):
+        """Write one row, in column order"""
+        index = self.count % self.capacity
+        for column, value in zip(self.columns.values(), values):
+            column[index] = value
+        self.count += 1
+
+    def ordered(self):
+        """Get a copy of the surviving rows, oldest first"""
+        order = np.arange(self.count - self.held, self.count) % self.capacity
+        return {name: column[order] for name, column in self.columns.items()}
+
+class MissionTelemetry:
+    """Records one mission at a time; attach to MissionSimulation as `telemetry`"""
+
+    def __init__(self, sample_capacity=SAMPLE_CAPACITY, event_capacity=EVENT_CAPACITY, sample_every=1):
+        self.sample_every = sample_every
+        self.samples = RingColumns(sample_capacity, {
+            'sample_tick': np.int32,
+            'x': np.float32,
+            'y': np.float32,
+            'speed': np.float32,
+            'fuel': np.float32
+        })
+        self.events = RingColumns(event_capacity, {
+            'event_tick': np.int32,
+            'event_type': np.uint8,
+            'event_value': np.float32
+        })
+        self.meta = {}
+        self.off_road = False
+
+    def start(self, meta):
+        """Begin a new mission, reusing the buffers"""
+        self.samples.clear()
+        self.events.clear()
+        self.meta = dict(meta)
+        self.off_road = False
+
+    def mark(self):
+        """Get a position to rewind() to, for mission checkpoints"""
+        return self.samples.count, self.events.count, self.off_road
+
+    def rewind(self, mark):
+        """Forget everything recorded after mark()"""
+        sample_count, event_count, self.off_road = mark
+        self.samples.rewind(sample_count)
+        self.events.rewind(event_count)
+
+    def event(self, tick, kind, value=0.0):
+        """Record a typed event"""
+        self.events.append(tick, EVENT_TYPES[kind], value)
+
+    def sample(self, tick, truck, fuel):
+        """Record the truck state for one tick"""
+        if tick % self.sample_every == 0:
+            self.samples.append(tick, truck.x, truck.y, truck.speed, fuel)
+
+    def observe_off_road(self, tick, off_road):
+        """Turn the truck's per-tick off-road state into enter and exit events"""
+        if off_road != self.off_road:
+            self.event(tick, 'off_road_enter' if off_road else 'off_road_exit')
+            self.off_road = off_road
+
+    def export(self, result=None):
+        """Get ordered copies of every column, safe to hand to another thread"""
+        columns = self.samples.ordered()
+        columns.update(self.events.ordered())
+        meta = dict(self.meta, version=TELEMETRY_VERSION, events=EVENT_TYPES,
+                    dropped_samples=self.samples.dropped, dropped_events=self.events.dropped)
+        if result is not None:
+            meta['result'] = result
+        return columns, meta
+
+class TelemetryWriter:
+    """Writes exported missions to compressed files on a background thread"""
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.queue = queue.Queue()
+        self.written = []
+        self.submitted = 0
+        self.thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, columns, meta, name=None):
+        """Queue a mission for writing; returns immediately"""
+        self.submitted += 1
+        name = name or f"telemetry_{time.strftime('%Y%m%d_%H%M%S')}_{self.submitted}"
+        self.queue.put((name, columns, meta))
+
+    def flush(self):
+        """Block until everything queued so far is on disk"""
+        self.queue.join()
+
+    def close(self):
+        """Write anything pending and stop the thread"""
+        self.queue.put(None)
+        self.thread.join()
+
+    def _run(self):
+        """Writer thread loop"""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                name, columns, meta = item
+                self.written.append(write_telemetry(os.path.join(self.output_dir, name + '.npz'), columns, meta))
+            except OSError as e:
+                print(f"Telemetry write failed: {e}")
+            finally:
+                self.queue.task_done()
+
+def write_telemetry(path, columns, meta):
+    """Write one mission's columns and meta as a compressed .npz file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.savez_compressed(path, meta=np.array(json.dumps(meta)), **columns)
+    return path
+
+def load_telemetry(path):
+    """Read a telemetry file; returns (columns, meta)"""
+    with np.load(path) as data:
+        columns = {name: data[name] for name in data.files if name != 'meta'}
+        meta = json.loads(str(data['meta']))
+    return columns, meta
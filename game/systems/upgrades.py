@@ -0,0 +1,159 @@
+"""
+Upgrade ROI System
+Estimates how quickly each truck upgrade pays for itself
+"""
+import hashlib
+import json
+import multiprocessing
+import threading
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+import numpy as np
+from data.config import get_config, set_config
+from entities.contract import Contract
+from systems.quotes import QuoteEngine
+
+UPGRADE_TYPES = ['engine', 'fuel_tank', 'frame']
+CARGO_WEIGHTS = {'Standard': 0.5, 'Oversize': 0.3, 'Superload': 0.2}
+
+def representative_contracts(cities):
+    """Build one contract per lane and cargo type, weighted like generate_contracts"""
+    contracts = []
+    weights = []
+    for origin in cities:
+        destinations = [c for c in cities if c['name'] != origin['name']]
+        for destination in destinations:
+            # Typical deadline: generate_contracts' base time plus its average buffer
+            distance = (abs(destination['x'] - origin['x']) + abs(destination['y'] - origin['y'])) / 10
+            deadline = max(5, min(15, max(3, int(distance / 15)) + 4))
+            for cargo_type, cargo_weight in CARGO_WEIGHTS.items():
+                contracts.append(Contract(origin, destination, cargo_type, deadline))
+                weights.append(cargo_weight / (len(cities) * len(destinations)))
+    return contracts, weights
+
+def _expected_mission(upgrade_config, contracts, weights, levels, num_drives, seed):
+    """Get the expected net profit and driving time of one mission at some upgrade levels
+
+    Every level set replays the same random drives (common random numbers), so
+    differences between levels come from the upgrades and not from noise. The
+    drive only depends on the destination, so each one is simulated once and
+    shared by every contract delivering there.
+    """
+    engine = QuoteEngine(upgrade_config, num_drives=num_drives, processes=0)
+    outcomes = {}
+    profit = 0.0
+    seconds = 0.0
+    for contract, weight in zip(contracts, weights):
+        name = contract.destination['name']
+        if name not in outcomes:
+            rng = np.random.default_rng([seed, len(outcomes)])
+            outcomes[name] = engine.simulate(contract, levels, rng)
+        outcome = outcomes[name]
+        profit += weight * engine.summarize(contract, outcome)['expected_profit']
+        seconds += weight * float(outcome['mission_seconds'].mean())
+    return profit, seconds
+
+def _run_expected_mission(config, *args):
+    """Run _expected_mission in a worker process, under the game's current config"""
+    set_config(config)
+    return _expected_mission(*args)
+
+class UpgradeROIEvaluator:
+    """Compares the current truck against each next upgrade level
+
+    Each candidate level set is simulated over a batch of representative
+    contracts in its own process. Results are memoized by (config hash,
+    current levels), and get_roi() does the work on a background thread so the
+    upgrade screen can poll get_roi() every frame without blocking.
+    """
+
+    def __init__(self, upgrade_config, cities, num_drives=64, processes=None, seed=0):
+        self.upgrade_config = upgrade_config
+        self.contracts, self.weights = representative_contracts(cities)
+        self.num_drives = num_drives
+        self.processes = processes
+        self.seed = seed
+        self.config_hash = hashlib.sha1(json.dumps(upgrade_config.to_dict(), sort_keys=True).encode()).hexdigest()
+
+        self._cache = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def get_roi(self, levels):
+        """Get cached ROI for the current levels, or None while it is being computed"""
+        key = (self.config_hash, tuple(levels))
+        with self._lock:
+            roi = self._cache.get(key)
+            if roi is not None or key in self._pending:
+                return roi
+            self._pending.add(key)
+
+        threading.Thread(target=self._compute_in_background, args=(key,), daemon=True).start()
+        return None
+
+    def evaluate(self, levels):
+        """Compute ROI for the current levels on the calling thread"""
+        key = (self.config_hash, tuple(levels))
+        with self._lock:
+            roi = self._cache.get(key)
+        return roi if roi is not None else self._compute(key)
+
+    def _candidates(self, levels):
+        """Get (upgrade type, level set, cost) for every upgrade that is not maxed out"""
+        candidates = []
+        for i, upgrade_type in enumerate(UPGRADE_TYPES):
+            costs = getattr(self.upgrade_config, upgrade_type).costs
+            if levels[i] < len(costs):
+                candidate = list(levels)
+                candidate[i] += 1
+                candidates.append((upgrade_type, tuple(candidate), costs[levels[i]]))
+        return candidates
+
+    def _compute_in_background(self, key):
+        """Thread target for get_roi(): compute, logging any failure"""
+        try:
+            self._compute(key)
+        except Exception as e:
+            print(f"Upgrade ROI failed: {e}")  # The screen asks again on its next frame
+
+    def _compute(self, key):
+        """Simulate the current levels and every candidate, then store the ROI table"""
+        try:
+            levels = key[1]
+            candidates = self._candidates(levels)
+            level_sets = [levels] + [candidate for _, candidate, _ in candidates]
+            results = self._run(level_sets)
+
+            base_profit, _ = results[0]
+            roi = {}
+            for (upgrade_type, _, cost), (profit, seconds) in zip(candidates, results[1:]):
+                delta = profit - base_profit
+                payback_missions = cost / delta if delta > 0 else None
+                roi[upgrade_type] = {
+                    'cost': cost,
+                    'profit_delta': delta,
+                    'payback_missions': payback_missions,
+                    'payback_seconds': payback_missions * seconds if payback_missions is not None else None
+                }
+
+            with self._lock:
+                self._cache[key] = roi
+            return roi
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def _run(self, level_sets):
+        """Evaluate level sets in parallel, falling back to this process if pools are unavailable"""
+        args = [(self.upgrade_config, self.contracts, self.weights, levels, self.num_drives, self.seed)
+                for levels in level_sets]
+        if self.processes != 0:
+            try:
+                # Spawned, not forked: this runs on a background thread next to the game's other threads
+                with ProcessPoolExecutor(max_workers=self.processes,
+                                         mp_context=multiprocessing.get_context('spawn')) as pool:
+                    return list(pool.map(_run_expected_mission, [get_config()] * len(args), *zip(*args)))
+            except (OSError, NotImplementedError):
+                pass  # No multiprocessing on this platform (e.g. some Android builds)
+            except BrokenExecutor as e:
+                print(f"Upgrade ROI worker died ({e}); evaluating in this process")
+        return [_expected_mission(*task) for task in args]
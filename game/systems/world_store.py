@@ -0,0 +1,278 @@
+"""
+World Store
+Optional SQLite history of missions, ledger entries and replays across sessions
+
+The game loop never touches the database. add_*() calls put rows on a
+queue.SimpleQueue, and a writer thread that owns the only write connection
+drains it and commits a batch in one transaction once batch_size rows are
+waiting or flush_seconds have passed. The database runs in WAL mode, so
+readers (the query methods, on their own connection) never block the writer.
+
+Queries page with keyset pagination: pass the last row's id as `before` to
+get the next page, so browsing a long campaign never loads it all into memory.
+Lane and cargo indexes are single-column because SQLite appends the row id to
+every index, which keeps filtered pages in id order without a sort.
+Enable it in the modular game with HH_WORLD_DB=<path>.
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA_VERSION = 1
+BATCH_SIZE = 256
+FLUSH_SECONDS = 0.5  # Longest a queued row waits before it is committed
+PAGE_SIZE = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS missions (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL,
+    time REAL NOT NULL,
+    lane TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    cargo_type TEXT NOT NULL,
+    cargo_description TEXT,
+    deadline_hours INTEGER,
+    payout INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    mission_time REAL NOT NULL,
+    time_bonus INTEGER NOT NULL,
+    penalties INTEGER NOT NULL,
+    cash INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS missions_lane ON missions (lane);
+CREATE INDEX IF NOT EXISTS missions_cargo ON missions (cargo_type);
+CREATE INDEX IF NOT EXISTS missions_time ON missions (time);
+CREATE TABLE IF NOT EXISTS ledger (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL,
+    time REAL NOT NULL,
+    category TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    cargo_type TEXT,
+    lane TEXT,
+    truck INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ledger_lane ON ledger (lane);
+CREATE INDEX IF NOT EXISTS ledger_cargo ON ledger (cargo_type);
+CREATE INDEX IF NOT EXISTS ledger_time ON ledger (time);
+CREATE TABLE IF NOT EXISTS replays (
+    id INTEGER PRIMARY KEY,
+    mission_id INTEGER NOT NULL REFERENCES missions (id),
+    path TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    frames INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS replays_mission ON replays (mission_id);
+"""
+
+INSERT_MISSION = """INSERT INTO missions (session_id, time, lane, origin, destination, cargo_type,
+    cargo_description, deadline_hours, payout, completed, mission_time, time_bonus, penalties, cash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+INSERT_LEDGER = """INSERT INTO ledger (session_id, time, category, amount, cargo_type, lane, truck)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+INSERT_REPLAY = "INSERT INTO replays (mission_id, path, seed, frames) VALUES (?, ?, ?, ?)"
+
+def connect(path, read_only=False):
+    """Open a WAL-mode connection to the world database"""
+    connection = sqlite3.connect(path, timeout=10.0)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")  # WAL commits stay durable enough without an fsync each
+    if read_only:
+        connection.execute("PRAGMA query_only=ON")
+    return connection
+
+class WorldStore:
+    """Queues history rows from the game loop and commits them in batches on a writer thread"""
+
+    def __init__(self, path, batch_size=BATCH_SIZE, flush_seconds=FLUSH_SECONDS):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.queue = queue.SimpleQueue()
+        self.session_id = None
+        self.committed = 0  # Rows written so far this session
+        self.thread = None
+        self._reader = None
+        self._ready = threading.Event()
+
+    def start(self):
+        """Open the database, create the schema and start the writer thread"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.thread = threading.Thread(target=self._run, name="world-store", daemon=True)
+        self.thread.start()
+        self._ready.wait()
+        if self.session_id is None:
+            raise ValueError(f"Could not open world database {self.path}")
+
+    def add_mission(self, contract, result, replay=None, timestamp=None):
+        """Queue a finished mission (contract_to_save() data and mission_result())
+
+        replay is an optional (path, seed, frames) tuple for the mission's recording.
+        """
+        row = (self.session_id, time.time() if timestamp is None else timestamp,
+               f"{contract['origin']['name']} → {contract['destination']['name']}",
+               contract['origin']['name'], contract['destination']['name'], contract['cargo_type'],
+               contract.get('cargo_description'), contract.get('deadline_hours'), contract.get('payout', 0),
+               int(result['completed']), result['mission_time'], result['time_bonus'],
+               sum(result['penalties']), result['cash'])
+        self.queue.put(('mission', row, replay))
+
+    def add_ledger_entries(self, entries):
+        """Queue ledger entries (Ledger.entry() dicts)"""
+        rows = [(self.session_id, entry['timestamp'], entry['category'], entry['amount'],
+                 entry['cargo_type'], entry['lane'], entry['truck']) for entry in entries]
+        if rows:
+            self.queue.put(('ledger', rows, None))
+
+    def flush(self):
+        """Block until everything queued so far is committed"""
+        if self.thread is not None:
+            done = threading.Event()
+            self.queue.put(('flush', done, None))
+            done.wait()
+
+    def close(self):
+        """Commit what is queued and stop the writer thread"""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    # Queries (read connection, separate from the writer)
+
+    def missions(self, lane=None, cargo_type=None, since=None, before=None, limit=PAGE_SIZE):
+        """Get a page of missions, newest first; pass the last row's id as `before` for the next page"""
+        return self._page("SELECT * FROM missions", lane, cargo_type, since, before, limit)
+
+    def ledger(self, lane=None, cargo_type=None, since=None, before=None, limit=PAGE_SIZE):
+        """Get a page of ledger entries, newest first"""
+        return self._page("SELECT * FROM ledger", lane, cargo_type, since, before, limit)
+
+    def replay_for(self, mission_id):
+        """Get the replay recorded for a mission, or None"""
+        return self._query("SELECT * FROM replays WHERE mission_id = ? ORDER BY id DESC LIMIT 1",
+                           (mission_id,)).fetchone()
+
+    def leaderboard(self, lane=None, limit=10):
+        """Get the fastest completed deliveries, optionally on one lane"""
+        sql = "SELECT * FROM missions WHERE completed = 1"
+        params = []
+        if lane is not None:
+            sql += " AND lane = ?"
+            params.append(lane)
+        sql += " ORDER BY mission_time, id LIMIT ?"
+        params.append(limit)
+        return self._query(sql, params).fetchall()
+
+    def lane_summary(self, since=None):
+        """Get ledger entry count, profit and deliveries per lane, most profitable first"""
+        sql = """SELECT lane, COUNT(*) AS entries, SUM(amount) AS profit,
+                 SUM(category = 'payout') AS deliveries FROM ledger WHERE lane IS NOT NULL"""
+        params = []
+        if since is not None:
+            sql += " AND time >= ?"
+            params.append(since)
+        sql += " GROUP BY lane ORDER BY profit DESC"
+        return self._query(sql, params).fetchall()
+
+    def _page(self, select, lane, cargo_type, since, before, limit):
+        """Run a filtered, keyset-paginated query"""
+        clauses = []
+        params = []
+        for clause, value in (("lane = ?", lane), ("cargo_type = ?", cargo_type),
+                              ("time >= ?", since), ("id < ?", before)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        if clauses:
+            select += " WHERE " + " AND ".join(clauses)
+        select += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        return self._query(select, params).fetchall()
+
+    def _query(self, sql, params):
+        """Run a query on the read connection, opening it on first use"""
+        if self._reader is None:
+            self._reader = connect(self.path, read_only=True)
+        return self._reader.execute(sql, params)
+
+    # Writer thread
+
+    def _run(self):
+        """Writer thread: own the write connection and commit queued rows in batches"""
+        connection = None
+        try:
+            connection = connect(self.path)
+            connection.executescript(SCHEMA)
+            with connection:
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                self.session_id = connection.execute("INSERT INTO sessions (started_at) VALUES (?)",
+                                                     (time.time(),)).lastrowid
+        except sqlite3.Error as e:
+            print(f"World store unavailable: {e}")
+            if connection is not None:
+                connection.close()
+            self._ready.set()
+            return
+        self._ready.set()
+
+        try:
+            stopping = False
+            while not stopping:
+                # Collect until the batch is full, flush_seconds pass, or a flush or stop arrives
+                item = self.queue.get()
+                batch = [item]
+                rows = 0
+                deadline = time.perf_counter() + self.flush_seconds
+                while item is not None and item[0] != 'flush':
+                    rows += len(item[1]) if item[0] == 'ledger' else 1
+                    remaining = deadline - time.perf_counter()
+                    if rows >= self.batch_size or remaining <= 0:
+                        break
+                    try:
+                        item = self.queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    batch.append(item)
+                stopping = self._commit(connection, batch)
+        finally:
+            connection.close()
+
+    def _commit(self, connection, batch):
+        """Write one batch in a single transaction; returns True when asked to stop"""
+        stopping = False
+        waiting = []
+        try:
+            with connection:
+                for item in batch:
+                    if item is None:
+                        stopping = True
+                        continue
+                    kind, data, extra = item
+                    if kind == 'mission':
+                        mission_id = connection.execute(INSERT_MISSION, data).lastrowid
+                        if extra is not None:
+                            connection.execute(INSERT_REPLAY, (mission_id,) + tuple(extra))
+                        self.committed += 1
+                    elif kind == 'ledger':
+                        connection.executemany(INSERT_LEDGER, data)
+                        self.committed += len(data)
+                    elif kind == 'flush':
+                        waiting.append(data)
+        except sqlite3.Error as e:
+            print(f"World store write failed: {e}")
+        for done in waiting:
+            done.set()
+        return stopping
@@ -0,0 +1,68 @@
+"""
+Load Chain Planner Tests
+Chains must deliver every contract before its deadline
+"""
+import random
+import types
+import unittest
+from data.distances import get_distance_table
+from systems.contracts import LoadChainPlanner
+
+# 60 miles between neighbours, six hours at 10 mph
+CITIES = [{'name': name, 'x': x, 'y': 0} for name, x in (('A', 0), ('B', 600), ('C', 1200), ('D', 1800))]
+A, B, C, D = CITIES
+SPEED_MPH = 10
+COST_PER_MILE = 1.0
+
+def make_contract(origin, destination, payout, deadline_hours):
+    """Get a contract with only the fields the planner reads"""
+    return types.SimpleNamespace(origin=origin, destination=destination,
+                                 payout=payout, deadline_hours=deadline_hours)
+
+def make_planner():
+    """Get a planner on the test cities with round-number speed and cost"""
+    return LoadChainPlanner(CITIES, max_stops=4, speed_mph=SPEED_MPH, deadhead_cost_per_mile=COST_PER_MILE)
+
+class LoadChainPlannerTest(unittest.TestCase):
+    def test_second_leg_past_deadline_is_dropped(self):
+        first = make_contract(A, B, 500, 100)
+        late = make_contract(B, C, 500, 11)  # 12 hours away from A, by either route
+        chains = make_planner().plan(A, [first, late], top_n=5)
+        self.assertEqual([chain['contracts'] for chain in chains], [[first]])
+
+    def test_second_leg_on_deadline_is_kept(self):
+        first = make_contract(A, B, 500, 100)
+        second = make_contract(B, C, 500, 12)
+        chains = make_planner().plan(A, [first, second], top_n=5)
+        self.assertEqual(chains[0]['contracts'], [first, second])
+        self.assertAlmostEqual(chains[0]['hours'], 12)
+        self.assertAlmostEqual(chains[0]['profit'], 1000)
+
+    def test_unreachable_contract_never_planned(self):
+        reachable = make_contract(A, B, 300, 100)
+        unreachable = make_contract(D, C, 5000, 20)  # 18 hours of deadhead before pickup
+        chains = make_planner().plan(A, [reachable, unreachable], top_n=5)
+        self.assertTrue(chains)
+        for chain in chains:
+            self.assertNotIn(unreachable, chain['contracts'])
+
+    def test_random_markets_meet_every_deadline(self):
+        miles = get_distance_table(CITIES).between
+        for seed in range(20):
+            rng = random.Random(seed)
+            contracts = []
+            for _ in range(8):
+                origin, destination = rng.sample(CITIES, 2)
+                contracts.append(make_contract(origin, destination, rng.randrange(50, 800), rng.randrange(6, 40)))
+            start = rng.choice(CITIES)
+            for chain in make_planner().plan(start, contracts, top_n=5):
+                city, hours = start, 0.0
+                for contract in chain['contracts']:
+                    hours += (miles(city, contract.origin) + miles(contract.origin, contract.destination)) / SPEED_MPH
+                    with self.subTest(seed=seed):
+                        self.assertLessEqual(hours, contract.deadline_hours)
+                    city = contract.destination
+                self.assertAlmostEqual(chain['hours'], hours)
+
+if __name__ == '__main__':
+    unittest.main()
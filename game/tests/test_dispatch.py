@@ -0,0 +1,95 @@
+"""
+Fleet Dispatch Tests
+Assignments checked against brute force on markets small enough to enumerate
+"""
+import itertools
+import random
+import types
+import unittest
+import numpy as np
+from data.distances import DistanceTable
+from systems.dispatch import FleetDispatcher
+
+CITIES = [{'name': f"City {i}", 'x': x, 'y': y}
+          for i, (x, y) in enumerate([(0, 0), (400, 0), (0, 300), (600, 500), (200, 200), (800, 100)])]
+COST_PER_MILE = 2.0
+
+def make_contract(rng):
+    """Get a contract picked up at a random city"""
+    return types.SimpleNamespace(origin=rng.choice(CITIES), payout=rng.randrange(20, 400))
+
+def pair_profit(table, city, contract):
+    """Net profit of one truck hauling one contract, clipped at zero like the dispatcher"""
+    if city is None or contract is None:
+        return 0.0
+    return max(0.0, contract.payout - COST_PER_MILE * table.between(city, contract.origin))
+
+def best_profit(table, truck_cities, contracts):
+    """Best total profit over every way to give each truck at most one contract"""
+    slots = list(range(len(contracts))) + [None] * len(truck_cities)  # None = stay idle
+    best = 0.0
+    for choice in set(itertools.permutations(slots, len(truck_cities))):
+        best = max(best, sum(pair_profit(table, city, contracts[j]) for city, j in zip(truck_cities, choice)
+                             if j is not None))
+    return best
+
+def assignment_profit(table, truck_cities, contracts, assignment):
+    """Recompute an assignment's profit from the distance table"""
+    used = [j for j in assignment if j >= 0]
+    assert len(used) == len(set(used)), "a contract was given to two trucks"
+    return sum(pair_profit(table, truck_cities[i], contracts[j]) for i, j in enumerate(assignment) if j >= 0)
+
+class FleetDispatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.table = DistanceTable(CITIES)
+
+    def check(self, dispatcher, truck_cities, contracts):
+        assignment = dispatcher.solve()
+        expected = best_profit(self.table, truck_cities, contracts)
+        self.assertAlmostEqual(assignment_profit(self.table, truck_cities, contracts, assignment), expected)
+        self.assertAlmostEqual(dispatcher.total_profit(assignment), expected)
+        for i, j in enumerate(assignment):
+            if j >= 0:
+                self.assertGreater(pair_profit(self.table, truck_cities[i], contracts[j]), 0)
+
+    def test_matches_brute_force(self):
+        for seed in range(20):
+            rng = random.Random(seed)
+            truck_cities = [rng.choice(CITIES) for _ in range(rng.randint(1, 4))]
+            contracts = [make_contract(rng) for _ in range(rng.randint(1, 5))]
+            dispatcher = FleetDispatcher(self.table, COST_PER_MILE)
+            dispatcher.set_fleet(truck_cities)
+            dispatcher.set_market(contracts)
+            with self.subTest(seed=seed):
+                self.check(dispatcher, truck_cities, contracts)
+
+    def test_resolve_after_moves_and_market_changes(self):
+        for seed in range(10):
+            rng = random.Random(seed)
+            truck_cities = [rng.choice(CITIES) for _ in range(4)]
+            contracts = [make_contract(rng) for _ in range(5)]
+            dispatcher = FleetDispatcher(self.table, COST_PER_MILE)
+            dispatcher.set_fleet(truck_cities)
+            dispatcher.set_market(contracts)
+            dispatcher.solve()
+            for step in range(4):
+                moves = {rng.randrange(4): rng.choice(CITIES + [None]) for _ in range(2)}
+                dispatcher.move_trucks(moves)
+                for i, city in moves.items():
+                    truck_cities[i] = city
+                if step % 2:
+                    changes = {rng.randrange(5): rng.choice([None, make_contract(rng)])}
+                    dispatcher.update_contracts(changes)
+                    for j, contract in changes.items():
+                        contracts[j] = contract
+                with self.subTest(seed=seed, step=step):
+                    self.check(dispatcher, truck_cities, contracts)
+
+    def test_idle_when_every_pair_loses_money(self):
+        dispatcher = FleetDispatcher(self.table, COST_PER_MILE)
+        dispatcher.set_fleet([CITIES[0]])
+        dispatcher.set_market([types.SimpleNamespace(origin=CITIES[3], payout=10)])
+        np.testing.assert_array_equal(dispatcher.solve(), [-1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Economy Ledger Tests
+Running totals after retries take entries back
+"""
+import random
+import unittest
+from systems.economy import CATEGORIES, INITIAL_CAPACITY, Ledger
+from systems.pricing import CARGO_TYPES
+
+LANES = ('Tampa → Atlanta', 'Dallas → Phoenix', 'Atlanta → Dallas')
+
+def record_random(ledger, rng, count):
+    """Append random entries, income and costs mixed"""
+    for _ in range(count):
+        category = rng.choice(CATEGORIES)
+        amount = rng.randrange(1, 5000) * (1 if category in ('payout', 'time_bonus') else -1)
+        hauled = category in ('payout', 'time_bonus', 'penalty')
+        ledger.record(category, amount, rng.choice(CARGO_TYPES) if hauled else None,
+                      rng.choice(LANES) if hauled else None, rng.randrange(3), timestamp=float(ledger.count))
+
+def rebuilt(ledger):
+    """Get a ledger that only ever saw the entries still in `ledger`"""
+    fresh = Ledger()
+    for i in range(len(ledger)):
+        fresh.record(**ledger.entry(i))
+    return fresh
+
+class LedgerTruncateTest(unittest.TestCase):
+    def test_totals_match_a_ledger_without_the_entries(self):
+        rng = random.Random(4)
+        ledger = Ledger()
+        record_random(ledger, rng, 200)
+        for count in (180, 120, 120, 37, 1, 0):
+            ledger.truncate(count)
+            with self.subTest(count=count):
+                self.assertEqual(len(ledger), count)
+                self.assertEqual(ledger.report(), rebuilt(ledger).report())
+                self.assertEqual(ledger.report(), Ledger.from_columns(ledger.to_columns()).report())
+        self.assertEqual(ledger.total.to_dict(), {'income': 0, 'expenses': 0, 'profit': 0, 'count': 0})
+
+    def test_truncate_then_record_again(self):
+        rng = random.Random(9)
+        ledger = Ledger()
+        record_random(ledger, rng, INITIAL_CAPACITY + 50)  # Past one doubling of the columns
+        for _ in range(20):
+            ledger.truncate(rng.randrange(len(ledger) + 1))
+            record_random(ledger, rng, rng.randrange(40))
+        expected = rebuilt(ledger)
+        self.assertEqual(ledger.report(), expected.report())
+        self.assertEqual(ledger.total.profit, int(ledger.view()['amount'].sum()))
+
+    def test_truncate_past_the_end_keeps_everything(self):
+        ledger = Ledger()
+        ledger.record('payout', 1000, 'Standard', LANES[0])
+        ledger.record('fuel', -50)
+        revision = ledger.revision
+        ledger.truncate(5)
+        self.assertEqual(len(ledger), 2)
+        self.assertEqual(ledger.total.profit, 950)
+        self.assertNotEqual(ledger.revision, revision)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Quote Engine Tests
+Quotes started before clear() never land in the cache
+"""
+import threading
+import types
+import unittest
+from systems.quotes import QuoteEngine
+
+CITY = {'name': 'Tampa', 'x': 100, 'y': 420}
+
+def make_contract(destination):
+    """Get a contract with only the fields the quote key reads"""
+    return types.SimpleNamespace(origin=CITY, destination={'name': destination, 'x': 300, 'y': 200},
+                                 cargo_type='general', deadline_hours=24)
+
+class HeldQuoteEngine(QuoteEngine):
+    """Quote engine whose drives wait for the test to release them"""
+
+    def __init__(self):
+        super().__init__(num_drives=2, processes=0)
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.quotes_run = 0
+
+    def simulate_quote(self, contract, upgrade_levels, seed):
+        """Count the quote once released, instead of driving"""
+        self.started.set()
+        self.release.wait(5)
+        self.quotes_run += 1
+        return {'expected_profit': float(self.quotes_run)}
+
+class QuoteEngineClearTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = HeldQuoteEngine()
+
+    def tearDown(self):
+        self.engine.release.set()
+        self.engine.shutdown()
+
+    def test_clear_discards_running_quote(self):
+        contract = make_contract('Atlanta')
+        self.assertIsNone(self.engine.get_quote(contract))
+        self.assertTrue(self.engine.started.wait(5))
+        future = self.engine._pending[self.engine._quote_key(contract, (1, 1, 1))]
+
+        self.engine.clear()
+        self.assertEqual(self.engine._pending, {})
+        self.engine.release.set()
+        future.result(5)
+        self.assertEqual(self.engine._cache, {})
+
+        # Asking again quotes under the new generation
+        self.assertIsNone(self.engine.get_quote(contract))
+        key = self.engine._quote_key(contract, (1, 1, 1))
+        self.assertEqual(key[0], 1)
+        self.engine._pending[key].result(5)
+        self.assertEqual(self.engine.get_quote(contract), {'expected_profit': 2.0})
+        self.assertEqual(list(self.engine._cache), [key])
+
+    def test_clear_cancels_queued_quotes(self):
+        self.engine.get_quote(make_contract('Atlanta'))
+        self.assertTrue(self.engine.started.wait(5))
+        self.engine.get_quote(make_contract('Dallas'))  # Queued behind the held one
+        queued = self.engine._pending[self.engine._quote_key(make_contract('Dallas'), (1, 1, 1))]
+
+        self.engine.clear()
+        self.assertTrue(queued.cancelled())
+        self.engine.release.set()
+        self.engine.shutdown()
+        self.assertEqual(self.engine._cache, {})
+
+    def test_clear_discards_blocking_quote(self):
+        contract = make_contract('Phoenix')
+        results = []
+        worker = threading.Thread(target=lambda: results.append(self.engine.quote(contract)))
+        worker.start()
+        self.assertTrue(self.engine.started.wait(5))
+
+        self.engine.clear()
+        self.engine.release.set()
+        worker.join(5)
+        self.assertEqual(results, [{'expected_profit': 1.0}])  # The caller still gets its answer
+        self.assertEqual(self.engine._cache, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Replay Tests
+Recorded missions replay to their stored outcome from JSON and binary files
+"""
+import math
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from core.game_state import GameState
+from data.loader import load_cities
+from entities.contract import Contract
+from sim.controls import LEFT, REFUEL, RIGHT, UP, Controls
+from sim import rules
+from systems.replay import InputRecorder, load_replay, run_replay, start_mission
+from systems.replay_file import ReplayFile
+
+def record_mission(destination_name, seed=11):
+    """Drive a mission with a wobbly autopilot and return its recorder
+
+    The destination decides the outcome: Dallas is delivered in a few seconds,
+    Atlanta runs dry after almost two minutes of fuel stops.
+    """
+    cities = load_cities()
+    destination = next(city for city in cities if city['name'] == destination_name)
+    random.seed(3)
+    game_state = GameState()
+    game_state.current_contract = Contract(cities[0], destination, 'Standard', 8)
+    recorder = InputRecorder()
+    recorder.start(seed, game_state)
+
+    mission = start_mission(recorder.to_dict())
+    controls = Controls()
+    rng = random.Random(5)
+    finished = False
+    while not finished:
+        truck = mission.truck
+        dest_x, dest_y = mission.get_destination_position()
+        target = math.degrees(math.atan2(dest_y - truck.y, dest_x - truck.x))
+        diff = (target - truck.angle + 180) % 360 - 180 + rng.uniform(-20, 20)
+        controls.mask = UP | (RIGHT if diff > 5 else LEFT if diff < -5 else 0) | (REFUEL if rng.random() < 0.02 else 0)
+        recorder.record(controls.mask)
+        finished = mission.step(controls)
+    recorder.finish(mission.game_state)
+    return recorder
+
+class ReplayTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.recordings = {name: record_mission(name) for name in ('Dallas', 'Atlanta')}
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_outcomes_differ(self):
+        self.assertTrue(self.recordings['Dallas'].result['completed'])
+        self.assertFalse(self.recordings['Atlanta'].result['completed'])
+
+    def test_replays_from_json_and_binary(self):
+        for name, recorder in self.recordings.items():
+            for extension in ('.json', '.hhr'):
+                path = os.path.join(self.directory, name + extension)
+                recorder.save(path)
+                replay = load_replay(path)
+                with self.subTest(name=name, extension=extension):
+                    self.assertEqual(replay['inputs'], recorder.inputs.tolist())
+                    self.assertEqual(run_replay(replay), recorder.result)
+
+    def test_seek_resumes_to_stored_outcome(self):
+        recorder = self.recordings['Atlanta']
+        path = os.path.join(self.directory, 'Atlanta.hhr')
+        recorder.save(path)
+        with ReplayFile(path) as replay:
+            self.assertGreater(len(replay.keyframe_ticks), 2)
+            self.assertEqual(replay.run(), recorder.result)
+            for seconds in (0, 4.99, 5, 37.3, replay.duration / 2, replay.duration - 1):
+                with self.subTest(seconds=seconds):
+                    mission, _ = replay.seek(seconds)
+                    self.assertEqual(mission.ticks, int(seconds * rules.FPS))
+                    self.assertIsInstance(mission.game_state.cash, int)
+                    self.assertEqual(replay.run(seconds), recorder.result)
+
+    def test_seek_matches_straight_playback(self):
+        recorder = self.recordings['Atlanta']
+        path = os.path.join(self.directory, 'Atlanta.hhr')
+        recorder.save(path)
+        seconds = 61.5
+        played = start_mission(recorder.to_dict())
+        controls = Controls()
+        for mask in recorder.inputs[:int(seconds * rules.FPS)]:
+            controls.mask = mask
+            played.step(controls)
+        with ReplayFile(path) as replay:
+            mission, _ = replay.seek(seconds)
+        for field in ('x', 'y', 'angle', 'speed'):
+            self.assertEqual(getattr(mission.truck, field), getattr(played.truck, field))
+        self.assertEqual(mission.game_state.fuel, played.game_state.fuel)
+        self.assertEqual(mission.game_state.cash, played.game_state.cash)
+
+if __name__ == '__main__':
+    unittest.main()
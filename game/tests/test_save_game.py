@@ -0,0 +1,137 @@
+"""
+Save Game Tests
+Snapshot round-trips and autosave journal recovery
+"""
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from core.game_state import GameState
+from data.loader import load_cities, generate_contracts
+from systems.autosave import (JOURNAL_SUFFIX, SEQUENCE_COLUMN, AutosaveService, encode_record, read_journal,
+                              recover)
+from systems.save_game import NAME_BYTES, SaveFile, capture_company, write_company, write_save
+
+def make_company():
+    """Get a GameState with some history in every saved field"""
+    random.seed(7)
+    game_state = GameState()
+    game_state.cash = 123456
+    game_state.fuel = 42.5
+    game_state.upgrade_levels = (2, 1, 3)
+    game_state.available_contracts = generate_contracts(load_cities(), 3)
+    game_state.completed_contracts = [{'contract': {'origin': 'A'}, 'result': {'payout': 1000}}]
+    game_state.ledger.record('payout', 5000, 'Standard', 'Atlanta → Dallas', timestamp=1.0)
+    game_state.ledger.record('fuel', -50, timestamp=2.0)
+    return game_state
+
+class SaveFileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'company.hhs')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        game_state = make_company()
+        fleet = {'x': np.arange(5, dtype=np.float32), 'truck_id': np.arange(5, dtype='>i4')}
+        write_save(self.path, game_state, fleet)
+
+        restored = GameState()
+        with SaveFile(self.path) as save:
+            save.restore(restored)
+            saved_fleet = {name: values.copy() for name, values in save.fleet().items()}
+        self.assertEqual(restored.cash, game_state.cash)
+        self.assertEqual(restored.fuel, game_state.fuel)
+        self.assertEqual(restored.upgrade_levels, game_state.upgrade_levels)
+        self.assertEqual([(c.route_text, c.payout) for c in restored.available_contracts],
+                         [(c.route_text, c.payout) for c in game_state.available_contracts])
+        self.assertEqual(restored.completed_contracts, game_state.completed_contracts)
+        self.assertEqual([restored.ledger.entry(i) for i in range(len(restored.ledger))],
+                         [game_state.ledger.entry(i) for i in range(len(game_state.ledger))])
+        np.testing.assert_array_equal(saved_fleet['x'], fleet['x'])
+        np.testing.assert_array_equal(saved_fleet['truck_id'], fleet['truck_id'])
+
+    def test_long_section_name_is_rejected(self):
+        company = capture_company(make_company())
+        write_company(self.path, company, columns={'n' * NAME_BYTES: np.zeros(1)})
+        with self.assertRaises(ValueError):
+            write_company(self.path + '.long', company, columns={'n' * (NAME_BYTES + 1): np.zeros(1)})
+        self.assertFalse(os.path.exists(self.path + '.long'))
+
+class JournalRecoveryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'company.hhs')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def journal(self, *records):
+        """Write raw journal records after whatever is there already"""
+        with open(self.path + JOURNAL_SUFFIX, 'ab') as f:
+            for kind, data in records:
+                f.write(encode_record(kind, data))
+
+    def test_torn_record_ends_replay(self):
+        self.journal(('cash', {'amount': 100, 'seq': 1}), ('cash', {'amount': 10, 'seq': 2}))
+        with open(self.path + JOURNAL_SUFFIX, 'ab') as f:
+            f.write(encode_record('cash', {'amount': 1, 'seq': 3})[:-2])  # Crash mid-write
+
+        game_state = GameState()
+        starting_cash = game_state.cash
+        self.assertEqual(recover(game_state, self.path), 2)
+        self.assertEqual(game_state.cash, starting_cash + 110)
+
+    def test_corrupt_record_ends_replay(self):
+        self.journal(('cash', {'amount': 100, 'seq': 1}), ('fuel', {'fuel': 12.5, 'seq': 2}),
+                     ('cash', {'amount': 10, 'seq': 3}))
+        with open(self.path + JOURNAL_SUFFIX, 'r+b') as f:
+            data = bytearray(f.read())
+            data[-len(encode_record('cash', {'amount': 10, 'seq': 3})) - 3] ^= 0xFF  # Inside the fuel record
+            f.seek(0)
+            f.write(data)
+        self.assertEqual([data['seq'] for _, data in read_journal(self.path + JOURNAL_SUFFIX)], [1])
+
+        game_state = GameState()
+        starting_cash, starting_fuel = game_state.cash, game_state.fuel
+        self.assertEqual(recover(game_state, self.path), 1)
+        self.assertEqual((game_state.cash, game_state.fuel), (starting_cash + 100, starting_fuel))
+
+    def test_reopen_after_compaction_skips_applied_records(self):
+        game_state = make_company()
+        service = AutosaveService(self.path, compact_records=3)
+        service.start(game_state)
+        for amount in (100, 200, 300, 400):
+            game_state.cash += amount
+            service.track(game_state)
+        service.close(game_state)
+        self.assertGreaterEqual(service.snapshots, 1)
+        with SaveFile(self.path) as save:
+            self.assertEqual(int(save.column(SEQUENCE_COLUMN)[0]), 4)
+
+        # A crash between the snapshot and the journal truncate leaves applied records behind
+        self.journal(*(('cash', {'amount': 1000, 'seq': seq}) for seq in range(1, 5)),
+                     ('cash', {'amount': 5, 'seq': 5}))
+        reopened = GameState()
+        self.assertEqual(recover(reopened, self.path), 5)
+        self.assertEqual(reopened.cash, game_state.cash + 5)
+
+        # Journaling resumes after the recovered sequence
+        service = AutosaveService(self.path)
+        service.start(reopened, 5)
+        reopened.cash += 7
+        service.track(reopened)
+        service.flush()
+        self.assertEqual([data['seq'] for _, data in read_journal(self.path + JOURNAL_SUFFIX)][-1], 6)
+        service.close()
+
+        again = GameState()
+        self.assertEqual(recover(again, self.path), 6)
+        self.assertEqual(again.cash, game_state.cash + 12)
+
+if __name__ == '__main__':
+    unittest.main()
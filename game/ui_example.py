@@ -1,11 +1,19 @@
 import pygame
 import sys
+from core.fonts import LazyFont
 
-pygame.init()
-screen = pygame.display.set_mode((800, 600))
-clock = pygame.time.Clock()
-FONT = pygame.font.SysFont(None, 32)
-SMALL_FONT = pygame.font.SysFont(None, 24)
+screen = None
+clock = None
+
+def init_display():
+    """Open the game window; called by the entry point rather than on import"""
+    global screen, clock
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    clock = pygame.time.Clock()
+
+FONT = LazyFont(None, 32)
+SMALL_FONT = LazyFont(None, 24)
 
 class Button:
     def __init__(self, x, y, width, height, text, color=(100, 100, 100), text_color=(255, 255, 255)):
@@ -93,6 +101,7 @@ class ContractCard:
 
 def contract_selection_demo():
     """Demo of your contract selection screen"""
+    init_display()
     # Sample contracts
     contracts = [
         ContractCard(50, 100, "Chicago → Detroit", "Steel Beams", 280, 3500, 8),
@@ -2,46 +2,33 @@
 Heavy Haul Tycoon - Upgrade System
 Uses config.yml parameters for truck improvements
 """
+import os
 import pygame
 import sys
-import yaml
+from data.loader import load_cities
+from systems.upgrades import UpgradeROIEvaluator
+from core.fonts import LazyFont
+from core.game_state import GameState
+from core.paths import default_save_dir
+from data.config import get_config
+from systems.autosave import AutosaveService, recover
+from systems.save_game import SAVE_FILENAME
 
-# Load upgrade configuration
-def load_config():
-    try:
-        with open('data/config.yml', 'r') as f:
-            return yaml.safe_load(f)
-    except (FileNotFoundError, ImportError):
-        # Fallback config if YAML not available
-        return {
-            'upgrades': {
-                'engine': {
-                    'levels': [1, 2, 3],
-                    'costs': [5000, 12000, 25000],
-                    'speed_bonuses': [1.0, 1.3, 1.6]
-                },
-                'fuel_tank': {
-                    'levels': [1, 2, 3],
-                    'costs': [3000, 8000, 15000],
-                    'capacities': [100, 200, 300]
-                },
-                'frame': {
-                    'levels': [1, 2, 3],
-                    'costs': [4000, 10000, 20000],
-                    'collision_reduction': [1.0, 0.75, 0.5]
-                }
-            }
-        }
+screen = None
+clock = None
 
-pygame.init()
-screen = pygame.display.set_mode((800, 600))
-pygame.display.set_caption("Heavy Haul Tycoon - Upgrades")
-clock = pygame.time.Clock()
+def init_display():
+    """Open the game window; called by the entry point rather than on import"""
+    global screen, clock
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    pygame.display.set_caption("Heavy Haul Tycoon - Upgrades")
+    clock = pygame.time.Clock()
 
 # Fonts
-FONT = pygame.font.SysFont(None, 24)
-LARGE_FONT = pygame.font.SysFont(None, 32)
-TITLE_FONT = pygame.font.SysFont(None, 48)
+FONT = LazyFont(None, 24)
+LARGE_FONT = LazyFont(None, 32)
+TITLE_FONT = LazyFont(None, 48)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -56,19 +43,28 @@ LIGHT_GRAY = (200, 200, 200)
 
 class TruckUpgrades:
     def __init__(self, config):
-        self.config = config['upgrades']
+        self.config = config.upgrades
         self.engine_level = 1
         self.fuel_tank_level = 1
         self.frame_level = 1
         
+    @property
+    def levels(self):
+        """Get (engine, fuel tank, frame) levels, as stored in GameState and saves"""
+        return (self.engine_level, self.fuel_tank_level, self.frame_level)
+    
+    @levels.setter
+    def levels(self, levels):
+        self.engine_level, self.fuel_tank_level, self.frame_level = levels
+    
     def get_engine_stats(self):
         """Get current engine upgrade stats"""
         level_index = self.engine_level - 1
         return {
             'level': self.engine_level,
-            'speed_multiplier': self.config['engine']['speed_bonuses'][level_index],
-            'next_cost': self.config['engine']['costs'][level_index + 1] if level_index + 1 < len(self.config['engine']['costs']) else None,
-            'max_level': len(self.config['engine']['levels'])
+            'speed_multiplier': self.config.engine.speed_bonuses[level_index],
+            'next_cost': self.config.engine.costs[level_index + 1] if level_index + 1 < len(self.config.engine.costs) else None,
+            'max_level': len(self.config.engine.levels)
         }
     
     def get_fuel_tank_stats(self):
@@ -76,9 +72,9 @@ class TruckUpgrades:
         level_index = self.fuel_tank_level - 1
         return {
             'level': self.fuel_tank_level,
-            'capacity': self.config['fuel_tank']['capacities'][level_index],
-            'next_cost': self.config['fuel_tank']['costs'][level_index + 1] if level_index + 1 < len(self.config['fuel_tank']['costs']) else None,
-            'max_level': len(self.config['fuel_tank']['levels'])
+            'capacity': self.config.fuel_tank.capacities[level_index],
+            'next_cost': self.config.fuel_tank.costs[level_index + 1] if level_index + 1 < len(self.config.fuel_tank.costs) else None,
+            'max_level': len(self.config.fuel_tank.levels)
         }
     
     def get_frame_stats(self):
@@ -86,9 +82,9 @@ class TruckUpgrades:
         level_index = self.frame_level - 1
         return {
             'level': self.frame_level,
-            'damage_reduction': 1.0 - self.config['frame']['collision_reduction'][level_index],
-            'next_cost': self.config['frame']['costs'][level_index + 1] if level_index + 1 < len(self.config['frame']['costs']) else None,
-            'max_level': len(self.config['frame']['levels'])
+            'damage_reduction': 1.0 - self.config.frame.collision_reduction[level_index],
+            'next_cost': self.config.frame.costs[level_index + 1] if level_index + 1 < len(self.config.frame.costs) else None,
+            'max_level': len(self.config.frame.levels)
         }
     
     def can_upgrade_engine(self, cash):
@@ -131,10 +127,11 @@ class TruckUpgrades:
         return 0
 
 class UpgradeCard:
-    def __init__(self, x, y, upgrade_type, truck_upgrades, width=240, height=200):
+    def __init__(self, x, y, upgrade_type, truck_upgrades, width=240, height=200, roi_evaluator=None):
         self.rect = pygame.Rect(x, y, width, height)
         self.upgrade_type = upgrade_type
         self.truck_upgrades = truck_upgrades
+        self.roi_evaluator = roi_evaluator
         self.button_rect = pygame.Rect(x + 10, y + height - 35, width - 20, 25)
         self.hovered = False
         
@@ -210,6 +207,21 @@ class UpgradeCard:
             cost_color = GREEN if cash >= stats['next_cost'] else RED
             cost_surface = FONT.render(cost_text, True, cost_color)
             screen.blit(cost_surface, (x_margin, y_offset))
+            y_offset += 20
+            
+            # Payback estimate
+            if self.roi_evaluator:
+                levels = (self.truck_upgrades.engine_level, self.truck_upgrades.fuel_tank_level,
+                          self.truck_upgrades.frame_level)
+                roi = self.roi_evaluator.get_roi(levels)
+                if roi is None:
+                    roi_text = "Payback: estimating..."
+                elif roi[self.upgrade_type]['payback_missions'] is None:
+                    roi_text = "Payback: never"
+                else:
+                    roi_text = f"Payback: {roi[self.upgrade_type]['payback_missions']:.1f} missions"
+                roi_surface = FONT.render(roi_text, True, LIGHT_GRAY)
+                screen.blit(roi_surface, (x_margin, y_offset))
         
         # Upgrade button
         if stats['next_cost']:
@@ -232,17 +244,33 @@ class UpgradeCard:
             text_rect = max_surface.get_rect(center=self.button_rect.center)
             screen.blit(max_surface, text_rect)
 
+def load_company():
+    """Continue the saved company, journaling changes to it; returns (GameState, AutosaveService)"""
+    game_state = GameState()
+    save_path = os.path.join(default_save_dir(), SAVE_FILENAME)
+    try:
+        sequence = recover(game_state, save_path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Could not load {save_path}: {e}")
+        sequence = 0
+    autosave = AutosaveService(save_path)
+    autosave.start(game_state, sequence)
+    return game_state, autosave
+
 def main_upgrade_screen():
-    """Upgrade shop screen"""
-    config = load_config()
+    """Upgrade shop screen, spending the saved company's cash"""
+    init_display()
+    config = get_config()
+    game_state, autosave = load_company()
     truck_upgrades = TruckUpgrades(config)
-    cash = 50000  # Start with more cash for testing
+    truck_upgrades.levels = game_state.upgrade_levels
+    roi_evaluator = UpgradeROIEvaluator(config.upgrades, load_cities())
     
     # Create upgrade cards
     upgrade_cards = [
-        UpgradeCard(50, 150, "engine", truck_upgrades),
-        UpgradeCard(310, 150, "fuel_tank", truck_upgrades),
-        UpgradeCard(570, 150, "frame", truck_upgrades)
+        UpgradeCard(50, 150, "engine", truck_upgrades, roi_evaluator=roi_evaluator),
+        UpgradeCard(310, 150, "fuel_tank", truck_upgrades, roi_evaluator=roi_evaluator),
+        UpgradeCard(570, 150, "frame", truck_upgrades, roi_evaluator=roi_evaluator)
     ]
     
     running = True
@@ -258,10 +286,10 @@ def main_upgrade_screen():
             
             # Handle upgrade purchases
             for card in upgrade_cards:
-                cost = card.handle_event(event, cash)
+                cost = card.handle_event(event, game_state.cash)
                 if cost > 0:
-                    cash -= cost
-                    print(f"Upgraded {card.upgrade_type} for ${cost:,}! Cash remaining: ${cash:,}")
+                    game_state.buy_upgrade(truck_upgrades.levels, cost)
+                    print(f"Upgraded {card.upgrade_type} for ${cost:,}! Cash remaining: ${game_state.cash:,}")
         
         # Update card hover states
         for card in upgrade_cards:
@@ -276,12 +304,12 @@ def main_upgrade_screen():
         screen.blit(title_text, title_rect)
         
         # Cash display
-        cash_text = LARGE_FONT.render(f"Cash: ${cash:,}", True, GREEN)
+        cash_text = LARGE_FONT.render(f"Cash: ${game_state.cash:,}", True, GREEN)
         screen.blit(cash_text, (50, 100))
         
         # Upgrade cards
         for card in upgrade_cards:
-            card.render(screen, cash)
+            card.render(screen, game_state.cash)
         
         # Instructions
         instruction_text = FONT.render("Click on upgrade cards to improve your truck | ESC to quit", True, WHITE)
@@ -303,8 +331,10 @@ def main_upgrade_screen():
             screen.blit(summary_surface, (50, summary_y + i * 25))
         
         pygame.display.flip()
+        autosave.track(game_state)
         clock.tick(60)
     
+    autosave.close(game_state)
     pygame.quit()
     sys.exit()
 